@@ -23,7 +23,12 @@ The computations can also be parallelized automatically with threads and process
 
 # pylint: disable=wildcard-import;    wildcard imports shall be allowed here, since all submodules have their __all__-variables defined
 
-from ._common import Laziness, Parallelization, executor
+from ._common import BufferedStream, BufferPolicy, ChangeDetection, DiskCache, EvictionPolicy
+from ._common import Laziness, Parallelization, Scheduling, Stream, executor, transaction
+from ._common import get_memory_usage, set_memory_budget
+from ._common import add_profiling_hook, remove_profiling_hook, set_profiling, stats, trace
+from ._common import set_thread_safety
+from ._connectors import compile_plan
 from ._decorators import *
 from ._helper import *
 from ._macro import *
@@ -18,12 +18,27 @@
 which are nevertheless required for the functionalities of the connectors.
 """
 
+from ._adaptive import *
+from ._cache_manager import *
+from ._coroutines import *
 from ._event import *
 from ._flags import *
+from ._flights import *
 from ._input import *
+from ._memoization import *
 from ._multiinput_associate import *
 from ._multiinput_item import *
 from ._multioutput_item import *
+from ._multioutput_options import *
 from ._non_lazy_inputs import *
+from ._profiling import *
+from ._result_cache import *
+from ._scheduling import *
+from ._stream import *
+from ._thread_safety import *
+from ._topology import *
+from ._tracing import *
+from ._transaction import *
 
-from ._executors import *   # this has to be imported last because of circular dependencies
+from ._disk_cache import *  # this and the following module have to be imported last because of circular dependencies
+from ._executors import *
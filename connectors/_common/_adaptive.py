@@ -0,0 +1,179 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the bookkeeping for the automatic choice of the parallelization"""
+
+import weakref
+from ._flags import Parallelization
+
+__all__ = ("AdaptiveParallelization",)
+
+
+class _Measurements:
+    """Collects the measurements for the method of one instance."""
+
+    __slots__ = ("runtime", "overheads", "choice", "calls", "pending", "processes")
+
+    def __init__(self):
+        self.runtime = None         # the smoothed execution time of the method
+        self.overheads = {}         # maps the parallelization flags THREAD and PROCESS to the smoothed overhead of dispatching the method
+        self.choice = Parallelization.SEQUENTIAL
+        self.calls = 0              # the number of calls since the last evaluation
+        self.pending = []           # the parallelization flags, that still have to be measured before the next evaluation
+        self.processes = None       # is False, if the method cannot be executed in a process, for example, because the instance cannot be pickled
+
+
+class AdaptiveParallelization:
+    """Chooses the parallelization for the methods of connectors, whose parallelization
+    is set to :attr:`~connectors.Parallelization.AUTO`.
+
+    During the first calls of a method, it is executed sequentially, and twice
+    in a thread and in a process, as far as the executor supports this, in order
+    to measure its execution time and the overhead of dispatching it to a thread
+    or a process. The process based execution is only measured, if the execution
+    time is long enough for a thread to pay off.
+    After that, the highest level of parallelization is chosen, for which the
+    overhead is small compared to the execution time. The measurements are repeated
+    after a number of calls, so that the choice adapts to changing workloads.
+    The measurements are kept separately for each method of each instance.
+    """
+
+    MINIMUM_PROCESS_OVERHEAD = 1e-3     # the assumed overhead of a process, which is used to skip the measurement for short methods, when threads are not available
+
+    def __init__(self, threads, processes, period=100, ratio=10.0, smoothing=0.3):
+        """
+        :param threads: True, if the executor can execute methods in threads
+        :param processes: True, if the executor can execute methods in processes
+        :param period: the number of calls, after which the measurements are repeated
+        :param ratio: the minimum ratio between the execution time and the overhead,
+                      for which a method is dispatched to a thread or a process
+        :param smoothing: the weight of a new measurement in the exponential
+                          moving averages of the execution time and the overhead
+        """
+        pools = ((Parallelization.THREAD, threads), (Parallelization.PROCESS, processes))
+        self.__candidates = tuple(p for p, available in pools if available)
+        self.__period = period
+        self.__ratio = ratio
+        self.__smoothing = smoothing
+        self.__measurements = weakref.WeakKeyDictionary()  # maps instances to dictionaries, which map methods to _Measurements instances
+
+    def select(self, method, instance):
+        """Returns, how the given method shall be executed.
+
+        :param method: the unbound method
+        :param instance: the instance of which the method shall be executed
+        :returns: :attr:`~connectors.Parallelization.SEQUENTIAL`, :attr:`~connectors.Parallelization.THREAD`
+                  or :attr:`~connectors.Parallelization.PROCESS`
+        """
+        methods = self.__measurements.setdefault(instance, {})
+        measurements = methods.get(method)
+        if measurements is None:
+            measurements = methods[method] = _Measurements()
+            self.__schedule(measurements)
+        if measurements.pending:
+            return measurements.pending[0]
+        measurements.calls += 1
+        if measurements.calls >= self.__period:
+            self.__schedule(measurements)
+        return measurements.choice
+
+    def record(self, method, instance, parallelization, elapsed, runtime):
+        """Records the measurements of an execution of a method.
+
+        :param method: the unbound method
+        :param instance: the instance of which the method has been executed
+        :param parallelization: the flag, that has been returned by :meth:`select`
+        :param elapsed: the time in seconds from passing the method to the executor until receiving its result
+        :param runtime: the execution time of the method in seconds
+        """
+        measurements = self.__measurements[instance][method]
+        measurements.runtime = self.__smooth(measurements.runtime, runtime)
+        scheduled = bool(measurements.pending) and measurements.pending[0] == parallelization
+        if parallelization != Parallelization.SEQUENTIAL:
+            overhead = max(elapsed - runtime, 0.0)
+            if not scheduled:
+                overhead = self.__smooth(measurements.overheads.get(parallelization), overhead)
+            measurements.overheads[parallelization] = overhead  # the scheduled measurements replace the previous overhead, so that outdated values do not linger
+            if parallelization == Parallelization.PROCESS:
+                measurements.processes = True
+        if scheduled:
+            measurements.pending.pop(0)
+            if parallelization != Parallelization.PROCESS and measurements.pending[:1] == [Parallelization.PROCESS]:
+                threshold = measurements.overheads.get(Parallelization.THREAD, self.MINIMUM_PROCESS_OVERHEAD)
+                if measurements.runtime < self.__ratio * threshold:     # if not even a thread pays off, a process does not either
+                    measurements.pending.clear()
+            if not measurements.pending:
+                measurements.choice = self.__evaluate(measurements)
+
+    def reject(self, method, instance):
+        """Records, that the given method cannot be executed in a process.
+
+        :param method: the unbound method
+        :param instance: the instance of which the method shall be executed
+        """
+        measurements = self.__measurements[instance][method]
+        measurements.processes = False
+        measurements.overheads.pop(Parallelization.PROCESS, None)
+        if Parallelization.PROCESS in measurements.pending:
+            measurements.pending.remove(Parallelization.PROCESS)
+            if not measurements.pending:
+                measurements.choice = self.__evaluate(measurements)
+
+    def choice(self, method, instance):
+        """Returns the parallelization, that has been chosen for the given method.
+
+        :param method: the unbound method
+        :param instance: the instance of which the method is executed
+        :returns: a flag of :class:`~connectors.Parallelization` or None, if the
+                  method has not been executed yet
+        """
+        measurements = self.__measurements.get(instance, {}).get(method)
+        return None if measurements is None else measurements.choice
+
+    def __schedule(self, measurements):
+        """Schedules new measurements of all available parallelization methods.
+
+        :param measurements: the :class:`_Measurements` instance of the method
+        """
+        measurements.calls = 0
+        measurements.pending = [Parallelization.SEQUENTIAL]
+        for parallelization in self.__candidates:
+            if parallelization != Parallelization.PROCESS or measurements.processes is not False:
+                measurements.pending += [parallelization] * 2     # the first dispatch may include the start of a thread or a process
+
+    def __evaluate(self, measurements):
+        """Chooses the highest level of parallelization, whose overhead is small
+        compared to the execution time of the method.
+
+        :param measurements: the :class:`_Measurements` instance of the method
+        :returns: a flag of :class:`~connectors.Parallelization`
+        """
+        for parallelization in (Parallelization.PROCESS, Parallelization.THREAD):
+            overhead = measurements.overheads.get(parallelization)
+            if overhead is not None and measurements.runtime >= self.__ratio * overhead:
+                return parallelization
+        return Parallelization.SEQUENTIAL
+
+    def __smooth(self, average, value):
+        """Updates an exponential moving average.
+
+        :param average: the previous average or None
+        :param value: the new value
+        :returns: the new average
+        """
+        if average is None:
+            return value
+        return average + self.__smoothing * (value - average)
@@ -0,0 +1,309 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the process-wide manager for the memory consumption of cached results"""
+
+import heapq
+import itertools
+import threading
+import weakref
+from ._thread_safety import thread_safety
+
+__all__ = ("CacheManager", "cache_manager", "set_memory_budget", "get_memory_usage")
+
+
+class _Entry:
+    """Stores the information about a cached result."""
+
+    def __init__(self, owner, key, size, cost, priority):
+        """
+        :param owner: a weak reference to the connector, that has cached the result
+        :param key: the key, under which the connector has cached the result
+        :param size: the estimated size of the result in bytes
+        :param cost: the duration of the computation of the result in seconds
+        :param priority: the priority of the result. Results with a lower priority are evicted first
+        """
+        self.owner = owner
+        self.key = key
+        self.size = size
+        self.cost = cost
+        self.priority = priority
+        self.removed = False
+
+
+class CacheManager:
+    """Keeps track of the memory consumption of the results, which are cached by
+    the output connectors, and evicts results, when the memory consumption exceeds
+    a budget.
+
+    The results are evicted with the *GreedyDual-Size* algorithm, which takes into
+    account how expensive the re-computation of a result is compared to its size,
+    and how recently it has been used. Every result has a priority, which is set
+    to ``L + cost / size``, when the result is added to the cache or retrieved
+    from it. ``L`` is the priority of the most recently evicted result, so that
+    results, which have not been used for a long time, are eventually evicted,
+    even if they are expensive to compute.
+
+    The memory consumption is only tracked, while a budget is set, so that the
+    connectors do not pay for the book keeping, when no budget is needed. Results,
+    that have been cached before the budget has been set, are neither counted
+    nor evicted.
+
+    The connectors, that register their results at this manager, must implement
+    an ``_evict`` method, which takes the key of the result, that shall be evicted.
+    Output connectors use None as key, while multi-output connectors use the keys
+    of their results.
+
+    In the thread-safe mode, results are not evicted from the connectors, whose
+    processing network is computing a result in another thread. They are evicted
+    later instead, when the budget is enforced the next time.
+    """
+
+    def __init__(self):
+        self.__budget = None
+        self.__bytes = 0
+        self.__entries = 0                              # the number of cached results
+        self.__owners = weakref.WeakKeyDictionary()     # connector -> {key: _Entry}
+        self.__heap = []                                # a priority queue of tuples (priority, count, entry)
+        self.__count = itertools.count()                # a tie-breaker for the priority queue
+        self.__inflation = 0.0                          # the priority of the most recently evicted result
+        self.__lock = threading.RLock()                 # the connectors of multiple processing networks can cache results concurrently in the thread-safe mode
+        self.__orphans = []                             # the entries of garbage collected connectors, which could not be removed immediately
+
+    def set_budget(self, max_bytes):
+        """Specifies the maximum memory consumption of all cached results.
+        If the current memory consumption exceeds the new budget, results are
+        evicted immediately.
+
+        :param max_bytes: the budget in bytes or None for no limit
+        """
+        with self.__lock:
+            self.__budget = max_bytes
+            if max_bytes is None:
+                self.__clear()
+            else:
+                self.__enforce_budget()
+
+    def get_budget(self):
+        """Returns the maximum memory consumption of all cached results.
+
+        :returns: the budget in bytes or None, if there is no limit
+        """
+        return self.__budget
+
+    def has_budget(self):
+        """Returns, if a budget is set, so that the connectors have to register
+        their cached results at this manager.
+
+        :returns: True, if a budget is set, False otherwise
+        """
+        return self.__budget is not None
+
+    def get_usage(self):
+        """Returns the estimated memory consumption of all cached results.
+
+        :returns: the memory consumption in bytes
+        """
+        return self.__bytes
+
+    def add(self, owner, key, size, cost):
+        """Registers a result, that has been added to the cache of a connector.
+        This can cause the eviction of other results or even the given one, if
+        the budget is exceeded.
+
+        :param owner: the connector, that has cached the result
+        :param key: the key, under which the connector has cached the result
+        :param size: the estimated size of the result in bytes
+        :param cost: the duration of the computation of the result in seconds
+        """
+        if self.__budget is None:
+            return
+        with self.__lock:
+            entries = self.__entries_of(owner)
+            if entries is None:
+                entries = {}
+                self.__owners[owner] = entries
+                weakref.finalize(owner, self.__forget, entries)
+            self.__remove(entries, key)
+            entry = _Entry(owner=weakref.ref(owner), key=key, size=size, cost=cost, priority=None)
+            self.__prioritize(entry)
+            entries[key] = entry
+            self.__bytes += size
+            self.__entries += 1
+            heapq.heappush(self.__heap, (entry.priority, next(self.__count), entry))
+            self.__enforce_budget()
+
+    def touch(self, owner, key):
+        """Is called, when a cached result is retrieved from the cache of a connector.
+
+        :param owner: the connector, that has cached the result
+        :param key: the key, under which the connector has cached the result
+        """
+        if self.__budget is None:
+            return
+        with self.__lock:
+            entries = self.__entries_of(owner)
+            if entries is not None:
+                entry = entries.get(key)
+                if entry is not None:
+                    self.__prioritize(entry)
+
+    def remove(self, owner, key):
+        """Is called, when a connector has removed a result from its cache.
+
+        :param owner: the connector, that has cached the result
+        :param key: the key, under which the connector has cached the result
+        """
+        with self.__lock:
+            entries = self.__entries_of(owner)
+            if entries is not None:
+                self.__remove(entries, key)
+
+    def remove_all(self, owner):
+        """Is called, when a connector has cleared its cache.
+
+        :param owner: the connector, that has cached the results
+        """
+        with self.__lock:
+            entries = self.__entries_of(owner)
+            if entries:
+                for key in tuple(entries):
+                    self.__remove(entries, key)
+
+    def __entries_of(self, owner):
+        """Returns the entries of the given connector.
+
+        :param owner: the connector or None, if the weak reference to the connector has expired
+        :returns: a dictionary {key: _Entry} or None, if the connector has not cached any results
+        """
+        if owner is None:
+            return None
+        return self.__owners.get(owner)
+
+    def __prioritize(self, entry):
+        """Updates the priority of an entry, when it has been added or used.
+        The entry is not moved in the priority queue, but its position is corrected,
+        when it is popped from the queue.
+
+        :param entry: the :class:`_Entry` instance
+        """
+        entry.priority = self.__inflation + entry.cost / max(entry.size, 1)
+
+    def __remove(self, entries, key):
+        """Removes an entry from the book keeping.
+        The entry remains in the priority queue, but it is skipped, when it is popped.
+
+        :param entries: the dictionary with the entries of the connector
+        :param key: the key of the entry
+        """
+        entry = entries.pop(key, None)
+        if entry is not None:
+            entry.removed = True
+            self.__bytes -= entry.size
+            self.__entries -= 1
+
+    def __clear(self):
+        """Discards the book keeping of all cached results, when the budget has been removed."""
+        for entries in self.__owners.values():
+            for entry in entries.values():
+                entry.removed = True
+            entries.clear()
+        self.__owners = weakref.WeakKeyDictionary()
+        self.__heap = []
+        self.__orphans = []
+        self.__bytes = 0
+        self.__entries = 0
+        self.__inflation = 0.0
+
+    def __forget(self, entries):
+        """Is called, when a connector, that has cached results, is garbage collected.
+
+        :param entries: the dictionary with the entries of the connector
+        """
+        if not self.__lock.acquire(blocking=False):     # pylint: disable=consider-using-with # the garbage collection can happen, while another thread holds the lock and waits for the current one
+            self.__orphans.append(entries)
+            return
+        try:
+            for key in tuple(entries):
+                self.__remove(entries, key)
+        finally:
+            self.__lock.release()
+
+    def __enforce_budget(self):
+        """Evicts results, until the memory consumption complies with the budget."""
+        while self.__orphans:
+            entries = self.__orphans.pop()
+            for key in tuple(entries):
+                self.__remove(entries, key)
+        if len(self.__heap) > 2 * self.__entries + 1024:    # prevent the queue from growing indefinitely with removed entries
+            self.__heap = [item for item in self.__heap if not item[2].removed]
+            heapq.heapify(self.__heap)
+        if self.__budget is None:
+            return
+        busy = []                           # the entries, whose owners are computing a result in another thread
+        while self.__bytes > self.__budget and self.__heap:
+            item = heapq.heappop(self.__heap)
+            priority, _, entry = item
+            if entry.removed:
+                continue
+            if entry.priority > priority:   # the entry has been used, since it has been added to the queue
+                heapq.heappush(self.__heap, (entry.priority, next(self.__count), entry))
+                continue
+            owner = entry.owner()           # the owner is alive, because otherwise the entry would have been removed
+            instance = owner._get_instance() if thread_safety.enabled else None    # pylint: disable=protected-access # the connectors and the cache manager are tightly coupled
+            if instance is not None and not thread_safety.acquire(instance, blocking=False):
+                busy.append(item)
+                continue
+            try:
+                self.__inflation = priority
+                self.__remove(self.__owners[owner], entry.key)
+                owner._evict(entry.key)     # pylint: disable=protected-access # the _evict method is meant to be called by the cache manager, but not from outside this package
+            finally:
+                if instance is not None:
+                    thread_safety.release(instance)
+        for item in busy:
+            heapq.heappush(self.__heap, item)
+
+
+cache_manager = CacheManager()   # the process-wide instance of the cache manager
+
+
+def set_memory_budget(max_bytes):
+    """Specifies the maximum memory consumption of the results, that are cached
+    by all output connectors and multi-output connectors of this process.
+    When the budget is exceeded, the cached results are evicted, starting with
+    those, that are cheap to re-compute with respect to their size, and those,
+    that have not been used for a long time. Evicted results are re-computed
+    transparently, when they are requested again.
+
+    The memory consumption of a result is estimated by its ``nbytes`` attribute
+    (e.g. for NumPy arrays) or by :func:`sys.getsizeof`. It is only tracked,
+    while a budget is set, so the results, that have been cached before setting
+    the budget, are not taken into account.
+
+    :param max_bytes: the budget in bytes or None for no limit
+    """
+    cache_manager.set_budget(max_bytes)
+
+
+def get_memory_usage():
+    """Returns the estimated memory consumption of the results, that are cached
+    by all output connectors and multi-output connectors of this process.
+    This is always zero, if no memory budget is set.
+
+    :returns: the memory consumption in bytes
+    """
+    return cache_manager.get_usage()
@@ -0,0 +1,35 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains a helper function for the support of coroutine methods"""
+
+import inspect
+
+__all__ = ("is_coroutine_method",)
+
+
+def is_coroutine_method(method):
+    """Returns, if the given method has been defined with ``async def``, so that
+    calling it returns a coroutine, which has to be awaited in an event loop.
+    Callable objects, whose ``__call__`` method is a coroutine function, are
+    recognized as well.
+    The connectors call this function once, when they are created, rather than
+    for every execution of their method.
+
+    :param method: the unbound method or a callable object
+    :returns: True, if the method is a coroutine function, False otherwise
+    """
+    return inspect.iscoroutinefunction(method) or inspect.iscoroutinefunction(getattr(type(method), "__call__", None))
@@ -0,0 +1,274 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the :class:`~connectors.DiskCache` class, that stores the results of
+output connectors in a directory, so that they survive the end of the process.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import types
+from connectors.connectors import Connector
+from ._memoization import NO_VALUE
+
+__all__ = ("DiskCache",)
+
+
+def _is_numpy_array(value):
+    """Checks, if the given value is a NumPy array, without importing NumPy.
+
+    :param value: the value
+    :returns: True, if the value is an instance of :class:`numpy.ndarray`, False otherwise
+    """
+    type_ = type(value)
+    return type_.__name__ == "ndarray" and type_.__module__ == "numpy"
+
+
+def _pickled(value):
+    """Pickles the given value with the highest protocol.
+
+    :param value: the value
+    :returns: a bytes object
+    """
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _canonical(value):
+    """Replaces the sets in the given value with sorted sequences, so that its
+    pickled representation does not depend on the iteration order of the sets,
+    which varies between processes, because of the randomized hashes of strings.
+    Sets are searched in lists, tuples and dictionaries, but not in other objects.
+
+    :param value: the value
+    :returns: a value, whose pickled representation is stable across processes
+    """
+    type_ = type(value)
+    if type_ in (set, frozenset):
+        return type_.__name__, sorted((_canonical(v) for v in value), key=_pickled)
+    if type_ in (list, tuple):
+        return type_.__name__, [_canonical(v) for v in value]
+    if type_ is dict:
+        return type_.__name__, [(_canonical(k), _canonical(v)) for k, v in value.items()]
+    return value
+
+
+def _code(code):
+    """Serializes the compiled code of a function including the code of the functions,
+    that are defined inside it, so that the keys of the results change, when the
+    function is edited.
+
+    :param code: the code object of the function
+    :returns: a bytes object
+    """
+    parts = [code.co_code, repr(code.co_names).encode()]
+    for constant in code.co_consts:
+        if isinstance(constant, types.CodeType):    # a nested function or comprehension
+            parts.append(_code(constant))
+        else:
+            parts.append(repr(constant).encode())
+    return b"\0".join(parts)
+
+
+class DiskCache:
+    """Stores the results of output connectors in files in a local directory, so
+    that expensive computations are not repeated, when a processing chain is
+    set up again in a new process.
+
+    An instance of this class can be passed as the ``disk_cache`` parameter of
+    the :class:`~connectors.Output` decorator or to the output connector's
+    :meth:`~connectors.connectors.OutputConnector.set_disk_cache` method. Multiple
+    output connectors can share the same instance.
+
+    The results are addressed by a hash of the class and the name of the getter
+    method, and of the state of the instance (its ``__dict__`` without the connectors).
+    NumPy arrays are hashed by their content, while all other attributes are hashed
+    by their pickled representation. If an attribute cannot be pickled, the result
+    is not stored on the disk. Sets, that are attributes or that are contained
+    in lists, tuples or dictionaries, are sorted, so that their pickled representation
+    does not depend on the randomized hashes of strings. The pickled representation
+    of other objects, which contain sets, may differ between processes, so that
+    their results are computed again in a new process. Since the state of the instance is hashed, this
+    cache also works for getters, whose parameters are not set through observed
+    input connectors, but the getter must not depend on anything else than the
+    instance's state, such as global variables or the content of files.
+
+    The compiled code of the getter is hashed as well, so that editing the getter
+    invalidates its stored results. Changes of the functions, that are called by
+    the getter, are not detected, though. For such cases, a ``version`` can be
+    passed to the constructor, which is mixed into all keys, so that changing it
+    invalidates all results of this cache.
+
+    NumPy arrays are stored as ``.npy`` files, which are memory-mapped, when they
+    are loaded. Writing to such an array does not change the file. All other results
+    are pickled.
+
+    When the files in the directory exceed the given size, the least recently
+    used files are deleted.
+
+    Loading a pickled result can execute arbitrary code, that has been placed
+    in the file. So the directory must not be writable by untrusted users.
+    """
+
+    def __init__(self, directory, max_bytes=None, version=None):
+        """
+        :param directory: the path of the directory, in which the results shall
+                          be stored. It is created, if it does not exist
+        :param max_bytes: the maximum size of all files in the directory in bytes
+                          or None for no limit
+        :param version: a string, that is mixed into the keys of the results, or
+                        None. Changing it invalidates the results, that have been
+                        stored with another version
+        """
+        self.__directory = os.fspath(directory)
+        self.__max_bytes = max_bytes
+        self.__version = version
+        os.makedirs(self.__directory, exist_ok=True)
+
+    def key(self, method, instance):
+        """Computes the key, under which the result of the given method is stored.
+
+        :param method: the unbound getter method
+        :param instance: the instance of which the method is executed
+        :returns: a string or None, if the state of the instance cannot be hashed
+        """
+        digest = hashlib.blake2b(digest_size=32)
+        class_ = type(instance)
+        digest.update(f"{class_.__module__}.{class_.__qualname__}.{method.__name__}".encode())
+        if self.__version is not None:
+            digest.update(f"version:{self.__version}".encode())
+        code = getattr(method, "__code__", None)
+        if code is not None:
+            digest.update(_code(code))
+        for name, value in sorted(instance.__dict__.items()):
+            if isinstance(value, Connector):
+                continue
+            digest.update(name.encode())
+            if _is_numpy_array(value) and not value.dtype.hasobject:
+                digest.update(f"{value.dtype.str}{value.shape}".encode())
+                digest.update(value.tobytes() if not value.flags.c_contiguous else value.reshape(-1).view("u1"))
+            else:
+                try:
+                    digest.update(_pickled(_canonical(value)))
+                except Exception:   # pylint: disable=broad-except # pickling can fail with all sorts of exceptions
+                    return None
+        return digest.hexdigest()
+
+    def load(self, key):
+        """Loads a stored result.
+        Pickled results are unpickled, which can execute arbitrary code, so the
+        directory of this cache must not be writable by untrusted users.
+
+        :param key: the key, that has been returned by :meth:`key`
+        :returns: the result or :data:`~connectors._common._memoization.NO_VALUE`,
+                  if no result has been stored under the given key
+        """
+        path = os.path.join(self.__directory, key)
+        try:
+            if os.path.exists(path + ".npy"):
+                import numpy    # pylint: disable=import-outside-toplevel # NumPy is an optional dependency
+                result = numpy.load(path + ".npy", mmap_mode="c", allow_pickle=False)
+                os.utime(path + ".npy")     # the modification time is used for evicting the least recently used files
+                return result
+            with open(path + ".pickle", "rb") as f:
+                result = pickle.load(f)
+            os.utime(path + ".pickle")
+            return result
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):  # the file does not exist, or it has been deleted or corrupted in the meantime
+            return NO_VALUE
+
+    def store(self, key, result):
+        """Stores a result and deletes the least recently used files, if the
+        maximum size is exceeded.
+        The file is written to a temporary file first, which is renamed afterwards,
+        so that other processes, which use the same directory, never load incomplete
+        files.
+
+        :param key: the key, that has been returned by :meth:`key`
+        :param result: the result, that shall be stored
+        """
+        if _is_numpy_array(result) and not result.dtype.hasobject:
+            import numpy    # pylint: disable=import-outside-toplevel # NumPy is an optional dependency
+            suffix = ".npy"
+
+            def write(f):
+                numpy.save(f, result, allow_pickle=False)
+        else:
+            suffix = ".pickle"
+
+            def write(f):
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.__directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as f:
+                write(f)
+            os.replace(temporary_path, os.path.join(self.__directory, key + suffix))
+        except Exception:   # pylint: disable=broad-except # a result, that cannot be stored, is simply not cached on the disk
+            os.remove(temporary_path)
+            return
+        self.__evict()
+
+    def clear(self):
+        """Deletes all stored results."""
+        for entry in os.scandir(self.__directory):
+            if entry.name.endswith((".npy", ".pickle")):
+                self.__remove(entry.path)
+
+    def get_size(self):
+        """Returns the size of all stored results.
+
+        :returns: the size in bytes
+        """
+        return sum(size for _, size, _ in self.__files())
+
+    def __files(self):
+        """Lists the files of the stored results.
+
+        :returns: a list of tuples (modification time, size, path)
+        """
+        files = []
+        for entry in os.scandir(self.__directory):
+            if entry.name.endswith((".npy", ".pickle")):
+                try:
+                    stat = entry.stat()
+                except OSError:     # the file has been deleted by another process
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        return files
+
+    def __evict(self):
+        """Deletes the least recently used files, until the size limit is met."""
+        if self.__max_bytes is None:
+            return
+        files = self.__files()
+        size = sum(s for _, s, _ in files)
+        for _, s, path in sorted(files):
+            if size <= self.__max_bytes:
+                break
+            self.__remove(path)
+            size -= s
+
+    @staticmethod
+    def __remove(path):
+        """Deletes a file, unless another process has already deleted it.
+
+        :param path: the path of the file
+        """
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -25,14 +25,26 @@ instances is exported.
 
 import asyncio
 import concurrent.futures
+import concurrent.futures.process
+import functools
 import os
-from connectors.connectors import Connector
-from connectors._common import Parallelization
+import pickle
+import threading
+import time
+from connectors._common import Parallelization, Scheduling
+from connectors._common._adaptive import AdaptiveParallelization
+from connectors._common._profiling import profiler, timed_call
+from connectors._common._scheduling import CriticalPathScheduler, PriorityGate
+from connectors._common._shared_memory import _start_resource_tracker
+from connectors._common._transfer import _MethodError, _Transfer
+from connectors._common._workers import _ActorPool, _run_in_process, _run_in_thread
 
 __all__ = ("executor",)
 
+_claims_lock = threading.Lock()     # protects the claims of the executors in the thread-safe mode
 
-def executor(threads=None, processes=0):
+
+def executor(threads=None, processes=0, actors=False, shared_memory=False, scheduling=Scheduling.FIFO):
     """A factory function for creating :class:`~connectors._common._executors.Executor`
     objects. Executors define how the computations of a processing chain are
     parallelized by executing them in separate threads or processes. This function
@@ -44,97 +56,251 @@ def executor(threads=None, processes=0):
     :param processes: an integer number of processes or ``None`` to determine the
                       number automatically (in this case, the number of CPU cores
                       will be taken). 0 disables the process based parallelization.
+    :param actors: True, if the instances, whose methods are executed in separate
+                   processes, shall be kept resident in long-lived worker processes.
+                   See the :class:`~connectors._common._executors.MultiprocessingExecutor`
+                   for details. This parameter has no effect, if the process based
+                   parallelization is disabled.
+    :param shared_memory: True, if large NumPy arrays, ``bytes`` and ``memoryview``
+                          objects shall be passed to and from the worker processes
+                          through shared memory instead of pickling them. See the
+                          :class:`~connectors._common._executors.MultiprocessingExecutor`
+                          for details. This parameter has no effect, if the process
+                          based parallelization is disabled.
+    :param scheduling: a flag of :class:`connectors.Scheduling`, that specifies
+                       the order, in which the methods, that are ready for execution,
+                       are passed to the thread or process pools, when all their
+                       workers are busy. This parameter has no effect, if the
+                       computations are executed sequentially.
     """
     if threads == 0:
         if processes == 0:
             return SequentialExecutor()
         else:
-            return MultiprocessingExecutor(number_of_processes=processes)
+            return MultiprocessingExecutor(number_of_processes=processes,
+                                           actors=actors,
+                                           shared_memory=shared_memory,
+                                           scheduling=scheduling)
     else:
         if processes == 0:
-            return ThreadingExecutor(number_of_threads=threads)
+            return ThreadingExecutor(number_of_threads=threads, scheduling=scheduling)
         else:
-            return ThreadingMultiprocessingExecutor(number_of_threads=threads, number_of_processes=processes)
-
-
-def _redeployed_method(method_name, reduced_instance, *args, **kwargs):
-    """A helper function, that is passed to the separate processes for executing
-    the given method.
-    This function is necessary, because objects with connectors cannot be pickled,
-    so that their methods cannot be passed to a process directly. Instead only the
-    relevant data is serialized and passed to the process, where this function
-    unwraps this data and executes the method.
-    :param method_name: the string name of the method that shall be executed
-    :param reduced_instance: a tuple with the class, in which the method is defined
-                             and the ``__dict__`` of the instance of which the
-                             method shall be executed
-    :param `*args,**kwargs`: arguments for the method
-    """
-    class_, state = reduced_instance
-    instance = class_.__new__(class_)
-    instance.__dict__.update(state)
-    method = getattr(instance, method_name)
-    return method(*args, **kwargs)
+            return ThreadingMultiprocessingExecutor(number_of_threads=threads,
+                                                    number_of_processes=processes,
+                                                    actors=actors,
+                                                    shared_memory=shared_memory,
+                                                    scheduling=scheduling)
 
 
 class Executor:
     """a base class for managing the event loop and the execution in threads or processes."""
 
-    def __init__(self):
-        self._loop = None   # will be initialized in run_coroutine or run_until_complete
+    def __init__(self, scheduling=Scheduling.FIFO):
+        """
+        :param scheduling: a flag of :class:`connectors.Scheduling`, that specifies
+                           the order, in which the methods are passed to the pools
+        """
+        self._loop = None           # will be initialized in run_coroutine or run_until_complete
+        self.__persistent = False   # is True between the calls of the start and shutdown methods
+        self.__owns_loop = False    # is False, if the event loop has been created by an asyncio application
+        self.__async_calls = 0      # the number of computations, that are awaited with run_async
+        self.__persistent_loop = None   # the event loop of a persistent session, while run_async uses the running loop
+        self.__adaptive = None      # an AdaptiveParallelization instance, which is created, when a method with the AUTO parallelization is executed for the first time
+        self.__scheduler = CriticalPathScheduler() if scheduling == Scheduling.CRITICAL_PATH else None
+        self._scheduling = scheduling
+        self.__claimant = None      # the identifier of the thread, that computes a result with this executor in the thread-safe mode
+        self.__claims = 0           # counts, how often that thread has claimed this executor
+
+    def __enter__(self):
+        """Starts a persistent session of this executor, when it is used as a context
+        manager in a ``with`` statement. See the :meth:`start` method for details.
+
+        :returns: this executor
+        """
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Ends the persistent session of this executor at the end of a ``with``
+        statement. See the :meth:`shutdown` method for details.
+        """
+        self.shutdown()
 
-    async def run_method(self, parallelization, method, instance, *args, **kwargs):
+    async def run_method(self, parallelization, method, coroutine, instance, *args, **kwargs):
         """Abstract method, whose overrides shall execute the given method.
-        The parallelization shall be implemented in this method.
+        The parallelization shall be implemented in this method. Methods, that
+        have been defined with ``async def``, shall be awaited in the event loop
+        rather than being passed to a thread or a process.
 
         :param parallelization: a flag of :class:`connectors.Parallelization`, that
                                 specifies how the given method can be parallelized
         :param method: the unbound method, that shall be executed
+        :param coroutine: True, if the method has been defined with ``async def``
+                          (see :func:`~connectors._common._coroutines.is_coroutine_method`)
         :param instance: the instance of which the method shall be executed
         :param `*args,**kwargs`: arguments for the method
         :returns: the return value of the method
         """
         raise NotImplementedError("this method should have been overridden in a derived class")
 
+    def get_parallelization(self, connector):
+        """Returns, how this executor executes the method of the given connector,
+        if its parallelization is set to :attr:`~connectors.Parallelization.AUTO`.
+
+        :param connector: the connector
+        :returns: a flag of :class:`~connectors.Parallelization` or None, if the
+                  connector has not been executed with the automatic parallelization
+                  by this executor yet
+        """
+        if self.__adaptive is None:
+            return None
+        connector = connector._get_connector()
+        return self.__adaptive.choice(connector._method, connector._get_instance())     # pylint: disable=protected-access # the executors and the connectors are tightly coupled
+
+    def call_method(self, method, coroutine, instance, *args, **kwargs):
+        """Executes the given method in the current thread, while no event loop
+        is running in it. Methods, that have been defined with ``async def``, are
+        awaited in the event loop of this executor.
+
+        :param method: the unbound method, that shall be executed
+        :param coroutine: True, if the method has been defined with ``async def``
+                          (see :func:`~connectors._common._coroutines.is_coroutine_method`)
+        :param instance: the instance of which the method shall be executed
+        :param `*args,**kwargs`: arguments for the method
+        :returns: the return value of the method
+        """
+        if coroutine:
+            return self.run_coroutine(profiler.run_async(method, instance, *args, **kwargs))
+        return profiler.run(method, instance, *args, **kwargs)
+
+    def runs_sequentially(self, parallelization):  # pylint: disable=unused-argument # the parameter is used by the overriding methods
+        """Returns, if a method with the given parallelization setting would be
+        executed sequentially in the event loop's thread by this executor. In
+        this case, the method can also be called directly, which avoids the overhead
+        of creating a coroutine for :meth:`run_method`.
+
+        :param parallelization: a flag of :class:`connectors.Parallelization`
+        :returns: True, if the execution is sequential, False otherwise
+        """
+        return False
+
+    def start(self):
+        """Starts a persistent session of this executor.
+        Normally, the event loop and the thread or process pools are created for
+        every computation and destroyed afterwards. This overhead can dominate
+        the computation time, when results are retrieved frequently. During a
+        persistent session, the event loop and the pools are kept alive and reused
+        for all computations, until the :meth:`shutdown` method is called.
+
+        Executors can also be used as context managers, which call :meth:`start`
+        and :meth:`shutdown` automatically::
+
+           with connectors.executor(threads=4) as executor:
+               output.set_executor(executor)
+               ...
+
+        A persistent session must only be used from one thread at a time. In
+        the thread-safe mode (see :func:`connectors.set_thread_safety`), the
+        requests of other threads use temporary copies of the executor instead.
+
+        :returns: this executor
+        """
+        if not self.__persistent:
+            self._set_up()
+            self.__persistent = True
+        return self
+
+    def shutdown(self):
+        """Ends a persistent session, that has been started with :meth:`start`,
+        by closing the event loop and shutting down the thread or process pools.
+        Calling this method, while no persistent session is active, has no effect.
+        """
+        if self.__persistent:
+            self.__persistent = False
+            self._tear_down()
+
     def run_coroutine(self, coro):
         """Takes a coroutine and runs it in a newly created event loop.
+        During a persistent session (see :meth:`start`), the event loop of the
+        session is used instead.
 
         :param coro: the coroutine
         :returns: the return value of the coroutine
         """
-        self._set_up()
+        temporary = self.__set_up_temporarily()
         try:
             task = self._loop.create_task(coro)
             return self._loop.run_until_complete(task)
         finally:
-            self._tear_down()
+            if temporary:
+                self._tear_down()
 
     def run_coroutines(self, coros):
         """Takes multiple coroutines and runs them in a newly created event loop.
+        During a persistent session (see :meth:`start`), the event loop of the
+        session is used instead.
 
         :param coros: a sequence of coroutines
         """
-        self._set_up()
+        temporary = self.__set_up_temporarily()
         try:
             tasks = [self._loop.create_task(coro) for coro in coros]
             future = asyncio.wait(tasks)
             self._loop.run_until_complete(future)
         finally:
-            self._tear_down()
+            if temporary:
+                self._tear_down()
 
     def run_until_complete(self, future):
         """Takes a future or a task and runs it in a newly created event loop.
         This is a wrapper for the event loop's :meth:`~asyncio.loop.run_until_complete`
-        method.
+        method. During a persistent session (see :meth:`start`), the event loop
+        of the session is used instead.
 
         :param future: the future or the task
         :returns: the return value of the execution
         """
-        self._set_up()
+        temporary = self.__set_up_temporarily()
         try:
             return self._loop.run_until_complete(future)
         finally:
-            self._tear_down()
+            if temporary:
+                self._tear_down()
+
+    async def run_async(self, awaitable):
+        """Awaits a coroutine or a future in the event loop, that is running in
+        the current thread, rather than in an event loop, that is created by
+        this executor. This is used by the ``async_call`` methods of the connectors,
+        so that the computations do not block an asyncio application.
+
+        The thread or process pools are created for the computation and shut
+        down afterwards, unless a persistent session is active (see :meth:`start`).
+        Multiple computations can be awaited concurrently in the same event loop.
+
+        :param awaitable: the coroutine or the future
+        :returns: the return value of the coroutine
+        """
+        loop = asyncio.get_running_loop()
+        if self.__async_calls == 0:
+            if self.__scheduler is not None:
+                self.__scheduler.reset()
+            if self.__persistent:
+                self.__persistent_loop = self._loop
+                self._loop = loop
+            else:
+                self._set_up(loop)
+        elif self._loop is not loop:
+            raise RuntimeError("The executor is already in use by another event loop.")
+        self.__async_calls += 1
+        try:
+            return await awaitable
+        finally:
+            self.__async_calls -= 1
+            if self.__async_calls == 0:
+                if self.__persistent:
+                    self._loop = self.__persistent_loop
+                    self.__persistent_loop = None
+                else:
+                    self._tear_down(wait=False)     # waiting for the workers to terminate would block the running event loop
 
     def get_event_loop(self):
         """Returns the currently active event loop. This can be None, if no
@@ -144,168 +310,426 @@ class Executor:
         """
         return self._loop
 
-    def _set_up(self):
+    def __set_up_temporarily(self):
+        """Sets up the event loop and the pools for a single computation, unless
+        a persistent session is active. Also makes the scheduler take the execution
+        times of the previous computations into account.
+
+        :returns: True, if :meth:`_tear_down` has to be called after the computation,
+                  False otherwise
+        """
+        if self.__scheduler is not None:
+            self.__scheduler.reset()
+        if self.__persistent:
+            return False
+        self._set_up()
+        return True
+
+    def _claim(self):
+        """Is called in the thread-safe mode, before a result is computed with
+        this executor. Since the event loop and the pools of an executor cannot
+        be shared between threads, a copy of this executor is returned, if it
+        is already used by another thread.
+
+        :returns: this executor, if it can be used by the current thread, or a copy of it
+        """
+        me = threading.get_ident()
+        with _claims_lock:
+            if self.__claimant in (None, me):
+                self.__claimant = me
+                self.__claims += 1
+                return self
+        return self._clone()
+
+    def _release(self):
+        """Is called in the thread-safe mode, after a result has been computed with
+        this executor, which has been returned by :meth:`_claim`.
+        """
+        with _claims_lock:
+            self.__claims -= 1
+            if self.__claims == 0:
+                self.__claimant = None
+
+    def _clone(self):
+        """Creates a new executor with the same settings as this one, but without
+        its persistent session and the measurements for the scheduling. This method
+        has to be overridden by the executors, whose constructors take further
+        parameters.
+
+        :returns: an :class:`~connectors._common._executors.Executor` instance
+        """
+        return type(self)(scheduling=self._scheduling)
+
+    def _gate(self, capacity):
+        """Creates the priority queue for a thread or process pool, if the critical
+        path aware scheduling is enabled.
+
+        :param capacity: the number of workers of the pool
+        :returns: a :class:`~connectors._common._scheduling.PriorityGate` or None
+        """
+        if self.__scheduler is None:
+            return None
+        return PriorityGate(capacity)
+
+    async def _schedule(self, gate, method, instance, awaitable):
+        """Awaits the given awaitable, which passes a method to a thread or process
+        pool, after the waiting methods with a higher priority have been passed
+        to the pool.
+
+        :param gate: the :class:`~connectors._common._scheduling.PriorityGate` of
+                     the pool or None, if the methods are passed to the pool in
+                     FIFO order
+        :param method: the unbound method, that is executed by the awaitable
+        :param instance: the instance of which the method is executed
+        :param awaitable: the awaitable
+        :returns: the return value of the method
+        """
+        if gate is None:
+            return await awaitable
+        return await gate.run(self.__scheduler.priority(method, instance),
+                              self.__scheduler.measure(method, instance, awaitable))
+
+    def _pools(self):
+        """Returns the pools, in which this executor can execute methods. This
+        is used for the automatic parallelization and has to be overridden by the
+        executors, that parallelize computations.
+
+        :returns: a tuple (thread pool or None, process pool or None, True if the
+                  shared memory transport is used for the processes)
+        """
+        return None, None, False
+
+    async def _run_adaptively(self, method, instance, *args, **kwargs):
+        """Executes a method, whose connector's parallelization is set to
+        :attr:`~connectors.Parallelization.AUTO`, and measures its execution time
+        and the overhead of the parallelization.
+
+        :param method: the unbound method, that shall be executed
+        :param instance: the instance of which the method shall be executed
+        :param `*args,**kwargs`: arguments for the method
+        :returns: the return value of the method
+        """
+        thread_pool, process_pool, shared_memory = self._pools()
+        if self.__adaptive is None:
+            self.__adaptive = AdaptiveParallelization(threads=thread_pool is not None,
+                                                      processes=process_pool is not None)
+        parallelization = self.__adaptive.select(method, instance)
+        submitted = time.perf_counter()
+        if parallelization == Parallelization.SEQUENTIAL:
+            result, timing = timed_call(method, instance, *args, **kwargs)
+            if profiler.active():
+                profiler.report(method, instance, submitted, timing)
+        elif parallelization == Parallelization.THREAD:
+            call = functools.partial(timed_call, method, instance, *args, **kwargs)
+            result, timing = await self._loop.run_in_executor(thread_pool, call)
+            if profiler.active():
+                profiler.report(method, instance, submitted, timing)
+        else:
+            transfer = _Transfer(shared_memory, timed=True, guarded=True)
+            try:
+                result = await _run_in_process(self._loop, process_pool, transfer, method, instance, *args, **kwargs)
+            except _MethodError as e:
+                raise e.exception from e.__cause__  # the cause is the traceback from the worker process
+            except (pickle.PicklingError, AttributeError, TypeError, concurrent.futures.process.BrokenProcessPool):
+                # the data could not be passed to or from the worker process, so the method is executed in the current process instead
+                self.__adaptive.reject(method, instance)
+                return await self._run_adaptively(method, instance, *args, **kwargs)
+            timing = transfer.timing
+        self.__adaptive.record(method, instance, parallelization, time.perf_counter() - submitted, timing[1])
+        return result
+
+    def _set_up(self, loop=None):
         """Is called by the run_until_complete and run_coroutine methods before
-        executing the passed object.
+        executing the passed object, or by the :meth:`start` method at the beginning
+        of a persistent session.
 
         This implementation creates the event loop. This method can be overwritten
         in order to instantiate other objects such as thread pools, which are
         required during the execution of the passed object. In this case, make
         sure to call the overridden base class's method to create the event loop
         aswell.
+
+        :param loop: an event loop, that is already running and that shall be
+                     used instead of creating a new one, or None
         """
-        self._loop = asyncio.new_event_loop()
+        self.__owns_loop = loop is None
+        self._loop = asyncio.new_event_loop() if loop is None else loop
 
-    def _tear_down(self):
+    def _tear_down(self, wait=True):   # pylint: disable=unused-argument # the parameter is used by the overriding methods
         """Is called by the run_until_complete and run_coroutine methods after
-        executing the passed object.
+        executing the passed object, or by the :meth:`shutdown` method at the end
+        of a persistent session.
 
         This implementation closes the event loop. This method can be overwritten
         in order to tear down other objects such as thread pools, which were
         required during the execution of the passed object. In this case, make
         sure to call the overridden base class's method to close the event loop
         aswell.
+
+        :param wait: True, if this method shall block until the workers of the
+                     pools have terminated, False, if the pools shall be cleaned up
+                     in the background. The latter is used by :meth:`run_async`,
+                     which must not block the running event loop.
         """
-        self._loop.close()
+        if self.__owns_loop:
+            self._loop.close()
         self._loop = None
 
 
 class SequentialExecutor(Executor):
     """An executor class, that executes everything sequentially."""
 
-    async def run_method(self, parallelization, method, instance, *args, **kwargs):
+    async def run_method(self, parallelization, method, coroutine, instance, *args, **kwargs):
         """Executes the given method sequentially.
 
         :param parallelization: a flag of :class:`connectors.Parallelization`, that
                                 specifies how the given method can be parallelized
         :param method: the unbound method, that shall be executed
+        :param coroutine: True, if the method has been defined with ``async def``
+                          (see :func:`~connectors._common._coroutines.is_coroutine_method`)
         :param instance: the instance of which the method shall be executed
         :param `*args,**kwargs`: arguments for the method
         :returns: the return value of the method
         """
-        return method(instance, *args, **kwargs)
+        if coroutine:
+            return await profiler.run_async(method, instance, *args, **kwargs)
+        return profiler.run(method, instance, *args, **kwargs)
+
+    def runs_sequentially(self, parallelization):  # pylint: disable=unused-argument # the signature has to be compatible with the base class
+        """Returns True, because this executor executes everything sequentially.
+
+        :param parallelization: a flag of :class:`connectors.Parallelization`
+        :returns: True
+        """
+        return True
 
 
 class ThreadingExecutor(Executor):
     """An executor class, that can parallelize computations with threads."""
 
-    def __init__(self, number_of_threads):
+    def __init__(self, number_of_threads, scheduling=Scheduling.FIFO):
         """
         :param number_of_threads: the maximum number of threads, that shall be
                                   created, or None to determine this number
                                   automatically.
+        :param scheduling: a flag of :class:`connectors.Scheduling`, that specifies
+                           the order, in which the methods are passed to the thread pool
         """
-        Executor.__init__(self)
+        Executor.__init__(self, scheduling)
         self.__number_of_threads = number_of_threads
         self.__executor = None  # will be initialized in run_coroutine or run_until_complete
+        self.__gate = None      # will be initialized in run_coroutine or run_until_complete, if the critical path aware scheduling is enabled
 
-    async def run_method(self, parallelization, method, instance, *args, **kwargs):
+    async def run_method(self, parallelization, method, coroutine, instance, *args, **kwargs):
         """Executes the given method in a thread if possible and falls back to
         sequential execution if not.
 
         :param parallelization: a flag of :class:`connectors.Parallelization`, that
                                 specifies how the given method can be parallelized
         :param method: the unbound method, that shall be executed
+        :param coroutine: True, if the method has been defined with ``async def``
+                          (see :func:`~connectors._common._coroutines.is_coroutine_method`)
         :param instance: the instance of which the method shall be executed
         :param `*args,**kwargs`: arguments for the method
         :returns: the return value of the method
         """
+        if coroutine:
+            return await profiler.run_async(method, instance, *args, **kwargs)
         if parallelization == Parallelization.SEQUENTIAL:
-            return method(instance, *args, **kwargs)
+            return profiler.run(method, instance, *args, **kwargs)
+        elif parallelization == Parallelization.AUTO:
+            return await self._run_adaptively(method, instance, *args, **kwargs)
         else:
-            return await self._loop.run_in_executor(self.__executor, method, instance, *args, **kwargs)
+            return await self._schedule(self.__gate, method, instance,
+                                        _run_in_thread(self._loop, self.__executor, method, instance, *args, **kwargs))
 
-    def _set_up(self):
+    def runs_sequentially(self, parallelization):
+        """Returns, if the given parallelization setting forbids the execution in a thread.
+
+        :param parallelization: a flag of :class:`connectors.Parallelization`
+        :returns: True, if the method is executed sequentially, False otherwise
+        """
+        return parallelization == Parallelization.SEQUENTIAL
+
+    def _set_up(self, loop=None):
         """Is called by the run_until_complete and run_coroutine methods before
         executing the passed object.
 
         This implementation instantiates the ThreadPoolExecutor and calls the
         overridden method to create the event loop.
         """
-        super()._set_up()
+        super()._set_up(loop)
         if self.__number_of_threads is None:            # the default number of workers for the ThreadPoolExecutor is 5x the CPU count, which is meant for I/O bound tasks.
             self.__number_of_threads = os.cpu_count()   # This class is meant for CPU work, so the number of threads should be lower to reduce context switching overhead.
         self.__executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.__number_of_threads)
+        self.__gate = self._gate(self.__number_of_threads)
+
+    def _clone(self):
+        """Creates a new executor with the same settings as this one.
 
-    def _tear_down(self):
+        :returns: a :class:`~connectors._common._executors.ThreadingExecutor` instance
+        """
+        return ThreadingExecutor(number_of_threads=self.__number_of_threads, scheduling=self._scheduling)
+
+    def _pools(self):
+        """Returns the thread pool of this executor.
+
+        :returns: a tuple (thread pool, None, False)
+        """
+        return self.__executor, None, False
+
+    def _tear_down(self, wait=True):
         """Is called by the run_until_complete and run_coroutine methods after
         executing the passed object.
 
         This implementation shuts down the ThreadPoolExecutor and calls the
         overridden method to close the event loop.
+
+        :param wait: True, if this method shall block until the workers have terminated
         """
-        self.__executor.shutdown()
-        super()._tear_down()
+        self.__executor.shutdown(wait=wait)
+        super()._tear_down(wait)
 
 
 class MultiprocessingExecutor(Executor):
-    """An executor class, that can parallelize computations with processes."""
+    """An executor class, that can parallelize computations with processes.
+
+    Normally, the whole state of an instance is pickled and passed to a worker
+    process, whenever one of its methods is executed in a separate process. In
+    the *actor* mode, every instance is pinned to a long-lived worker process, in
+    which a copy of the instance is kept resident. In this case, only the attributes,
+    that have been replaced since the previous call, are passed to the worker process.
+    This mode is meant to be used with a persistent session of the executor (see
+    :meth:`~connectors._common._executors.Executor.start`), because the resident
+    instances are discarded, when the worker processes are shut down.
+    Changes of an attribute are detected by its identity, so attributes, that
+    are modified in place, are not updated in the resident instance.
+
+    With the *shared memory* transport, large NumPy arrays, ``bytes`` and ``memoryview``
+    objects, which are passed to or returned from a worker process, are copied
+    to shared memory segments instead of being pickled. Only the attributes of
+    the instance, the positional arguments and the return value are considered,
+    but not the values inside containers such as lists or dictionaries.
+    The NumPy arrays, that are returned from a worker process, are not copied
+    again, but they use the shared memory segment as their buffer. The segment
+    is destroyed, when the array is garbage collected, which is usually, when
+    the cached result of the output connector is replaced.
+    """
 
-    def __init__(self, number_of_processes):
+    def __init__(self, number_of_processes, actors=False, shared_memory=False, scheduling=Scheduling.FIFO):
         """
         :param number_of_processes: the maximum number of processes, that shall be
                                     created, or None to determine this number
                                     automatically (in this case, the number of CPU
                                     cores will be taken).
+        :param actors: True, if the instances shall be kept resident in long-lived
+                       worker processes, False otherwise
+        :param shared_memory: True, if large buffers shall be passed through
+                              shared memory, False, if they shall be pickled
+        :param scheduling: a flag of :class:`connectors.Scheduling`, that specifies
+                           the order, in which the methods are passed to the process
+                           pool. In the actor mode, the methods are always passed
+                           in FIFO order, because every instance is pinned to one
+                           worker process.
         """
-        Executor.__init__(self)
+        Executor.__init__(self, scheduling)
         self.__number_of_processes = number_of_processes
+        self.__actors = actors
+        self.__shared_memory = shared_memory
         self.__executor = None  # will be initialized in run_coroutine or run_until_complete
+        self.__gate = None      # will be initialized in run_coroutine or run_until_complete, if the critical path aware scheduling is enabled
 
-    async def run_method(self, parallelization, method, instance, *args, **kwargs):
+    async def run_method(self, parallelization, method, coroutine, instance, *args, **kwargs):
         """Executes the given method in a process if possible and falls back to
         sequential execution if not.
 
         :param parallelization: a flag of :class:`connectors.Parallelization`, that
                                 specifies how the given method can be parallelized
         :param method: the unbound method, that shall be executed
+        :param coroutine: True, if the method has been defined with ``async def``
+                          (see :func:`~connectors._common._coroutines.is_coroutine_method`)
         :param instance: the instance of which the method shall be executed
         :param `*args,**kwargs`: arguments for the method
         :returns: the return value of the method
         """
+        if coroutine:
+            return await profiler.run_async(method, instance, *args, **kwargs)
         if parallelization == Parallelization.PROCESS:
-            class_ = instance.__class__
-            state = instance.__dict__.copy()
-            to_remove = []
-            for a in state:
-                if isinstance(state[a], Connector):
-                    to_remove.append(a)
-            for a in to_remove:
-                del state[a]
-            reduced_instance = (class_, state)
-            return await self._loop.run_in_executor(self.__executor,
-                                                    _redeployed_method,
-                                                    method.__name__,
-                                                    reduced_instance,
-                                                    *args, **kwargs)
+            return await self._schedule(self.__gate, method, instance,
+                                        _run_in_process(self._loop, self.__executor,
+                                                        _Transfer(self.__shared_memory, profiler.active()),
+                                                        method, instance, *args, **kwargs))
+        elif parallelization == Parallelization.AUTO:
+            return await self._run_adaptively(method, instance, *args, **kwargs)
         else:
-            return method(instance, *args, **kwargs)
+            return profiler.run(method, instance, *args, **kwargs)
 
-    def _set_up(self):
+    def runs_sequentially(self, parallelization):
+        """Returns, if the given parallelization setting forbids the execution in a process.
+
+        :param parallelization: a flag of :class:`connectors.Parallelization`
+        :returns: True, if the method is executed sequentially, False otherwise
+        """
+        return parallelization not in (Parallelization.PROCESS, Parallelization.AUTO)
+
+    def _set_up(self, loop=None):
         """Is called by the run_until_complete and run_coroutine methods before
         executing the passed object.
 
-        This implementation instantiates the ProcessPoolExecutor and calls the
-        overridden method to create the event loop.
+        This implementation instantiates the ProcessPoolExecutor (or the worker
+        processes for the actor mode) and calls the overridden method to create
+        the event loop.
         """
-        super()._set_up()
-        self.__executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.__number_of_processes)
+        super()._set_up(loop)
+        if self.__shared_memory:
+            _start_resource_tracker()
+        if self.__actors:
+            self.__executor = _ActorPool(number_of_processes=self.__number_of_processes)
+        else:
+            self.__executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.__number_of_processes)
+            self.__gate = self._gate(self.__number_of_processes or os.cpu_count())
+
+    def _clone(self):
+        """Creates a new executor with the same settings as this one. In the actor
+        mode, the copy starts its own worker processes, in which it keeps its own
+        copies of the instances.
 
-    def _tear_down(self):
+        :returns: a :class:`~connectors._common._executors.MultiprocessingExecutor` instance
+        """
+        return MultiprocessingExecutor(number_of_processes=self.__number_of_processes,
+                                       actors=self.__actors,
+                                       shared_memory=self.__shared_memory,
+                                       scheduling=self._scheduling)
+
+    def _pools(self):
+        """Returns the process pool of this executor.
+
+        :returns: a tuple (None, process pool, True if the shared memory transport is used)
+        """
+        return None, self.__executor, self.__shared_memory
+
+    def _tear_down(self, wait=True):
         """Is called by the run_until_complete and run_coroutine methods after
         executing the passed object.
 
         This implementation shuts down the ProcessPoolExecutor and calls the
         overridden method to close the event loop.
+
+        :param wait: True, if this method shall block until the workers have terminated
         """
-        self.__executor.shutdown()
-        super()._tear_down()
+        self.__executor.shutdown(wait=wait)
+        super()._tear_down(wait)
 
 
 class ThreadingMultiprocessingExecutor(Executor):
-    """An executor class, that can parallelize computations with both threads and processes."""
+    """An executor class, that can parallelize computations with both threads and processes.
+    See the :class:`~connectors._common._executors.MultiprocessingExecutor` for
+    the *actor* mode and the *shared memory* transport of the process based
+    parallelization.
+    """
 
-    def __init__(self, number_of_threads, number_of_processes):
+    def __init__(self, number_of_threads, number_of_processes,
+                 actors=False, shared_memory=False, scheduling=Scheduling.FIFO):
         """
         :param number_of_threads: the maximum number of threads, that shall be
                                   created, or None to determine this number
@@ -314,66 +738,113 @@ class ThreadingMultiprocessingExecutor(Executor):
                                     created, or None to determine this number
                                     automatically (in this case, the number of CPU
                                     cores will be taken).
+        :param actors: True, if the instances shall be kept resident in long-lived
+                       worker processes, False otherwise
+        :param shared_memory: True, if large buffers shall be passed through
+                              shared memory, False, if they shall be pickled
+        :param scheduling: a flag of :class:`connectors.Scheduling`, that specifies
+                           the order, in which the methods are passed to the thread
+                           and process pools. In the actor mode, the methods are
+                           always passed to the processes in FIFO order.
         """
-        Executor.__init__(self)
+        Executor.__init__(self, scheduling)
         self.__number_of_threads = number_of_threads
         self.__number_of_processes = number_of_processes
+        self.__actors = actors
+        self.__shared_memory = shared_memory
         self.__thread_executor = None   # will be initialized in run_coroutine or run_until_complete
         self.__process_executor = None  # will be initialized in run_coroutine or run_until_complete
+        self.__thread_gate = None       # will be initialized in run_coroutine or run_until_complete, if the critical path aware scheduling is enabled
+        self.__process_gate = None      # will be initialized in run_coroutine or run_until_complete, if the critical path aware scheduling is enabled
 
-    async def run_method(self, parallelization, method, instance, *args, **kwargs):
+    async def run_method(self, parallelization, method, coroutine, instance, *args, **kwargs):
         """Executes the given method in a process if possible and falls back to
         threaded and then sequential execution if not.
 
         :param parallelization: a flag of :class:`connectors.Parallelization`, that
                                 specifies how the given method can be parallelized
         :param method: the unbound method, that shall be executed
+        :param coroutine: True, if the method has been defined with ``async def``
+                          (see :func:`~connectors._common._coroutines.is_coroutine_method`)
         :param instance: the instance of which the method shall be executed
         :param `*args,**kwargs`: arguments for the method
         :returns: the return value of the method
         """
+        if coroutine:
+            return await profiler.run_async(method, instance, *args, **kwargs)
         if parallelization == Parallelization.SEQUENTIAL:
-            return method(instance, *args, **kwargs)
+            return profiler.run(method, instance, *args, **kwargs)
         elif parallelization == Parallelization.THREAD:
-            return await self._loop.run_in_executor(self.__thread_executor, method, instance, *args, **kwargs)
+            return await self._schedule(self.__thread_gate, method, instance,
+                                        _run_in_thread(self._loop, self.__thread_executor,
+                                                       method, instance, *args, **kwargs))
+        elif parallelization == Parallelization.AUTO:
+            return await self._run_adaptively(method, instance, *args, **kwargs)
         else:
-            class_ = instance.__class__
-            state = instance.__dict__.copy()
-            to_remove = []
-            for a in state:
-                if isinstance(state[a], Connector):
-                    to_remove.append(a)
-            for a in to_remove:
-                del state[a]
-            reduced_instance = (class_, state)
-            return await self._loop.run_in_executor(self.__process_executor,
-                                                    _redeployed_method,
-                                                    method.__name__,
-                                                    reduced_instance,
-                                                    *args, **kwargs)
-
-    def _set_up(self):
+            return await self._schedule(self.__process_gate, method, instance,
+                                        _run_in_process(self._loop, self.__process_executor,
+                                                        _Transfer(self.__shared_memory, profiler.active()),
+                                                        method, instance, *args, **kwargs))
+
+    def runs_sequentially(self, parallelization):
+        """Returns, if the given parallelization setting forbids the execution in a thread.
+
+        :param parallelization: a flag of :class:`connectors.Parallelization`
+        :returns: True, if the method is executed sequentially, False otherwise
+        """
+        return parallelization == Parallelization.SEQUENTIAL
+
+    def _set_up(self, loop=None):
         """Is called by the run_until_complete and run_coroutine methods before
         executing the passed object.
 
         This implementation instantiates the ThreadPoolExecutor and the
-        ProcessPoolExecutor and calls the overridden method to create the event
-        loop.
+        ProcessPoolExecutor (or the worker processes for the actor mode) and calls
+        the overridden method to create the event loop.
         """
-        super()._set_up()
+        super()._set_up(loop)
         if self.__number_of_threads is None:            # the default number of workers for the ThreadPoolExecutor is 5x the CPU count, which is meant for I/O bound tasks.
             self.__number_of_threads = os.cpu_count()   # This class is meant for CPU work, so the number of threads should be lower to reduce context switching overhead.
         self.__thread_executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.__number_of_threads)
-        self.__process_executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.__number_of_processes)
+        self.__thread_gate = self._gate(self.__number_of_threads)
+        if self.__shared_memory:
+            _start_resource_tracker()
+        if self.__actors:
+            self.__process_executor = _ActorPool(number_of_processes=self.__number_of_processes)
+        else:
+            self.__process_executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.__number_of_processes)
+            self.__process_gate = self._gate(self.__number_of_processes or os.cpu_count())
+
+    def _clone(self):
+        """Creates a new executor with the same settings as this one. In the actor
+        mode, the copy starts its own worker processes, in which it keeps its own
+        copies of the instances.
 
-    def _tear_down(self):
+        :returns: a :class:`~connectors._common._executors.ThreadingMultiprocessingExecutor` instance
+        """
+        return ThreadingMultiprocessingExecutor(number_of_threads=self.__number_of_threads,
+                                                number_of_processes=self.__number_of_processes,
+                                                actors=self.__actors,
+                                                shared_memory=self.__shared_memory,
+                                                scheduling=self._scheduling)
+
+    def _pools(self):
+        """Returns the thread pool and the process pool of this executor.
+
+        :returns: a tuple (thread pool, process pool, True if the shared memory transport is used)
+        """
+        return self.__thread_executor, self.__process_executor, self.__shared_memory
+
+    def _tear_down(self, wait=True):
         """Is called by the run_until_complete and run_coroutine methods after
         executing the passed object.
 
         This implementation shuts down the ThreadPoolExecutor and the
         ProcessPoolExecutorand calls the overridden method to close the event
         loop.
+
+        :param wait: True, if this method shall block until the workers have terminated
         """
-        self.__thread_executor.shutdown()
-        self.__process_executor.shutdown()
-        super()._tear_down()
+        self.__thread_executor.shutdown(wait=wait)
+        self.__process_executor.shutdown(wait=wait)
+        super()._tear_down(wait)
@@ -20,7 +20,7 @@ connectors can be configured.
 
 import enum
 
-__all__ = ("Laziness", "Parallelization")
+__all__ = ("BufferPolicy", "ChangeDetection", "EvictionPolicy", "Laziness", "Parallelization", "Scheduling")
 
 
 @enum.unique
@@ -74,10 +74,16 @@ class Parallelization(enum.Enum):
     * PROCESS
         the method should be executed in a separate process, threaded execution
         or sequential execution can be used as a fallback.
+    * AUTO
+        the method can be executed in a separate process, but the executor measures
+        its execution time and the overhead of the parallelization during the
+        first calls and chooses between sequential, threaded and process based
+        execution by itself. The measurements are repeated periodically.
     """
     SEQUENTIAL = enum.auto()
     THREAD = enum.auto()
     PROCESS = enum.auto()
+    AUTO = enum.auto()
 
     @staticmethod
     def default_output_parallelization():
@@ -110,3 +116,90 @@ class Parallelization(enum.Enum):
         :returns: a constant from this enumeration
         """
         return Parallelization.SEQUENTIAL
+
+
+@enum.unique
+class EvictionPolicy(enum.Enum):
+    """An enumeration type for defining, which cached results of a multi-output
+    connector are evicted first, when the limits of its cache are exceeded:
+
+    * LRU
+        the least recently used result is evicted first.
+    * LFU
+        the least frequently used result is evicted first. Among equally often
+        used results, the least recently used one is evicted.
+    """
+    LRU = enum.auto()
+    LFU = enum.auto()
+
+
+@enum.unique
+class ChangeDetection(enum.Enum):
+    """An enumeration type for defining, which values a multi-output connector
+    passes to a connected multi-input connector, after it has re-computed its values:
+
+    * ALWAYS
+        all values are passed, as if they had all changed.
+    * IDENTITY
+        only the values are passed, which are not the same object as the value,
+        that has been passed for the same key before. This is cheap, but it
+        requires the getter to return the identical object for unchanged values,
+        for example, from an internal data structure.
+    * EQUALITY
+        only the values are passed, which are not equal to the value, that has
+        been passed for the same key before. NumPy arrays are compared element-wise.
+
+    In all cases, the keys, that are no longer returned by the keys-method, are
+    removed from the multi-input connector.
+
+    The multi-output connector does not keep the passed values alive for the comparison.
+    With IDENTITY, it references them weakly, if they support weak references.
+    With EQUALITY, it remembers fingerprints of the values (see
+    :func:`~connectors._common._memoization.fingerprint`). So hashable values are
+    considered as equal, if they are equal and of the same type, and NumPy arrays
+    or other objects, which support the buffer protocol, if they have the same
+    content. Other objects are considered as equal, if their pickled representations
+    are equal.
+    """
+    ALWAYS = enum.auto()
+    IDENTITY = enum.auto()
+    EQUALITY = enum.auto()
+
+
+@enum.unique
+class Scheduling(enum.Enum):
+    """An enumeration type for the order, in which an executor passes the methods,
+    that are ready for execution, to its thread or process pools:
+
+    * FIFO
+        the methods are passed to the pools in the order, in which the computations
+        reach them.
+    * CRITICAL_PATH
+        when all workers of a pool are busy, the waiting method with the longest
+        remaining path through the processing network is passed to the pool first.
+        The length of a path is estimated from the previous execution times of
+        the connectors on it, so that the computations on the critical path of
+        the requested result are not delayed by shorter branches.
+    """
+    FIFO = enum.auto()
+    CRITICAL_PATH = enum.auto()
+
+
+@enum.unique
+class BufferPolicy(enum.Enum):
+    """An enumeration type for the behavior of a :class:`~connectors.BufferedStream`,
+    when a chunk is produced, while its buffer is full:
+
+    * BLOCK
+        the producer waits, until the consumer has taken a chunk from the buffer,
+        so that the producer runs at the throughput of the consumer.
+    * DROP
+        the oldest chunk in the buffer is discarded to make room for the new one,
+        so that the consumer always receives the most recent chunks.
+    * COALESCE
+        the new chunk is merged into the newest chunk in the buffer, so that no
+        data is lost, while the number of buffered chunks remains bounded.
+    """
+    BLOCK = enum.auto()
+    DROP = enum.auto()
+    COALESCE = enum.auto()
@@ -0,0 +1,60 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains a helper class for sharing computations between concurrent awaits"""
+
+import asyncio
+
+__all__ = ("Flights",)
+
+
+class Flights:
+    """Lets concurrent calls of a connector's ``async_call`` method, which request
+    the same result in the same event loop, share one computation.
+
+    This is the asyncio counterpart to the *single-flight* of the thread-safe
+    mode (see :class:`~connectors._common._thread_safety.ThreadSafety`).
+    """
+
+    def __init__(self):
+        self.__flights = {}     # maps keys to the tasks of the in-flight computations
+
+    async def run(self, key, factory):
+        """Awaits the coroutine, that is created by the given factory.
+        If a computation with the same key is already in flight, its result is
+        awaited instead of starting a new computation.
+
+        The computation is shielded from the cancellation of the awaiting tasks,
+        so that the other awaiting tasks still receive the result.
+
+        :param key: a hashable key, that identifies the result of the computation
+        :param factory: a function without parameters, that returns the coroutine
+        :returns: the return value of the coroutine
+        """
+        flight = self.__flights.get(key)
+        if flight is None or flight.done():
+            flight = self.__flights[key] = asyncio.ensure_future(factory())
+            flight.add_done_callback(lambda f: self.__land(key, f))
+        return await asyncio.shield(flight)
+
+    def __land(self, key, flight):
+        """Removes a finished flight, so that subsequent calls start a new computation.
+
+        :param key: the key of the flight
+        :param flight: the task of the flight
+        """
+        if self.__flights.get(key) is flight:
+            del self.__flights[key]
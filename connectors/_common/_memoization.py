@@ -0,0 +1,154 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains functions for the memoization of results, that have been computed
+for a previously seen state of the observed input connectors.
+"""
+
+import collections
+import hashlib
+import pickle
+
+__all__ = ("NO_VALUE", "fingerprint", "pack_arguments", "Memo")
+
+NO_VALUE = object()     # a sentinel for notifications, that do not contain the new value of an input connector
+
+
+def pack_arguments(*args, **kwargs):
+    """Packs the arguments, with which a setter has been called, into one value,
+    that is passed to the observing output connectors.
+
+    :param `*args,**kwargs`: the arguments of the setter method
+    :returns: the only positional argument, if the setter has been called with
+              one argument, or a tuple of the positional and the keyword arguments otherwise
+    """
+    if len(args) == 1 and not kwargs:
+        return args[0]
+    return args, tuple(sorted(kwargs.items()))
+
+
+def fingerprint(value):
+    """The default function for computing a hashable fingerprint of a value, that
+    has been passed to an input connector.
+
+    * Values with a value-based hash, such as numbers, strings or tuples of them,
+      are used directly.
+    * Objects, that support the buffer protocol, such as NumPy arrays, are hashed
+      by their content, their shape and their format.
+    * Other objects are hashed by their pickled representation.
+    * If none of these is possible, a unique object is returned, so that the value
+      does not match any other value.
+
+    :param value: the value
+    :returns: a hashable object, that is equal for equal values
+    """
+    type_ = type(value)
+    if type_.__hash__ is not None and type_.__hash__ is not object.__hash__:    # objects, that are hashed by their identity, could have been modified
+        try:
+            hash(value)
+        except TypeError:   # e.g. a tuple, that contains unhashable values
+            pass
+        else:
+            return type_, value
+    try:
+        view = memoryview(value)
+    except (TypeError, ValueError, BufferError):
+        pass
+    else:
+        try:
+            data = view.cast("B")
+        except (TypeError, ValueError):     # e.g. for non-contiguous buffers
+            data = view.tobytes()
+        return type_, str(getattr(value, "dtype", view.format)), view.shape, hashlib.blake2b(data).digest()
+    try:
+        return type_, hashlib.blake2b(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)).digest()
+    except Exception:   # pylint: disable=broad-except # pickling can fail with all sorts of exceptions
+        return object()
+
+
+class Memo:
+    """Remembers the results of an output connector for the states of the observed
+    input connectors, in which they have been computed.
+    The state is represented by the fingerprints of the values, that have been
+    passed to the input connectors.
+    """
+
+    def __init__(self, size, hasher):
+        """
+        :param size: the number of states, for which the results are remembered,
+                     0 to disable the memoization or None for no limit
+        :param hasher: a function, that computes a hashable fingerprint of a value,
+                       that has been passed to an input connector, or None for the
+                       default function :func:`~connectors._common._memoization.fingerprint`
+        """
+        self.__size = size
+        self.__hasher = fingerprint if hasher is None else hasher
+        self.__inputs = {}                          # the name of an input connector -> the fingerprint of its value
+        self.__results = collections.OrderedDict()  # state -> result, sorted from the least to the most recently used one
+
+    def __bool__(self):
+        """Returns True, if the memoization is enabled."""
+        return self.__size != 0
+
+    def notify(self, connector, value):
+        """Updates the state, when an observed input connector has changed a value.
+
+        :param connector: the input connector
+        :param value: the new value of the input connector or :data:`NO_VALUE`,
+                      if the value is unknown
+        """
+        if self.__size != 0:
+            name = getattr(connector, "__name__", None)
+            if value is NO_VALUE or name is None:
+                self.__inputs[name] = object()  # a unique fingerprint, that never matches a previous state
+            else:
+                self.__inputs[name] = self.__hasher(value)
+
+    def state(self):
+        """Returns a hashable representation of the current state of the observed inputs.
+
+        :returns: a frozenset
+        """
+        return frozenset(self.__inputs.items())
+
+    def get(self, state, key=None):
+        """Returns a remembered result.
+
+        :param state: the state, that has been returned by :meth:`state`
+        :param key: the key of the result for multi-output connectors
+        :returns: the result or :data:`NO_VALUE`, if no result has been remembered
+        """
+        result = self.__results.get((state, key), NO_VALUE)
+        if result is not NO_VALUE:
+            self.__results.move_to_end((state, key))
+        return result
+
+    def remember(self, state, result, key=None):
+        """Remembers a result for the given state.
+
+        :param state: the state, that has been returned by :meth:`state`
+        :param result: the result
+        :param key: the key of the result for multi-output connectors
+        """
+        self.__results[(state, key)] = result
+        self.__results.move_to_end((state, key))
+        if self.__size is not None:
+            while len(self.__results) > self.__size:
+                self.__results.popitem(last=False)
+
+    def clear(self):
+        """Forgets all remembered results."""
+        self.__results.clear()
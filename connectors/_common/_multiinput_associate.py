@@ -19,8 +19,10 @@ methods of multi-input connectors.
 """
 
 import functools
-from ._flags import Laziness
+from ._coroutines import is_coroutine_method
+from ._flags import Laziness, Parallelization
 from ._non_lazy_inputs import NonLazyInputs
+from ._thread_safety import guarded
 
 __all__ = ("MultiInputAssociateDescriptor", "MultiInputAssociateProxy",)
 
@@ -44,6 +46,7 @@ class MultiInputAssociateDescriptor:
                          method for details
         """
         self.__method = method
+        self.__coroutine = is_coroutine_method(method)
         self.__observers = observers
         self.__executor = executor
 
@@ -58,6 +61,7 @@ class MultiInputAssociateDescriptor:
         """
         return MultiInputAssociateProxy(instance=instance,
                                         method=self.__method,
+                                        coroutine=self.__coroutine,
                                         observers=self.__observers,
                                         executor=self.__executor)
 
@@ -75,10 +79,11 @@ class MultiInputAssociateProxy:
     during its call.
     """
 
-    def __init__(self, instance, method, observers, executor):
+    def __init__(self, instance, method, coroutine, observers, executor):
         """
         :param instance: the instance in which the method is replaced by the multi-input connector proxy
         :param method: the unbound method, that is replaced by this proxy (the remove or replace method)
+        :param coroutine: True, if the method has been defined with ``async def``
         :param observers: the names of output methods that are affected by passing
                           a value to the multi-input connector proxy
         :param executor: an :class:`~connectors._common._executors.Executor` instance,
@@ -88,26 +93,53 @@ class MultiInputAssociateProxy:
         """
         self.__instance = instance
         self.__method = method
+        self.__coroutine = coroutine
         self.__observers = observers
         self.__executor = executor
         functools.update_wrapper(self, method)
 
+    @guarded
     def __call__(self, *args, **kwargs):
         """Executes the replaced method and notifies the observing output connectors.
         :param `*args,**kwargs`: possible arguments for the replaced method
         :returns: the return value of the method, that has been replaced by this
         """
-        instance = self.__instance
-        # announce the value change
+        non_lazy_inputs = self.__announce_change()
+        result = self.__executor.call_method(self.__method, self.__coroutine, self.__instance, *args, **kwargs)
+        self.__notify_change()
+        non_lazy_inputs.execute(self.__executor)
+        return result
+
+    async def async_call(self, *args, **kwargs):
+        """Executes the replaced method and notifies the observing output connectors.
+        The computations of the non-lazy input connectors, that are caused by this,
+        are awaited in the event loop, that is already running. If the replaced
+        method has been defined with ``async def``, it is awaited as well.
+
+        :param `*args,**kwargs`: possible arguments for the replaced method
+        :returns: the return value of the method, that has been replaced by this
+        """
+        non_lazy_inputs = self.__announce_change()
+        result = await self.__executor.run_method(Parallelization.SEQUENTIAL,
+                                                  self.__method, self.__coroutine, self.__instance, *args, **kwargs)
+        self.__notify_change()
+        await non_lazy_inputs.execute_async(self.__executor)
+        return result
+
+    @guarded
+    def __announce_change(self):
+        """Announces a value change to the observing output connectors.
+
+        :returns: the :class:`~connectors._common._non_lazy_inputs.NonLazyInputs`
+                  instance, whose computations have to be executed after the change
+        """
         non_lazy_inputs = NonLazyInputs(Laziness.ON_ANNOUNCE)
         for o in self.__observers:
-            getattr(instance, o)._announce(self, non_lazy_inputs)
-        # call the replaced method
-        result = self.__method(self.__instance, *args, **kwargs)
-        # notify observers about the value change
+            getattr(self.__instance, o)._announce(self, non_lazy_inputs)
+        return non_lazy_inputs
+
+    @guarded
+    def __notify_change(self):
+        """Notifies the observing output connectors, after the replaced method has been called."""
         for o in self.__observers:
-            getattr(instance, o)._notify(self)
-        # execute the non-lazy inputs
-        non_lazy_inputs.execute(self.__executor)
-        # return the result of the method call
-        return result
+            getattr(self.__instance, o)._notify(self)
@@ -16,9 +16,10 @@
 
 """Contains the :class:`~connectors._common._multiinput_item.MultiInputItem` class"""
 
-from ._flags import Laziness
+from ._flags import Laziness, Parallelization
 from ._non_lazy_inputs import NonLazyInputs
 from ._input import get_first_argument
+from ._thread_safety import guarded
 
 __all__ = ("MultiInputItem",)
 
@@ -31,13 +32,14 @@ class MultiInputItem:
     use a multi-input connector as arbitrarily many single-inputs.
     """
 
-    def __init__(self, connector, instance, replace_method, key, observers, executor):
+    def __init__(self, connector, instance, replace_method, coroutine, key, observers, executor):
         """
         :param connector: the multi-input connector
         :param instance: the instance of which the method was replaced by the
                          multi-input connector
         :param replace_method: an unbound method, that is used to replace data,
                                that has been added through the multi-input connector
+        :param coroutine: True, if the replace-method has been defined with ``async def``
         :param key: the key with which the multi-input has been accessed.
         :param observers: a sequence of output connectors, that observe the
                           multi-input connector's value changes.
@@ -47,29 +49,69 @@ class MultiInputItem:
         self.__connector = connector
         self.__instance = instance
         self.__replace = replace_method
+        self.__coroutine = coroutine
         self.__key = key
         self.__observers = observers
         self.__executor = executor
 
+    @guarded
     def __call__(self, *args, **kwargs):
         """Calls the given replace-method
 
         :param `*args,**kwargs`: arguments for the replace-method
         :returns: the instance of which the method was replaced by the multi-input connector
         """
-        if self.__observers:
-            non_lazy_inputs = NonLazyInputs(Laziness.ON_ANNOUNCE)
-            for o in self.__observers:
-                o._announce(self.__connector, non_lazy_inputs)
-            data_id = self.__replace(self.__instance, self.__key, *args, **kwargs)
-            value = get_first_argument(self.__replace, *args, **kwargs)
-            self.__connector._add_to_notification_condition_checks(data_id=data_id, value=value)    # pylint: disable=protected-access # this call stays within the context of a multi-input connector.
-            self.__connector._notify_observers()                                                    # pylint: disable=protected-access # this call stays within the context of a multi-input connector.
+        non_lazy_inputs = self.__announce_change()
+        data_id = self.__executor.call_method(self.__replace, self.__coroutine, self.__instance, self.__key,
+                                              *args, **kwargs)
+        if non_lazy_inputs is not None:
+            self.__notify_change(data_id, *args, **kwargs)
             non_lazy_inputs.execute(self.__executor)
-        else:
-            self.__replace(self.__instance, self.__key, *args, **kwargs)
         return self.__instance
 
+    async def async_call(self, *args, **kwargs):
+        """Calls the given replace-method and awaits the computations of the non-lazy
+        input connectors, that are caused by this, in the event loop, that is already
+        running (see :meth:`connectors.connectors.Connector.async_call`).
+
+        :param `*args,**kwargs`: arguments for the replace-method
+        :returns: the instance of which the method was replaced by the multi-input connector
+        """
+        non_lazy_inputs = self.__announce_change()
+        data_id = await self.__executor.run_method(Parallelization.SEQUENTIAL,
+                                                   self.__replace, self.__coroutine, self.__instance, self.__key,
+                                                   *args, **kwargs)
+        if non_lazy_inputs is not None:
+            self.__notify_change(data_id, *args, **kwargs)
+            await non_lazy_inputs.execute_async(self.__executor)
+        return self.__instance
+
+    @guarded
+    def __announce_change(self):
+        """Announces a value change to the observers.
+
+        :returns: the :class:`~connectors._common._non_lazy_inputs.NonLazyInputs`
+                  instance, whose computations have to be executed after the change,
+                  or None, if the multi-input connector has no observers
+        """
+        if not self.__observers:
+            return None
+        non_lazy_inputs = NonLazyInputs(Laziness.ON_ANNOUNCE)
+        for o in self.__observers:
+            o._announce(self.__connector, non_lazy_inputs)
+        return non_lazy_inputs
+
+    @guarded
+    def __notify_change(self, data_id, *args, **kwargs):
+        """Notifies the observers, after the replace-method has been called.
+
+        :param data_id: the return value of the replace-method
+        :param `*args,**kwargs`: the arguments, with which the replace-method has been called
+        """
+        value = get_first_argument(self.__replace, *args, **kwargs)
+        self.__connector._add_to_notification_condition_checks(data_id=data_id, value=value)    # pylint: disable=protected-access # this call stays within the context of a multi-input connector.
+        self.__connector._notify_observers()                                                    # pylint: disable=protected-access # this call stays within the context of a multi-input connector.
+
     def connect(self, connector):
         """Connects this virtual single-input to an output.
 
@@ -46,6 +46,15 @@ class MultiOutputItem:
         """
         return self.__connector(self.__key, *args, **kwargs)
 
+    async def async_call(self, *args, **kwargs):
+        """Calls the given getter method with the given key as the first argument
+        in the event loop, that is already running (see :meth:`connectors.connectors.MultiOutputConnector.async_call`).
+
+        :param `*args,**kwargs`: additional arguments for the method
+        :returns: the return value of the getter method
+        """
+        return await self.__connector.async_call(self.__key, *args, **kwargs)
+
     def connect(self, connector):
         """Connects this virtual single-output to an output.
 
@@ -68,6 +77,14 @@ class MultiOutputItem:
         """Returns the key, with which the multi-output connector has been accessed."""
         return self.__key
 
+    def _get_instance(self):
+        """Returns the instance of which the method was replaced by the multi-output
+        connector (see :meth:`connectors._connectors._baseclasses.Connector._get_instance`).
+
+        :returns: a Python object
+        """
+        return self.__instance
+
     async def _request(self, executor, *args, **kwargs):
         """Causes this multi-output connector to re-compute its value and notifies
         the connected input connectors.
@@ -0,0 +1,47 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the :class:`~connectors._common._multioutput_options.MultiOutputOptions`
+tuple, that groups the settings of multi-output connectors.
+"""
+
+import collections
+from ._flags import ChangeDetection, EvictionPolicy
+
+__all__ = ("MultiOutputOptions",)
+
+MultiOutputOptions = collections.namedtuple("MultiOutputOptions",
+                                            ("keys", "batch", "version",
+                                             "max_entries", "max_bytes", "eviction_policy",
+                                             "memoize", "hasher", "change_detection"),
+                                            defaults=(None, None, None,
+                                                      None, None, EvictionPolicy.LRU,
+                                                      0, None, ChangeDetection.ALWAYS))
+MultiOutputOptions.__doc__ = """The settings, with which a multi-output connector is created:
+
+* keys: an unbound method, that returns the keys for which the multi-output
+  connector shall compute values, when it is connected to a multi-input connector
+* batch: an unbound method, that computes the values for a sequence of keys in
+  one call, or None (see the :meth:`~connectors.MultiOutput.batch` decorator)
+* version: an unbound method, that returns a version for the value of a given
+  key, or None (see the :meth:`~connectors.MultiOutput.version` decorator)
+* max_entries, max_bytes, eviction_policy: the limits of the cache (see the
+  :meth:`~connectors.connectors.MultiOutputConnector.set_caching` method)
+* memoize, hasher: the settings of the memoization (see the
+  :meth:`~connectors.connectors.MultiOutputConnector.set_memoization` method)
+* change_detection: a flag from the :class:`connectors.ChangeDetection` enum (see
+  the :meth:`~connectors.connectors.MultiOutputConnector.set_change_detection` method)
+"""
@@ -16,6 +16,10 @@
 
 """Defines a container class for tracking non-lazy input connectors"""
 
+import asyncio
+import itertools
+from ._transaction import Transaction
+
 __all__ = ("NonLazyInputs",)
 
 
@@ -23,8 +27,15 @@ class NonLazyInputs(set):
     """A subclass of :class:`set`, that is used internally to track the non-lazy
     input connectors, that request an immediate re-computation of the processing
     chain.
+
+    Every container corresponds to one announcement pass through the processing
+    network and has a unique ``generation`` number, with which the output connectors
+    recognize, that they have already forwarded the announcement of the current
+    pass through another path.
     """
 
+    __generations = itertools.count()
+
     def __init__(self, situation):
         """
         :param situation: a flag from the :class:`~connectors.Laziness` enumeration
@@ -33,6 +44,7 @@ class NonLazyInputs(set):
         """
         set.__init__(self)
         self.__situation = situation
+        self.generation = next(NonLazyInputs.__generations)
 
     def add(self, connector, laziness):
         """Adds a connector to this container, if its laziness is low enough to
@@ -50,8 +62,27 @@ class NonLazyInputs(set):
         """Executes the necessary computations, that are requested by the non-lazy
         input connectors.
 
+        Inside a :func:`connectors.transaction`, the execution is deferred until
+        the end of the transaction.
+
         :param executor: the :class:`connectors._common._executors.Executor` instance,
                          that manages the executions
         """
-        if self:
+        transaction = Transaction.active()
+        if transaction is not None:
+            transaction.defer_execution(self, executor)
+        elif self:
             executor.run_coroutines(i._request(executor) for i in self)
+
+    async def execute_async(self, executor):
+        """Like :meth:`execute`, but the computations are awaited in the event loop,
+        that is running in the current thread (see :meth:`~connectors._common._executors.Executor.run_async`).
+
+        :param executor: the :class:`connectors._common._executors.Executor` instance,
+                         that manages the executions
+        """
+        transaction = Transaction.active()
+        if transaction is not None:
+            transaction.defer_execution(self, executor)
+        elif self:
+            await executor.run_async(asyncio.gather(*(i._request(executor) for i in self)))
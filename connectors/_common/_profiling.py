@@ -0,0 +1,354 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the process-wide registry for profiling hooks and the collection of
+timing statistics for the connectors.
+"""
+
+import collections
+import itertools
+import os
+import threading
+import time
+import weakref
+
+__all__ = ("Profiler", "ProfilingRecord", "ConnectorStatistics", "StatisticsTable", "profiler",
+           "add_profiling_hook", "remove_profiling_hook", "set_profiling", "stats")
+
+ProfilingRecord = collections.namedtuple("ProfilingRecord", ("event", "instance", "method", "start", "wall_time",
+                                                             "cpu_time", "queue_time", "thread_id", "process_id"))
+ProfilingRecord.__doc__ = """A record, that is passed to the profiling hooks.
+
+:param event: ``"call"`` for the execution of a getter or setter method,
+              ``"cache_hit"``, if an output connector has returned a cached result,
+              ``"memo_hit"``, if an output connector has returned a memoized result, or
+              ``"cache_miss"``, if an output connector had to execute its getter
+:param instance: the instance of which the method has been executed
+:param method: the name of the method
+:param start: the start time of the execution as returned by :func:`time.perf_counter`.
+              For methods, that have been executed in a worker process, the start
+              time is converted to the :func:`time.perf_counter` of the main process
+              via the wall clock, so it is only as accurate as the resolution of
+              :func:`time.time` (usually a microsecond) and it is distorted, if
+              the system time is adjusted during the execution.
+:param wall_time: the duration of the execution in seconds
+:param cpu_time: the CPU time of the thread, that has executed the method, in seconds
+:param queue_time: the time in seconds, that the method has waited for a thread or a process of the executor.
+                   It is derived from the start time and has the same accuracy.
+:param thread_id: the identifier of the thread, that has executed the method
+:param process_id: the identifier of the process, that has executed the method
+"""
+
+ConnectorStatistics = collections.namedtuple("ConnectorStatistics", ("connector", "instance", "calls", "wall_time",
+                                                                     "cpu_time", "queue_time",
+                                                                     "cache_hits", "memo_hits", "cache_misses"))
+ConnectorStatistics.__doc__ = """The accumulated statistics of a connector, as returned by :func:`connectors.stats`.
+
+:param connector: the qualified name of the decorated method
+:param instance: a string, that identifies the instance
+:param calls: the number of executions of the method
+:param wall_time: the accumulated duration of the executions in seconds
+:param cpu_time: the accumulated CPU time of the executions in seconds
+:param queue_time: the accumulated time in seconds, that the executions have waited for a thread or a process
+:param cache_hits: the number of requests of an output connector, that have been answered from a cache
+:param memo_hits: the number of requests of an output connector, that have been answered from the memoization
+:param cache_misses: the number of requests of an output connector, that have caused the execution of the getter
+"""
+
+
+def timed_call(function, *args, **kwargs):
+    """Executes the given function and measures its execution time. This function
+    is executed in the threads or processes of an executor, so that the CPU time
+    of the respective thread can be measured.
+
+    :param function: the function
+    :param `*args,**kwargs`: the arguments for the function
+    :returns: a tuple with the return value and a tuple (start time, wall time,
+              CPU time, thread id, process id, start time as returned by :func:`time.time`)
+    """
+    cpu_start = time.thread_time()
+    clock_start = time.time()
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    wall_time = time.perf_counter() - start
+    return result, (start, wall_time, time.thread_time() - cpu_start, threading.get_ident(), os.getpid(), clock_start)
+
+
+def describe(record):
+    """Creates human readable labels for the connector and the instance of a profiling record.
+
+    :param record: a :class:`~connectors._common._profiling.ProfilingRecord`
+    :returns: a tuple (qualified name of the method, identification of the instance)
+    """
+    class_ = type(record.instance).__qualname__
+    return f"{class_}.{record.method}", f"{class_} at {id(record.instance):#x}"
+
+
+class StatisticsTable(tuple):
+    """A tuple of :class:`~connectors._common._profiling.ConnectorStatistics`,
+    that is formatted as a table, when it is converted to a string.
+    """
+
+    def __str__(self):
+        """Formats the statistics as a table.
+
+        :returns: a string
+        """
+        header = ("connector", "instance", "calls", "wall [s]", "cpu [s]", "queue [s]", "hits", "memo", "misses")
+        rows = [(s.connector, s.instance, str(s.calls), f"{s.wall_time:.6f}", f"{s.cpu_time:.6f}",
+                 f"{s.queue_time:.6f}", str(s.cache_hits), str(s.memo_hits), str(s.cache_misses)) for s in self]
+        widths = [max(len(r[i]) for r in [header] + rows) for i in range(len(header))]
+        lines = ["  ".join(c.ljust(w) if i < 2 else c.rjust(w) for i, (c, w) in enumerate(zip(r, widths)))
+                 for r in [header] + rows]
+        lines.insert(1, "  ".join("-" * w for w in widths))
+        return "\n".join(lines)
+
+
+class _Statistics:
+    """A profiling hook, that accumulates the statistics for each connector."""
+
+    def __init__(self):
+        self.__lock = threading.RLock()     # re-entrant, because the finalizers of the instances can be called by the garbage collector, while the lock is held
+        self.__entries = {}                 # maps (token of the instance, method name) to lists, that correspond to ConnectorStatistics
+        self.__tokens = {}                  # maps the ids of the living instances to unique tokens, so that a new instance, which reuses an id, does not continue the statistics of a deleted one
+        self.__counter = itertools.count()
+
+    def __call__(self, record):
+        """Adds a record to the statistics.
+
+        :param record: a :class:`~connectors._common._profiling.ProfilingRecord`
+        """
+        with self.__lock:
+            key = (self.__token(record.instance), record.method)
+            entry = self.__entries.get(key)
+            if entry is None:
+                entry = [*describe(record), 0, 0.0, 0.0, 0.0, 0, 0, 0]
+                self.__entries[key] = entry
+            if record.event == "call":
+                entry[2] += 1
+                entry[3] += record.wall_time
+                entry[4] += record.cpu_time
+                entry[5] += record.queue_time
+            elif record.event == "cache_hit":
+                entry[6] += 1
+            elif record.event == "memo_hit":
+                entry[7] += 1
+            else:
+                entry[8] += 1
+
+    def table(self):
+        """Returns the accumulated statistics sorted by the wall time in descending order.
+
+        :returns: a :class:`~connectors._common._profiling.StatisticsTable`
+        """
+        with self.__lock:
+            entries = [ConnectorStatistics(*e) for e in self.__entries.values()]
+        return StatisticsTable(sorted(entries, key=lambda s: s.wall_time, reverse=True))
+
+    def clear(self):
+        """Discards the accumulated statistics."""
+        with self.__lock:
+            self.__entries.clear()
+
+    def __token(self, instance):
+        """Returns the token, by which the statistics of the given instance are
+        identified. Must be called, while holding the lock.
+
+        :param instance: the instance of the profiled connector
+        :returns: the token
+        """
+        instance_id = id(instance)
+        token = self.__tokens.get(instance_id)
+        if token is None:
+            token = self.__tokens[instance_id] = next(self.__counter)
+            try:
+                weakref.finalize(instance, self.__forget, instance_id)
+            except TypeError:   # the instance does not support weak references, so its statistics are identified by its id
+                pass
+        return token
+
+    def __forget(self, instance_id):
+        """Is called, when a profiled instance has been garbage collected. Its
+        statistics are kept, but they are no longer continued by a new instance
+        with the same id.
+
+        :param instance_id: the id of the instance
+        """
+        with self.__lock:
+            self.__tokens.pop(instance_id, None)
+
+
+class Profiler:
+    """Manages the profiling hooks, to which the connectors and the executors
+    report the executions of the decorated methods and the usage of the caches.
+    As long as no hook is registered, the reporting is skipped, so that the
+    profiling has no noticeable overhead, when it is disabled.
+    """
+
+    def __init__(self):
+        self.__hooks = ()
+        self.__statistics = _Statistics()
+
+    def active(self):
+        """Returns, if profiling hooks are registered.
+
+        :returns: True or False
+        """
+        return bool(self.__hooks)
+
+    def add_hook(self, hook):
+        """Registers a profiling hook.
+
+        :param hook: a callable, that takes a :class:`~connectors._common._profiling.ProfilingRecord`
+        """
+        self.__hooks += (hook,)
+
+    def remove_hook(self, hook):
+        """Unregisters a profiling hook.
+
+        :param hook: the previously registered callable
+        """
+        self.__hooks = tuple(h for h in self.__hooks if h != hook)
+
+    def statistics(self):
+        """Returns the hook, that collects the statistics for :func:`connectors.stats`.
+
+        :returns: a callable, that takes a :class:`~connectors._common._profiling.ProfilingRecord`
+        """
+        return self.__statistics
+
+    def run(self, method, instance, *args, **kwargs):
+        """Executes a method in the current thread and reports the execution
+        to the hooks, if profiling is active.
+
+        :param method: the unbound method
+        :param instance: the instance of which the method shall be executed
+        :param `*args,**kwargs`: the arguments for the method
+        :returns: the return value of the method
+        """
+        if not self.__hooks:
+            return method(instance, *args, **kwargs)
+        result, timing = timed_call(method, instance, *args, **kwargs)
+        self.report(method, instance, timing[0], timing)
+        return result
+
+    async def run_async(self, method, instance, *args, **kwargs):
+        """Awaits a coroutine method in the event loop of the current thread and
+        reports the execution to the hooks, if profiling is active.
+        The CPU time of a coroutine method is reported as zero, because other tasks
+        are executed in the same thread, while the coroutine is suspended.
+
+        :param method: the unbound coroutine method
+        :param instance: the instance of which the method shall be executed
+        :param `*args,**kwargs`: the arguments for the method
+        :returns: the return value of the method
+        """
+        if not self.__hooks:
+            return await method(instance, *args, **kwargs)
+        start = time.perf_counter()
+        result = await method(instance, *args, **kwargs)
+        timing = (start, time.perf_counter() - start, 0.0, threading.get_ident(), os.getpid(), None)
+        self.report(method, instance, start, timing)
+        return result
+
+    def report(self, method, instance, submitted, timing):
+        """Reports the execution of a method to the hooks.
+
+        :param method: the unbound method
+        :param instance: the instance of which the method has been executed
+        :param submitted: the time as returned by :func:`time.perf_counter`, at
+                          which the method has been passed to the executor
+        :param timing: the tuple, that has been returned by :func:`timed_call`
+        """
+        start, wall_time, cpu_time, thread_id, process_id, clock_start = timing
+        if process_id != os.getpid():   # the reference point of time.perf_counter is undefined, so it cannot be compared across processes
+            start = clock_start - time.time() + time.perf_counter()
+        record = ProfilingRecord("call", instance, method.__name__, start, wall_time, cpu_time,
+                                 max(start - submitted, 0.0), thread_id, process_id)
+        for hook in self.__hooks:
+            hook(record)
+
+    def count(self, event, method, instance):
+        """Reports a cache hit, a memoization hit or a cache miss to the hooks.
+
+        :param event: ``"cache_hit"``, ``"memo_hit"`` or ``"cache_miss"``
+        :param method: the unbound getter method
+        :param instance: the instance of which the method has been replaced by the output connector
+        """
+        record = ProfilingRecord(event, instance, method.__name__, time.perf_counter(), 0.0, 0.0, 0.0,
+                                 threading.get_ident(), os.getpid())
+        for hook in self.__hooks:
+            hook(record)
+
+
+profiler = Profiler()   # the process-wide instance, that is used by all connectors and executors
+
+
+def add_profiling_hook(hook):
+    """Registers a callable, to which the connectors report the executions of
+    the decorated methods and the usage of the caches.
+
+    The hook is called with a :class:`~connectors._common._profiling.ProfilingRecord`
+    for every execution of a getter or setter method and for every request of an
+    output connector. It can be called from different threads.
+
+    :param hook: a callable, that takes a :class:`~connectors._common._profiling.ProfilingRecord`
+    """
+    profiler.add_hook(hook)
+
+
+def remove_profiling_hook(hook):
+    """Unregisters a callable, that has been registered with :func:`connectors.add_profiling_hook`.
+
+    :param hook: the callable
+    """
+    profiler.remove_hook(hook)
+
+
+def set_profiling(enabled):
+    """Enables or disables the collection of the statistics, that are returned
+    by :func:`connectors.stats`. Disabling the collection does not discard the
+    statistics, that have been collected so far.
+
+    :param enabled: True, if the statistics shall be collected, False otherwise
+    """
+    profiler.remove_hook(profiler.statistics())
+    if enabled:
+        profiler.add_hook(profiler.statistics())
+
+
+def stats(reset=False):
+    """Returns the statistics, that have been collected for the connectors, since
+    profiling has been enabled with :func:`connectors.set_profiling`.
+
+    The statistics contain the number of executions of the getter and setter
+    methods, their accumulated wall time and CPU time, the time, that the executions
+    have waited for a thread or a process of the executor, and the numbers of cache
+    hits and misses of the output connectors. The result can be printed as a table::
+
+       connectors.set_profiling(True)
+       result = processing_chain.get_result()
+       print(connectors.stats())
+
+    :param reset: True, if the statistics shall be discarded after retrieving them
+    :returns: a :class:`~connectors._common._profiling.StatisticsTable`, which
+              is a tuple of :class:`~connectors._common._profiling.ConnectorStatistics`
+              sorted by their wall time in descending order
+    """
+    table = profiler.statistics().table()
+    if reset:
+        profiler.statistics().clear()
+    return table
@@ -0,0 +1,240 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Defines a container class for the cached results of multi-output connectors"""
+
+import collections
+import heapq
+import itertools
+import sys
+import weakref
+from ._cache_manager import cache_manager
+from ._flags import EvictionPolicy
+
+__all__ = ("CacheStatistics", "ResultCache", "get_size")
+
+CacheStatistics = collections.namedtuple("CacheStatistics", ("hits", "misses", "evictions", "entries", "bytes"))
+CacheStatistics.__doc__ = """The statistics of a :class:`~connectors._common._result_cache.ResultCache`:
+
+* hits: the number of results, that have been taken from the cache
+* misses: the number of results, that had to be computed and have been added to the cache
+* evictions: the number of results, that have been removed to comply with the limits of the cache
+* entries: the number of currently cached results
+* bytes: the estimated memory consumption of the currently cached results
+"""
+
+_ticks = itertools.count()  # orders the accesses of the results, so that the least recently used one of equally often used results is evicted first
+
+
+def get_size(value):
+    """Estimates the memory consumption of the given value.
+    For objects with an ``nbytes`` attribute, such as NumPy arrays, the value of
+    that attribute is returned, for all other objects the result of :func:`sys.getsizeof`.
+
+    :param value: the value
+    :returns: the estimated size in bytes
+    """
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    return sys.getsizeof(value)
+
+
+class ResultCache:
+    """A container for the cached results of a multi-output connector, which is
+    accessed like a :class:`dict`, but which evicts results, when a maximum number
+    of entries or a maximum memory consumption is exceeded.
+    """
+
+    def __init__(self, max_entries=None, max_bytes=None, eviction_policy=EvictionPolicy.LRU, owner=None):
+        """
+        :param max_entries: the maximum number of cached results or None for no limit
+        :param max_bytes: the maximum memory consumption of the cached results or
+                          None for no limit. See :func:`~connectors._common._result_cache.get_size`
+                          for how the memory consumption of a result is estimated
+        :param eviction_policy: a flag from the :class:`connectors.EvictionPolicy`
+                                enum, that specifies, which results shall be evicted
+                                first, when a limit is exceeded
+        :param owner: the connector, that uses this cache, or None. If a connector
+                      is given, the cached results are registered at the process-wide
+                      :class:`~connectors._common._cache_manager.CacheManager`
+        """
+        self.__owner = None if owner is None else weakref.ref(owner)
+        self.__max_entries = max_entries
+        self.__max_bytes = max_bytes
+        self.__eviction_policy = eviction_policy
+        self.__results = collections.OrderedDict()  # key -> result, sorted from the least to the most recently used one
+        self.__sizes = {}                           # key -> estimated size of the result
+        self.__uses = {}                            # key -> tuple (number of accesses, tick of the last access) of the result
+        self.__heap = []                            # a priority queue of tuples (number of accesses, tick, key) for the LFU policy. Outdated tuples are skipped, when they are popped
+        self.__bytes = 0
+        self.__counts = collections.Counter()       # the numbers of hits, misses and evictions
+
+    def __contains__(self, key):
+        """Checks, if a result for the given key is cached.
+
+        :param key: the key
+        :returns: True, if the result is cached, False otherwise
+        """
+        return key in self.__results
+
+    def __getitem__(self, key):
+        """Returns a cached result and counts the access for the eviction policy
+        and the statistics.
+
+        :param key: the key of the result
+        :returns: the result
+        """
+        result = self.__results[key]
+        self.__results.move_to_end(key)
+        self.__use(key, self.__uses[key][0] + 1)
+        self.__counts["hits"] += 1
+        if self.__owner is not None:
+            cache_manager.touch(self.__owner(), key)
+        return result
+
+    def __len__(self):
+        """Returns the number of cached results."""
+        return len(self.__results)
+
+    def keys(self):
+        """Returns the keys of the cached results."""
+        return self.__results.keys()
+
+    def add(self, key, result, cost=0.0):
+        """Adds a computed result to the cache and evicts other results, if the
+        limits of the cache are exceeded.
+
+        :param key: the key of the result
+        :param result: the result
+        :param cost: the duration of the computation of the result in seconds, which
+                     is used by the :class:`~connectors._common._cache_manager.CacheManager`
+        :returns: a list of the keys, whose results have been evicted. This can
+                  include the given key, if its result alone exceeds the maximum
+                  memory consumption
+        """
+        self.__counts["misses"] += 1
+        self.__discard(key)
+        size = get_size(result)
+        self.__results[key] = result
+        self.__sizes[key] = size
+        self.__use(key, 1)
+        self.__bytes += size
+        evicted = []
+        while self.__exceeded() and len(self.__results) > 1:
+            victim = self.__victim(exclude=key)
+            self.__discard(victim)
+            evicted.append(victim)
+        if self.__exceeded():
+            self.__discard(key)
+            evicted.append(key)
+        self.__counts["evictions"] += len(evicted)
+        if self.__owner is not None and key in self.__results:
+            cache_manager.add(self.__owner(), key, size, cost)
+        return evicted
+
+    def evict(self, key):
+        """Removes a result from the cache and counts it as an eviction, for example,
+        when the :class:`~connectors._common._cache_manager.CacheManager` has
+        evicted it.
+
+        :param key: the key of the result
+        """
+        if key in self.__results:
+            self.__discard(key)
+            self.__counts["evictions"] += 1
+
+    def clear(self):
+        """Removes all results from the cache without counting them as evictions."""
+        if self.__owner is not None and self.__results:
+            cache_manager.remove_all(self.__owner())
+        self.__results.clear()
+        self.__sizes.clear()
+        self.__uses.clear()
+        self.__heap.clear()
+        self.__bytes = 0
+
+    def configure(self, max_entries=None, max_bytes=None, eviction_policy=EvictionPolicy.LRU):
+        """Changes the limits and the eviction policy of the cache.
+        The parameters are the same as for the constructor. Since the cached results
+        may exceed the new limits, the cache is cleared.
+        """
+        self.__max_entries = max_entries
+        self.__max_bytes = max_bytes
+        self.__eviction_policy = eviction_policy
+        self.clear()
+
+    def statistics(self):
+        """Returns the statistics about the usage of this cache.
+
+        :returns: a :class:`~connectors._common._result_cache.CacheStatistics` tuple
+        """
+        return CacheStatistics(hits=self.__counts["hits"],
+                               misses=self.__counts["misses"],
+                               evictions=self.__counts["evictions"],
+                               entries=len(self.__results),
+                               bytes=self.__bytes)
+
+    def __exceeded(self):
+        """Checks, if one of the limits of the cache is exceeded."""
+        return (self.__max_entries is not None and len(self.__results) > self.__max_entries) or \
+               (self.__max_bytes is not None and self.__bytes > self.__max_bytes)
+
+    def __use(self, key, uses):
+        """Records an access of a result.
+
+        :param key: the key of the result
+        :param uses: the number of accesses of the result including this one
+        """
+        tick = next(_ticks)
+        self.__uses[key] = (uses, tick)
+        if self.__eviction_policy == EvictionPolicy.LFU:
+            if len(self.__heap) > 2 * len(self.__uses) + 1024:   # prevent the queue from growing indefinitely with outdated tuples
+                self.__heap = [(u, t, k) for u, t, k in self.__heap if self.__uses.get(k) == (u, t)]
+                heapq.heapify(self.__heap)
+            heapq.heappush(self.__heap, (uses, tick, key))
+
+    def __victim(self, exclude):
+        """Selects the result, that shall be evicted, according to the eviction policy.
+
+        :param exclude: the key of a result, that must not be selected
+        :returns: the key of the selected result
+        """
+        if self.__eviction_policy != EvictionPolicy.LFU:
+            return next(k for k in self.__results if k != exclude)
+        excluded = None
+        while True:
+            uses, tick, key = item = heapq.heappop(self.__heap)
+            if self.__uses.get(key) != (uses, tick):    # the result has been accessed or removed, since the tuple has been added
+                continue
+            if key == exclude:
+                excluded = item
+                continue
+            if excluded is not None:
+                heapq.heappush(self.__heap, excluded)
+            return key
+
+    def __discard(self, key):
+        """Removes a result from the cache, if it is cached.
+
+        :param key: the key of the result
+        """
+        if key in self.__results:
+            del self.__results[key]
+            del self.__uses[key]
+            self.__bytes -= self.__sizes.pop(key)
+            if self.__owner is not None:
+                cache_manager.remove(self.__owner(), key)
@@ -0,0 +1,187 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the classes for the critical path aware scheduling of the executors"""
+
+import asyncio
+import heapq
+import itertools
+import time
+import weakref
+from ._topology import topology
+
+__all__ = ("CriticalPathScheduler", "PriorityGate")
+
+
+class CriticalPathScheduler:
+    """Estimates the priority of a method, that shall be passed to a thread or
+    process pool, by the length of the longest path from its connector through
+    the processing network (the *rank* of the connector).
+
+    The length of a path is the sum of the execution times of the connectors on
+    it, which are measured, whenever a method is executed through a
+    :class:`PriorityGate`, and smoothed with an exponential moving average.
+    Connectors, that have not been executed yet, count with an execution time
+    of zero.
+    The ranks are computed lazily and cached, until the topology of the networks
+    changes or :meth:`reset` is called at the beginning of a computation, so that
+    the new measurements are taken into account.
+    """
+
+    def __init__(self, smoothing=0.3):
+        """
+        :param smoothing: the weight of a new measurement in the exponential
+                          moving average of the execution times
+        """
+        self.__smoothing = smoothing
+        self.__durations = weakref.WeakKeyDictionary()  # maps instances to dictionaries, which map methods to the smoothed execution times
+        self.__ranks = {}           # maps connectors to the lengths of their longest paths
+        self.__version = None       # the topology version, for which the ranks have been computed
+
+    def priority(self, method, instance):
+        """Returns the priority of executing the given method, which is the rank
+        of its connector.
+
+        :param method: the unbound method
+        :param instance: the instance of which the method shall be executed
+        :returns: a float, larger values mean higher priority
+        """
+        connector = getattr(instance, getattr(method, "__name__", ""), None)
+        if not hasattr(connector, "_downstream"):  # the method has not been replaced by a connector
+            return self.__duration(method, instance)
+        if self.__version != topology.version():
+            self.__ranks.clear()
+            self.__version = topology.version()
+        rank = self.__ranks.get(connector)
+        if rank is None:
+            rank = self.__rank(connector)
+        return rank
+
+    async def measure(self, method, instance, awaitable):
+        """Awaits the given awaitable, which executes the given method, and records
+        the elapsed time as the execution time of the method.
+
+        :param method: the unbound method
+        :param instance: the instance of which the method is executed
+        :param awaitable: the awaitable, that executes the method
+        :returns: the return value of the method
+        """
+        start = time.perf_counter()
+        result = await awaitable
+        self.record(method, instance, time.perf_counter() - start)
+        return result
+
+    def record(self, method, instance, duration):
+        """Records an execution time of the given method.
+
+        :param method: the unbound method
+        :param instance: the instance of which the method has been executed
+        :param duration: the execution time in seconds
+        """
+        methods = self.__durations.setdefault(instance, {})
+        average = methods.get(method)
+        methods[method] = duration if average is None else average + self.__smoothing * (duration - average)
+
+    def reset(self):
+        """Discards the cached ranks, so that they are recomputed from the current
+        measurements of the execution times.
+        """
+        self.__ranks.clear()
+
+    def __duration(self, method, instance):
+        """Returns the smoothed execution time of the given method.
+
+        :param method: the unbound method
+        :param instance: the instance of which the method is executed
+        :returns: the execution time in seconds or 0.0, if it has not been measured yet
+        """
+        return self.__durations.get(instance, {}).get(method, 0.0)
+
+    def __rank(self, connector):
+        """Computes the ranks of the given connector and of the connectors below it.
+
+        :param connector: the connector
+        :returns: the rank of the connector
+        """
+        ranks = self.__ranks
+        visiting = set()
+        stack = [(connector, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                visiting.discard(node)
+                downstream = node._downstream()     # pylint: disable=protected-access # the scheduler and the connectors are tightly coupled
+                duration = self.__duration(node._method, node._get_instance())   # pylint: disable=protected-access # the scheduler and the connectors are tightly coupled
+                ranks[node] = duration + max((ranks.get(d, 0.0) for d in downstream), default=0.0)
+            elif node not in ranks and node not in visiting:   # the connectors in a cycle only count once
+                visiting.add(node)
+                stack.append((node, True))
+                stack.extend((d, False) for d in node._downstream() if d not in ranks)    # pylint: disable=protected-access # the scheduler and the connectors are tightly coupled
+        return ranks[connector]
+
+
+class PriorityGate:
+    """A priority queue in front of a thread or process pool, which limits the
+    number of concurrently executed methods to the number of workers of the pool.
+    When a worker becomes free, the waiting method with the highest priority is
+    executed next, rather than the one, that has been waiting the longest.
+    """
+
+    def __init__(self, capacity):
+        """
+        :param capacity: the number of methods, that can be executed concurrently
+        """
+        self.__capacity = capacity
+        self.__running = 0
+        self.__waiting = []                 # a heap of tuples (negative priority, sequence number, future)
+        self.__sequence = itertools.count()    # keeps the order of methods with the same priority
+
+    async def run(self, priority, awaitable):
+        """Awaits the given awaitable, as soon as a slot is free and no waiting
+        awaitable has a higher priority.
+
+        :param priority: a number, larger values mean higher priority
+        :param awaitable: the awaitable, that passes a method to the pool
+        :returns: the return value of the awaitable
+        """
+        if self.__running < self.__capacity:
+            self.__running += 1
+        else:
+            slot = asyncio.get_running_loop().create_future()
+            heapq.heappush(self.__waiting, (-priority, next(self.__sequence), slot))
+            try:
+                await slot          # the slot is handed over by the finishing method
+            except asyncio.CancelledError:
+                if slot.done() and not slot.cancelled():    # the slot has been handed over, before the cancellation
+                    self.__release()
+                if asyncio.iscoroutine(awaitable):
+                    awaitable.close()   # avoids the warning about a coroutine, that has never been awaited
+                raise
+        try:
+            return await awaitable
+        finally:
+            self.__release()
+
+    def __release(self):
+        """Hands the slot of a finished method over to the waiting method with
+        the highest priority or frees it, if no method is waiting.
+        """
+        while self.__waiting:
+            _, _, slot = heapq.heappop(self.__waiting)
+            if not slot.done():
+                slot.set_result(None)
+                return
+        self.__running -= 1
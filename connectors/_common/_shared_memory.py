@@ -0,0 +1,171 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the helper functions for passing large buffers to and from worker
+processes through shared memory segments instead of pickling them.
+
+The main process owns all segments: it destroys the segments of the arguments,
+when a call has finished, and the segments of the results, when the NumPy arrays,
+that have been created on top of them, are garbage collected. The worker processes
+only close their handles of the segments.
+"""
+
+import multiprocessing.resource_tracker
+import multiprocessing.shared_memory
+import os
+import weakref
+
+__all__ = ()
+
+
+_SHARED_MEMORY_THRESHOLD = 2 ** 16  # buffers with less bytes are cheaper to pickle than to pass through shared memory
+_detached_segments = []             # shared memory segments, which are no longer used, but which could not be closed yet
+
+
+class _SharedMemoryReference:
+    """A picklable placeholder for a buffer, that has been copied to a shared memory segment."""
+
+    def __init__(self, name, size, dtype=None, shape=None, format=None):     # pylint: disable=redefined-builtin # the parameter is named after the attribute of memoryview objects
+        """
+        :param name: the name of the shared memory segment
+        :param size: the number of bytes of the buffer
+        :param dtype: the NumPy dtype, if the buffer is a NumPy array, None otherwise
+        :param shape: the shape of the NumPy array or the memoryview
+        :param format: the format of the memoryview, or None, if the buffer is not a memoryview
+        """
+        self.name = name
+        self.size = size
+        self.dtype = dtype
+        self.shape = shape
+        self.format = format
+
+
+def _share(value):
+    """Copies the given value to a newly created shared memory segment, if it is
+    a large enough NumPy array, ``bytes`` or ``memoryview`` object.
+
+    :param value: the value, that shall be shared
+    :returns: a tuple with a :class:`_SharedMemoryReference` and the segment, or
+              the unchanged value and None, if the value cannot be shared
+    """
+    type_ = type(value)
+    if type_ is bytes:
+        if len(value) < _SHARED_MEMORY_THRESHOLD:
+            return value, None
+        data = value
+        reference = _SharedMemoryReference(name=None, size=len(value))
+    elif type_ is memoryview:
+        if value.nbytes < _SHARED_MEMORY_THRESHOLD or not value.c_contiguous:
+            return value, None
+        data = value.cast("B")
+        reference = _SharedMemoryReference(name=None, size=value.nbytes, shape=value.shape, format=value.format)
+    elif type_.__name__ == "ndarray" and type_.__module__ == "numpy":   # the type is checked by its name, so NumPy does not have to be imported
+        if value.nbytes < _SHARED_MEMORY_THRESHOLD or value.dtype.hasobject or not value.flags.c_contiguous:
+            return value, None
+        data = value.reshape(-1).view("u1")
+        reference = _SharedMemoryReference(name=None, size=value.nbytes, dtype=value.dtype, shape=value.shape)
+    else:
+        return value, None
+    _close_detached_segments()
+    segment = multiprocessing.shared_memory.SharedMemory(create=True, size=reference.size)
+    segment.buf[0:reference.size] = data
+    reference.name = segment.name
+    return reference, segment
+
+
+def _attach(value, unlink):
+    """Replaces a :class:`_SharedMemoryReference` with the object, that has been
+    copied to the shared memory segment.
+    NumPy arrays are not copied, but they are created on top of the shared memory,
+    so that the segment lives as long as the array. ``bytes`` and ``memoryview``
+    objects are copied out of the segment.
+
+    :param value: a :class:`_SharedMemoryReference` or any other value, which is
+                  returned unchanged
+    :param unlink: True, if the segment shall be destroyed, when it is no longer
+                   needed, False, if another process is responsible for that
+    :returns: the shared object
+    """
+    if not isinstance(value, _SharedMemoryReference):
+        return value
+    _close_detached_segments()
+    segment = multiprocessing.shared_memory.SharedMemory(name=value.name)
+    if value.dtype is None:
+        data = bytes(segment.buf[0:value.size])
+        segment.close()
+        if unlink:
+            segment.unlink()
+        if value.format is None:
+            return data
+        return memoryview(data).cast(value.format, value.shape)
+    else:
+        import numpy    # pylint: disable=import-outside-toplevel # NumPy is an optional dependency, which has already been imported, if a NumPy array has been shared
+        array = numpy.ndarray(shape=value.shape, dtype=value.dtype, buffer=segment.buf)
+        weakref.finalize(array, _detach_segment, segment, unlink)
+        return array
+
+
+def _detach_segment(segment, unlink):
+    """Is called, when a NumPy array, that has been created on top of a shared
+    memory segment, is garbage collected.
+    Since the array has not released the segment's buffer at this point, the
+    segment is only closed by a subsequent call of :func:`_close_detached_segments`.
+
+    :param segment: the :class:`multiprocessing.shared_memory.SharedMemory` instance
+    :param unlink: True, if the segment shall be destroyed, False otherwise
+    """
+    if unlink:
+        try:
+            segment.unlink()
+        except FileNotFoundError:
+            pass
+    _detached_segments.append(segment)
+
+
+def _close_detached_segments():
+    """Closes the segments, whose NumPy arrays have been garbage collected."""
+    for segment in tuple(_detached_segments):
+        try:
+            segment.close()
+        except BufferError:     # the buffer of the segment is still exported by the array
+            pass
+        else:
+            _detached_segments.remove(segment)
+
+
+def _published_call(function, *args, **kwargs):
+    """A helper function, that is passed to the worker processes for executing
+    the given function and copying its return value to shared memory.
+
+    :param function: the function, that shall be executed
+    :param `*args,**kwargs`: arguments for the function
+    :returns: a :class:`_SharedMemoryReference` or the return value of the function,
+              if it cannot be shared
+    """
+    reference, segment = _share(function(*args, **kwargs))
+    if segment is not None:
+        segment.close()     # the segment is unlinked by the main process, when the result is no longer needed
+    return reference
+
+
+def _start_resource_tracker():
+    """Makes sure, that the resource tracker, which cleans up leaked shared memory
+    segments, is running, before the worker processes are started.
+    Otherwise, forked worker processes would start their own resource trackers,
+    which would destroy the segments of the results, when the workers are shut down.
+    """
+    if os.name == "posix":
+        multiprocessing.resource_tracker.ensure_running()
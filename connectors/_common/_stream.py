@@ -0,0 +1,349 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the :class:`~connectors.Stream` class for passing data in chunks
+through a processing chain
+"""
+
+import collections
+import functools
+import threading
+from ._flags import BufferPolicy
+
+__all__ = ("BufferedStream", "BufferStatistics", "Stream", "streaming_method")
+
+_END = object()     # a marker, that is returned by a buffer, when the producer has finished
+
+BufferStatistics = collections.namedtuple("BufferStatistics",
+                                          ("depth", "max_depth", "produced", "consumed", "dropped", "coalesced"))
+BufferStatistics.__doc__ = """The statistics of a :class:`~connectors.BufferedStream`:
+
+* depth: the number of chunks, that are currently buffered
+* max_depth: the largest number of chunks, that have been buffered at the same time
+* produced: the number of chunks, that have been produced
+* consumed: the number of chunks, that have been taken from the buffer by the consumer
+* dropped: the number of chunks, that have been discarded by the :attr:`~connectors.BufferPolicy.DROP` policy
+* coalesced: the number of chunks, that have been merged into other chunks by
+  the :attr:`~connectors.BufferPolicy.COALESCE` policy
+"""
+
+
+class Stream:
+    """A sequence of chunks (e.g. blocks of samples), that is passed through the
+    connections of a processing chain instead of a whole data set.
+
+    The chunks are not stored in the stream. Instead, every iteration over the
+    stream calls a function, that produces the chunks anew, usually a generator
+    function. So the memory consumption of a processing chain, whose stages
+    consume and produce streams chunk by chunk, does not depend on the length
+    of the data, and the stream can be iterated over as often as necessary.
+
+    Streams are returned by the getters of streaming output connectors (see the
+    ``streaming`` parameter of the :class:`~connectors.Output` decorator).
+    Since the chunks are produced during the iteration, the producing functions
+    use the parameters of their instances at the time of the iteration.
+
+    If ``prefetch`` is greater than zero, the chunks are produced in a separate
+    thread, which runs ahead of the consuming iteration by at most that number
+    of chunks. This way, the stages of a processing chain, whose streams are
+    prefetched, work on consecutive chunks concurrently.
+    """
+
+    def __init__(self, function, *args, prefetch=0, **kwargs):
+        """
+        :param function: a function, that returns an iterable of chunks, such as
+                         a generator function
+        :param `*args,**kwargs`: arguments for the function
+        :param prefetch: the maximum number of chunks, that are produced in a
+                         separate thread ahead of the iteration, or 0 to produce
+                         the chunks in the iterating thread
+        """
+        self.__function = function
+        self.__args = args
+        self.__kwargs = kwargs
+        self.__prefetch = prefetch
+
+    @classmethod
+    def chunks(cls, data, size):
+        """Creates a stream, that splits the given data into chunks.
+
+        :param data: a sliceable sequence such as a NumPy array or a list
+        :param size: the number of elements per chunk. The last chunk can be shorter
+        :returns: a :class:`~connectors.Stream` instance
+        """
+        return cls(_slices, data, size)
+
+    def buffered(self, capacity=1, policy=BufferPolicy.BLOCK, coalesce=None):
+        """Creates a stream, whose chunks are produced by iterating over this
+        stream in a separate thread and passed to the consumer through a bounded
+        buffer. See :class:`~connectors.BufferedStream` for details.
+
+        :param capacity: the maximum number of buffered chunks
+        :param policy: a flag of :class:`~connectors.BufferPolicy`, that specifies
+                       the behavior, when the buffer is full
+        :param coalesce: a function, that merges two chunks for the
+                         :attr:`~connectors.BufferPolicy.COALESCE` policy, or None
+                         for concatenating them
+        :returns: a :class:`~connectors.BufferedStream` instance
+        """
+        return BufferedStream(self, capacity=capacity, policy=policy, coalesce=coalesce)
+
+    def __iter__(self):
+        """Calls the function of the stream, which produces the chunks.
+
+        :returns: an iterator over the chunks
+        """
+        chunks = self.__function(*self.__args, **self.__kwargs)
+        if self.__prefetch > 0:
+            return _buffered(chunks, _Buffer(self.__prefetch, BufferPolicy.BLOCK, None, _Metrics()))
+        return iter(chunks)
+
+
+class BufferedStream(Stream):
+    """A stream, whose chunks are produced by iterating over another stream (or
+    any other iterable of chunks) in a separate thread, while the consumer takes
+    them from a bounded buffer.
+
+    The capacity of the buffer limits the number of chunks, that are held in memory
+    between the producer and the consumer. When the buffer is full, the policy
+    decides, whether the producer waits for the consumer (backpressure), or if
+    chunks are dropped or merged. Every iteration has its own buffer, while the
+    :meth:`statistics` about the depth of the buffers and the passed chunks are
+    collected for all iterations.
+    """
+
+    def __init__(self, stream, capacity=1, policy=BufferPolicy.BLOCK, coalesce=None):
+        """
+        :param stream: a :class:`~connectors.Stream` or another iterable of chunks
+        :param capacity: the maximum number of buffered chunks
+        :param policy: a flag of :class:`~connectors.BufferPolicy`, that specifies
+                       the behavior, when the buffer is full
+        :param coalesce: a function, that takes two chunks and returns a merged
+                         chunk for the :attr:`~connectors.BufferPolicy.COALESCE`
+                         policy, or None for concatenating them (with
+                         :func:`numpy.concatenate` for NumPy arrays and with the
+                         ``+`` operator otherwise)
+        """
+        if capacity < 1:
+            raise ValueError("The capacity of a buffer must be at least 1.")
+        Stream.__init__(self, iter, stream)
+        self.__capacity = capacity
+        self.__policy = policy
+        self.__coalesce = _concatenate if coalesce is None else coalesce
+        self.__metrics = _Metrics()
+
+    def statistics(self):
+        """Returns the statistics about the buffers of this stream.
+
+        :returns: a :class:`~connectors._common._stream.BufferStatistics` tuple
+        """
+        return self.__metrics.statistics()
+
+    def __iter__(self):
+        """Starts the thread, that produces the chunks, and returns an iterator,
+        which takes them from the buffer.
+
+        :returns: an iterator over the chunks
+        """
+        buffer = _Buffer(self.__capacity, self.__policy, self.__coalesce, self.__metrics)
+        return _buffered(Stream.__iter__(self), buffer)
+
+
+def streaming_method(method, prefetch=0):
+    """Wraps the getter method of a streaming output connector, so that it returns
+    a :class:`~connectors.Stream` instead of the chunks.
+
+    :param method: the unbound getter method, that returns an iterable of chunks
+    :param prefetch: the maximum number of chunks, that are produced ahead of
+                     the iteration. See :class:`~connectors.Stream` for details
+    :returns: the wrapped method
+    """
+    @functools.wraps(method)
+    def wrapper(instance):
+        return Stream(method, instance, prefetch=prefetch)
+    return wrapper
+
+
+class _Metrics:
+    """Collects the statistics of the buffers of a stream."""
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__depth = 0
+        self.__max_depth = 0
+        self.__counts = collections.Counter()
+
+    def record(self, depth=0, **counts):
+        """Updates the statistics.
+
+        :param depth: the change of the number of buffered chunks
+        :param `**counts`: the increments of the counters ``produced``, ``consumed``,
+                           ``dropped`` and ``coalesced``
+        """
+        with self.__lock:
+            self.__depth += depth
+            self.__max_depth = max(self.__max_depth, self.__depth)
+            self.__counts.update(counts)
+
+    def statistics(self):
+        """Returns a snapshot of the statistics.
+
+        :returns: a :class:`BufferStatistics` tuple
+        """
+        with self.__lock:
+            return BufferStatistics(depth=self.__depth, max_depth=self.__max_depth,
+                                    produced=self.__counts["produced"], consumed=self.__counts["consumed"],
+                                    dropped=self.__counts["dropped"], coalesced=self.__counts["coalesced"])
+
+
+class _Buffer:
+    """A bounded queue between the thread, that produces the chunks of a stream,
+    and the consuming iteration.
+    """
+
+    def __init__(self, capacity, policy, coalesce, metrics):
+        """
+        :param capacity: the maximum number of buffered chunks
+        :param policy: a flag of :class:`~connectors.BufferPolicy`
+        :param coalesce: a function for merging two chunks or None
+        :param metrics: a :class:`_Metrics` instance
+        """
+        self.__capacity = capacity
+        self.__policy = policy
+        self.__coalesce = coalesce
+        self.__metrics = metrics
+        self.__chunks = collections.deque()
+        self.__condition = threading.Condition()
+        self.__finished = False
+        self.__error = None
+        self.__closed = False   # is True, when the consumer has stopped the iteration
+
+    def put(self, chunk):
+        """Is called by the producer to add a chunk to the buffer.
+
+        :param chunk: the chunk
+        :returns: False, if the consumer has stopped the iteration, True otherwise
+        """
+        with self.__condition:
+            if self.__policy == BufferPolicy.BLOCK:
+                while len(self.__chunks) >= self.__capacity and not self.__closed:
+                    self.__condition.wait()
+            if self.__closed:
+                return False
+            if len(self.__chunks) < self.__capacity:
+                self.__chunks.append(chunk)
+                self.__metrics.record(depth=1, produced=1)
+            elif self.__policy == BufferPolicy.DROP:
+                self.__chunks.popleft()
+                self.__chunks.append(chunk)
+                self.__metrics.record(produced=1, dropped=1)
+            else:
+                self.__chunks[-1] = self.__coalesce(self.__chunks[-1], chunk)
+                self.__metrics.record(produced=1, coalesced=1)
+            self.__condition.notify_all()
+            return True
+
+    def finish(self, error=None):
+        """Is called by the producer, when all chunks have been produced.
+
+        :param error: an exception, that has been raised by the producer, or None
+        """
+        with self.__condition:
+            self.__finished = True
+            self.__error = error
+            self.__condition.notify_all()
+
+    def get(self):
+        """Is called by the consumer to take the oldest chunk from the buffer.
+        Raises the exception of the producer, if it has failed.
+
+        :returns: the chunk or :data:`_END`, if all chunks have been consumed
+        """
+        with self.__condition:
+            while not self.__chunks and not self.__finished:
+                self.__condition.wait()
+            if self.__chunks:
+                self.__metrics.record(depth=-1, consumed=1)
+                self.__condition.notify_all()
+                return self.__chunks.popleft()
+            if self.__error is not None:
+                raise self.__error
+            return _END
+
+    def close(self):
+        """Is called by the consumer, when it stops the iteration, so that the
+        producer stops, too.
+        """
+        with self.__condition:
+            self.__closed = True
+            self.__metrics.record(depth=-len(self.__chunks))
+            self.__chunks.clear()
+            self.__condition.notify_all()
+
+
+def _buffered(chunks, buffer):
+    """A generator, that produces the chunks of the given iterable in a separate
+    thread and yields them from the given buffer.
+
+    :param chunks: an iterable of chunks
+    :param buffer: a :class:`_Buffer` instance
+    """
+    def produce():
+        iterator = iter(chunks)
+        try:
+            for chunk in iterator:
+                if not buffer.put(chunk):
+                    return
+            buffer.finish()
+        except BaseException as e:     # pylint: disable=broad-except # the exception is raised again in the consuming thread
+            buffer.finish(e)
+        finally:
+            if hasattr(iterator, "close"):
+                iterator.close()
+
+    threading.Thread(target=produce, name="connectors-stream", daemon=True).start()
+    try:
+        while True:
+            chunk = buffer.get()
+            if chunk is _END:
+                return
+            yield chunk
+    finally:
+        buffer.close()
+
+
+def _slices(data, size):
+    """A generator, that splits the given data into chunks.
+
+    :param data: a sliceable sequence
+    :param size: the number of elements per chunk
+    """
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+def _concatenate(first, second):
+    """The default function for merging two chunks with the :attr:`~connectors.BufferPolicy.COALESCE` policy.
+
+    :param first: the older chunk
+    :param second: the newer chunk
+    :returns: the concatenation of both chunks
+    """
+    type_ = type(first)
+    if type_.__name__ == "ndarray" and type_.__module__ == "numpy":     # the type is checked by its name, so NumPy does not have to be imported
+        import numpy    # pylint: disable=import-outside-toplevel # NumPy is an optional dependency, which has already been imported, if a NumPy array has been produced
+        return numpy.concatenate((first, second))
+    return first + second
@@ -0,0 +1,302 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the locks of the processing networks and the shared in-flight
+computations of the thread-safe mode"""
+
+import concurrent.futures
+import functools
+import threading
+import weakref
+
+__all__ = ("ThreadSafety", "thread_safety", "guarded", "set_thread_safety")
+
+
+class _Network:
+    """A node in the disjoint-set forest of the processing networks. The root
+    node of a network stores, which thread is computing a result of it.
+    """
+
+    def __init__(self):
+        self.parent = None  # the parent node or None, if this node is a root. Referencing the node itself would create a reference cycle
+        self.size = 1       # the number of instances in the network, if this node is a root
+        self.owner = None   # the identifier of the thread, that has acquired the network
+        self.depth = 0      # counts, how often the owner has acquired the network
+
+
+class ThreadSafety:
+    """Serializes the access to the processing networks, when they are used by
+    multiple threads, and lets concurrent requests for the same result share one
+    in-flight computation (*single-flight*).
+
+    The connectors' protocol for announcing, notifying and requesting value changes
+    runs in an event loop, that is created for the respective computation. Since
+    the state of the connectors is not meant to be shared between event loops,
+    a request acquires the lock of the processing network, to which the requested
+    connector belongs, so that requests for unrelated networks are computed in
+    parallel. The networks are tracked by the instances, whose methods have been
+    replaced by connectors. Connecting two instances merges their networks, while
+    disconnecting them does not split the network again.
+
+    The methods, that change the parameters or the topology of the networks (see
+    :func:`guarded`), acquire an exclusive lock, which waits for the running
+    requests of other threads to finish and which keeps new requests waiting,
+    until the change is done.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.__condition = threading.Condition()
+        self.__networks = {}                    # maps the ids of the instances to their nodes in the forest
+        self.__busy = set()                     # the root nodes of the networks, that have been acquired by a thread
+        self.__exclusive = None                 # the identifier of the thread, that holds the exclusive lock
+        self.__exclusive_depth = 0              # counts, how often that thread has acquired the exclusive lock
+        self.__waiting = 0                      # the number of threads, that are waiting for the exclusive lock
+        self.__held = threading.local()         # counts, how many networks the current thread has acquired
+        self.__flights = {}                     # maps keys to the futures of the in-flight computations
+        self.__flights_lock = threading.Lock()
+
+    def __enter__(self):
+        """Acquires the exclusive lock."""
+        me = threading.get_ident()
+        with self.__condition:
+            if self.__exclusive != me:
+                self.__waiting += 1
+                try:
+                    self.__condition.wait_for(lambda: self.__exclusive is None
+                                              and all(n.owner == me for n in self.__busy))
+                finally:
+                    self.__waiting -= 1
+                self.__exclusive = me
+            self.__exclusive_depth += 1
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Releases the exclusive lock."""
+        with self.__condition:
+            self.__exclusive_depth -= 1
+            if self.__exclusive_depth == 0:
+                self.__exclusive = None
+                self.__condition.notify_all()
+
+    def connected(self, instance1, instance2):
+        """Is called, when connectors of the two given instances have been connected,
+        so that both instances belong to the same processing network afterwards.
+        The networks are merged regardless of whether the thread-safe mode is
+        enabled, so that it can be enabled after the networks have been created.
+
+        :param instance1: the instance of the one connector
+        :param instance2: the instance of the other connector
+        """
+        with self.__condition:
+            root1 = self.__find(instance1)
+            root2 = self.__find(instance2)
+            if root1 is root2:
+                return
+            if root1.size < root2.size:
+                root1, root2 = root2, root1
+            root2.parent = root1
+            root1.size += root2.size
+            if root2.owner is not None:     # only the thread, that holds the exclusive lock, can own a network at this point
+                self.__busy.discard(root2)
+                self.__busy.add(root1)
+                root1.owner = root2.owner
+                root1.depth += root2.depth
+
+    def acquire(self, instance, blocking=True):
+        """Acquires the lock of the processing network, to which the given instance
+        belongs. The lock is re-entrant for the thread, that has acquired it.
+
+        :param instance: the instance of a connector in the network
+        :param blocking: True, if this method shall wait for the lock, False, if
+                         it shall return immediately, when the lock is held by
+                         another thread
+        :returns: True, if the lock has been acquired, False otherwise
+        """
+        me = threading.get_ident()
+        with self.__condition:
+            held = getattr(self.__held, "value", 0)
+
+            def available():
+                root = self.__find(instance)
+                if me in (root.owner, self.__exclusive):
+                    return True
+                if self.__exclusive is not None or root.owner is not None:
+                    return False
+                return held or not self.__waiting   # waiting changes have precedence over new requests
+            if not available():
+                if not blocking:
+                    return False
+                self.__condition.wait_for(available)
+            root = self.__find(instance)
+            root.owner = me
+            root.depth += 1
+            self.__busy.add(root)
+            self.__held.value = held + 1
+            return True
+
+    def release(self, instance):
+        """Releases the lock of the processing network, to which the given instance
+        belongs.
+
+        :param instance: the instance of a connector in the network
+        """
+        with self.__condition:
+            root = self.__find(instance)
+            root.depth -= 1
+            self.__held.value -= 1
+            if root.depth == 0:
+                root.owner = None
+                self.__busy.discard(root)
+                self.__condition.notify_all()
+
+    def run(self, key, instance, executor, function, *args, **kwargs):
+        """Calls the given function, while holding the lock of the processing
+        network, to which the given instance belongs.
+        If another thread is already executing a call with the same key, the
+        result of that call is awaited and returned instead.
+
+        :param key: a hashable key, that identifies the result of the function
+                    or None, if the result must not be shared with concurrent calls
+        :param instance: the instance of the requested connector
+        :param executor: the :class:`~connectors._common._executors.Executor`,
+                         that shall be used for the computation. If it is already
+                         used by another thread, the function is called with a
+                         copy of it.
+        :param function: the function, which takes the executor as first parameter
+        :param `*args,**kwargs`: further arguments for the function
+        :returns: the return value of the function
+        """
+        if key is None or getattr(self.__held, "value", 0):    # re-entrant calls must not wait for a flight, which might be waiting for a lock of this thread
+            return self.__run(instance, executor, function, *args, **kwargs)
+        with self.__flights_lock:
+            flight = self.__flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.__flights[key] = concurrent.futures.Future()
+        if not leader:
+            return flight.result()
+        try:
+            result = self.__run(instance, executor, function, *args, **kwargs)
+        except BaseException as e:
+            self.__land(key)
+            flight.set_exception(e)
+            raise
+        self.__land(key)
+        flight.set_result(result)
+        return result
+
+    def __run(self, instance, executor, function, *args, **kwargs):
+        """Calls the given function with an executor, that is not used by other
+        threads, while holding the lock of the instance's processing network.
+
+        :param instance: the instance of the requested connector
+        :param executor: the executor of the requested connector
+        :param function: the function, which takes the executor as first parameter
+        :param `*args,**kwargs`: further arguments for the function
+        :returns: the return value of the function
+        """
+        self.acquire(instance)
+        try:
+            claimed = executor._claim()     # pylint: disable=protected-access # the executors are claimed by the thread-safe mode only
+            try:
+                return function(claimed, *args, **kwargs)
+            finally:
+                if claimed is executor:
+                    executor._release()     # pylint: disable=protected-access # see above
+        finally:
+            self.release(instance)
+
+    def __find(self, instance):
+        """Returns the root node of the processing network, to which the given
+        instance belongs. Must be called, while holding the condition's lock.
+
+        :param instance: the instance
+        :returns: a :class:`_Network` node
+        """
+        key = id(instance)
+        node = self.__networks.get(key)
+        if node is None:
+            node = self.__networks[key] = _Network()
+            weakref.finalize(instance, self.__forget, key)
+            return node
+        while node.parent is not None:
+            if node.parent.parent is not None:
+                node.parent = node.parent.parent    # path halving keeps the trees flat
+            node = node.parent
+        return node
+
+    def __forget(self, key):
+        """Is called, when an instance has been garbage collected, so that its id
+        can be reused by other instances.
+
+        :param key: the id of the instance
+        """
+        with self.__condition:
+            del self.__networks[key]
+
+    def __land(self, key):
+        """Removes a finished flight, so that subsequent calls start a new computation.
+
+        :param key: the key of the flight
+        """
+        with self.__flights_lock:
+            del self.__flights[key]
+
+
+thread_safety = ThreadSafety()  # the process-wide instance, that is used by all connectors
+
+
+def guarded(method):
+    """A decorator for the methods of the connectors, which are called from outside
+    the *Connectors* package and which change the state of the processing network.
+    In the thread-safe mode, the decorated method is executed, while holding the
+    exclusive lock of :data:`thread_safety`.
+
+    :param method: the method
+    :returns: the wrapped method
+    """
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        if thread_safety.enabled:
+            with thread_safety:
+                return method(*args, **kwargs)
+        return method(*args, **kwargs)
+    return wrapper
+
+
+def set_thread_safety(enabled):
+    """Enables or disables the thread-safe mode, in which the connectors can be
+    called concurrently from multiple threads, for example, to serve the results
+    of one processing network in a multi-threaded server.
+
+    In the thread-safe mode, the calls of the connectors, that change the parameters
+    or the topology of a processing network, are serialized with a process-wide
+    lock. Requests for results lock only the processing network, to which the
+    requested connector belongs, so that unrelated networks are computed in parallel.
+    If two concurrent requests use the same executor, the second one computes
+    its result with a temporary copy of it. Concurrent requests for the same result
+    of an output connector share one computation, so that the result is not computed
+    twice. The executors can still parallelize the computations, that are caused
+    by a request, but the methods, which are executed in the threads or processes
+    of an executor, must not call the connectors themselves.
+
+    The thread-safe mode adds a small overhead to every call of a connector, so
+    it is disabled by default. It should be enabled, before multiple threads start
+    using the connectors.
+
+    :param enabled: True, if the thread-safe mode shall be enabled, False otherwise
+    """
+    thread_safety.enabled = enabled
@@ -0,0 +1,45 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the :class:`~connectors._common._topology.Topology` class, which tracks
+changes of the connections between the connectors.
+"""
+
+__all__ = ("Topology", "topology")
+
+
+class Topology:
+    """Counts the changes of the connections between the connectors, so that
+    objects, which depend on the structure of a processing network, such as the
+    :class:`~connectors.connectors.ExecutionPlan`, can detect, that they are outdated.
+    """
+
+    def __init__(self):
+        self.__version = 0
+
+    def changed(self):
+        """Is called by the input connectors, when they are connected or disconnected."""
+        self.__version += 1
+
+    def version(self):
+        """Returns a number, that changes, whenever connectors are connected or disconnected.
+
+        :returns: an integer
+        """
+        return self.__version
+
+
+topology = Topology()   # the process-wide instance, that is used by all connectors
@@ -0,0 +1,121 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the :class:`~connectors._common._tracing.Trace` class, which records
+the executions of the connectors in the trace event format.
+"""
+
+import json
+import os
+import threading
+import time
+from ._profiling import describe, profiler
+
+__all__ = ("Trace", "trace")
+
+
+def trace(path):
+    """Creates a context manager, that records the executions of all getter and
+    setter methods inside the ``with`` block and writes them to a file in the
+    *trace event* format::
+
+       with connectors.trace("pipeline.json"):
+           result = sink.get_result()
+
+    The file can be loaded in trace viewers like *Perfetto* (https://ui.perfetto.dev)
+    or the ``chrome://tracing`` page of Chromium based browsers. Every execution
+    is shown as a bar on the timeline of the thread and the process, in which it
+    has taken place, so that it becomes visible, which computations have overlapped,
+    where the computations have been serialized and when the workers of the
+    executor have been idle. The bars are labeled with the qualified name of the
+    method and contain the identification of the instance, as well as the time,
+    that the method has waited for a free thread or process. The cache hits and
+    misses of the output connectors are recorded as instant events.
+
+    :param path: the path of the file, to which the trace shall be written
+    :returns: a :class:`~connectors._common._tracing.Trace` instance
+    """
+    return Trace(path)
+
+
+class Trace:
+    """A context manager, that is returned by :func:`connectors.trace`."""
+
+    def __init__(self, path):
+        """
+        :param path: the path of the file, to which the trace shall be written
+        """
+        self.__path = path
+        self.__lock = threading.Lock()
+        self.__records = []
+        self.__origin = None
+
+    def __enter__(self):
+        """Starts recording the executions.
+
+        :returns: this trace
+        """
+        with self.__lock:
+            self.__records.clear()
+        self.__origin = time.perf_counter()
+        profiler.add_hook(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stops recording and writes the trace to the file."""
+        profiler.remove_hook(self)
+        with self.__lock:
+            records, self.__records = self.__records, []
+        with open(self.__path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.__events(records), "displayTimeUnit": "ms"}, f)
+
+    def __call__(self, record):
+        """Is called by the :class:`~connectors._common._profiling.Profiler` for
+        every execution of a method and every cache lookup.
+
+        :param record: a :class:`~connectors._common._profiling.ProfilingRecord`
+        """
+        with self.__lock:
+            self.__records.append((record, describe(record)))
+
+    def __events(self, records):
+        """Converts the recorded executions to trace events.
+
+        :param records: a sequence of tuples with a :class:`~connectors._common._profiling.ProfilingRecord`
+                        and the labels, that have been created with :func:`~connectors._common._profiling.describe`
+        :returns: a list of dictionaries
+        """
+        events = []
+        for pid in sorted({r.process_id for r, _ in records}):
+            name = "main process" if pid == os.getpid() else "worker process"
+            events.append({"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": f"{name} {pid}"}})
+        for record, (connector, instance) in sorted(records, key=lambda r: r[0].start):
+            event = {"name": connector,
+                     "cat": record.event,
+                     "ts": (record.start - self.__origin) * 1e6,
+                     "pid": record.process_id,
+                     "tid": record.thread_id,
+                     "args": {"instance": instance}}
+            if record.event == "call":
+                event["ph"] = "X"   # a complete event, which contains both the beginning and the duration of the execution
+                event["dur"] = record.wall_time * 1e6
+                event["args"]["cpu_time_ms"] = record.cpu_time * 1e3
+                event["args"]["queue_time_ms"] = record.queue_time * 1e3
+            else:
+                event["ph"] = "i"
+                event["s"] = "t"
+            events.append(event)
+        return events
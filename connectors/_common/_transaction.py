@@ -0,0 +1,127 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the :class:`~connectors._common._transaction.Transaction` class, which
+defers the propagation of value changes through a processing network.
+"""
+
+import threading
+from ._flags import Laziness
+from ._thread_safety import guarded
+
+__all__ = ("Transaction", "transaction")
+
+
+def transaction():
+    """Creates a context manager, in which the announcements of value changes
+    are not propagated through the processing network, until the end of the
+    ``with`` block::
+
+       with connectors.transaction():
+           source.set_frequency(1000.0)
+           source.set_amplitude(0.5)
+           source.set_phase(0.0)
+
+    Normally, every call of a setter announces the value change to all connectors
+    further down the processing network and non-lazy input connectors are executed
+    immediately (see :class:`connectors.Laziness`), so that reconfiguring several
+    parameters causes multiple announcement passes and re-computations. Inside
+    a transaction, the setters only notify the output connectors of their own
+    instance. At the end of the transaction, the announcements of all changed
+    output connectors are propagated in one pass and the non-lazy input connectors
+    are executed once.
+
+    Results, which are retrieved inside the transaction, reflect the parameter
+    changes only in the instances, whose setters have been called, but not further
+    down the processing network. Transactions can be nested, in which case the
+    propagation is deferred until the end of the outermost transaction. Transactions
+    only affect the setters, that are called in the same thread.
+
+    :returns: a :class:`~connectors._common._transaction.Transaction` instance
+    """
+    return Transaction()
+
+
+class Transaction:
+    """A context manager, that is returned by :func:`connectors.transaction`."""
+
+    __state = threading.local()     # stores the outermost active transaction of each thread
+
+    def __init__(self):
+        self.__outputs = {}         # is used as an ordered set of the output connectors, whose announcements have been deferred
+        self.__inputs = set()       # the non-lazy input connectors, whose execution has been deferred
+        self.__executor = None      # the executor for the deferred execution of the non-lazy inputs
+        self.__outermost = False
+
+    def __enter__(self):
+        """Starts the transaction.
+
+        :returns: this transaction
+        """
+        if Transaction.active() is None:
+            Transaction.__state.active = self
+            self.__outermost = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Ends the transaction and propagates the deferred announcements, if this
+        is the outermost transaction.
+        """
+        if self.__outermost:
+            self.__outermost = False
+            Transaction.__state.active = None
+            self.__commit()
+
+    @staticmethod
+    def active():
+        """Returns the transaction, that is active in the current thread.
+
+        :returns: a :class:`~connectors._common._transaction.Transaction` instance or None
+        """
+        return getattr(Transaction.__state, "active", None)
+
+    def defer_announcement(self, connector):
+        """Is called by output connectors, which would otherwise forward an announcement
+        to their connected input connectors.
+
+        :param connector: the output connector
+        """
+        self.__outputs[connector] = None
+
+    def defer_execution(self, non_lazy_inputs, executor):
+        """Is called by :class:`~connectors._common._non_lazy_inputs.NonLazyInputs`
+        containers, which would otherwise execute their input connectors.
+
+        :param non_lazy_inputs: the container
+        :param executor: the :class:`~connectors._common._executors.Executor` instance,
+                         with which the input connectors shall be executed
+        """
+        self.__inputs.update(non_lazy_inputs)
+        if self.__executor is None:
+            self.__executor = executor
+
+    @guarded
+    def __commit(self):
+        """Propagates the deferred announcements and executes the non-lazy input connectors."""
+        from ._non_lazy_inputs import NonLazyInputs    # pylint: disable=import-outside-toplevel,cyclic-import # the non-lazy inputs also need to know the transactions
+        non_lazy_inputs = NonLazyInputs(Laziness.ON_ANNOUNCE)
+        for connector in self.__outputs:
+            connector._commit_announcement(non_lazy_inputs)     # pylint: disable=protected-access # this method is only meant to be called by the transaction
+        non_lazy_inputs.update(self.__inputs)
+        self.__outputs.clear()
+        self.__inputs.clear()
+        if self.__executor is not None:
+            non_lazy_inputs.execute(self.__executor)
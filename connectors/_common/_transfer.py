@@ -0,0 +1,142 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the :class:`~connectors._common._transfer._Transfer` class, that
+passes the data for the execution of a method to and from a worker process.
+"""
+
+import functools
+from ._profiling import timed_call
+from ._shared_memory import _attach, _published_call, _share
+
+__all__ = ()
+
+
+class _MethodError(Exception):
+    """Is raised in a worker process, when the executed method has raised an
+    exception, so that it can be distinguished from the errors, that are caused
+    by passing the data to and from the worker process.
+    """
+
+    def __init__(self, exception):
+        """
+        :param exception: the exception, that has been raised by the method
+        """
+        Exception.__init__(self, exception)
+        self.exception = exception
+
+
+def _guarded_call(function, *args, **kwargs):
+    """A helper function, that is passed to the worker processes for executing
+    the given function and wrapping the exceptions, that it raises, in a
+    :class:`_MethodError`.
+
+    :param function: the function, that shall be executed
+    :param `*args,**kwargs`: arguments for the function
+    :returns: the return value of the function
+    """
+    try:
+        return function(*args, **kwargs)
+    except Exception as e:
+        raise _MethodError(e) from e
+
+
+class _Transfer:
+    """Passes the data for the execution of a method to and from a worker process.
+    If shared memory is enabled, large buffers are copied to shared memory segments,
+    which are destroyed after the execution, while the other values are pickled
+    as usual.
+    If profiling is enabled, the execution time is measured in the worker process
+    and passed back alongside the return value.
+    """
+
+    def __init__(self, shared_memory, timed=False, guarded=False):
+        """
+        :param shared_memory: True, if large buffers shall be passed through shared
+                              memory, False, if they shall be pickled
+        :param timed: True, if the execution time shall be measured in the worker process
+        :param guarded: True, if the exceptions, that are raised by the executed
+                        function, shall be wrapped in a :class:`_MethodError`
+        """
+        self.__shared_memory = shared_memory
+        self.__timed = timed
+        self.__guarded = guarded
+        self.__segments = []
+        self.timing = None  # will be set by receive, if the execution time has been measured
+
+    def function(self, function):
+        """Wraps the given function, so that it passes its return value through
+        shared memory and measures its execution time, if requested.
+
+        :param function: a function, that is executed in a worker process
+        :returns: a picklable callable
+        """
+        if self.__guarded:
+            function = functools.partial(_guarded_call, function)
+        if self.__shared_memory:
+            function = functools.partial(_published_call, function)
+        if self.__timed:
+            function = functools.partial(timed_call, function)
+        return function
+
+    def share(self, value):
+        """Prepares a value for passing it to the worker process.
+
+        :param value: the value
+        :returns: a :class:`_SharedMemoryReference` or the unchanged value
+        """
+        if self.__shared_memory:
+            value, segment = _share(value)
+            if segment is not None:
+                self.__segments.append(segment)
+        return value
+
+    def share_all(self, values):
+        """Prepares the values of a sequence for passing them to the worker process.
+
+        :param values: a sequence of values
+        :returns: a list of :class:`_SharedMemoryReference` instances and unchanged values
+        """
+        if self.__shared_memory:
+            return [self.share(v) for v in values]
+        return values
+
+    def share_state(self, state):
+        """Prepares the values of a dictionary for passing them to the worker process.
+
+        :param state: a dictionary, such as the ``__dict__`` of an instance
+        :returns: a dictionary with the same keys
+        """
+        if self.__shared_memory:
+            return {a: self.share(v) for a, v in state.items()}
+        return state
+
+    def receive(self, value):
+        """Unwraps the return value from the worker process.
+
+        :param value: the return value of the function, that has been wrapped with :meth:`function`
+        :returns: the original return value
+        """
+        if self.__timed:
+            value, self.timing = value
+        return _attach(value, unlink=True)
+
+    def close(self):
+        """Destroys the shared memory segments, that have been created by this transfer."""
+        for segment in self.__segments:
+            segment.close()
+            segment.unlink()
+        self.__segments.clear()
@@ -0,0 +1,255 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the functions, that execute methods in thread or process pools, as
+well as the actors, which keep instances resident in long-lived worker processes.
+The functions, that are executed in the worker processes, are defined on module
+level, so that they can be pickled by reference.
+
+An actor pins an instance to one worker process of an :class:`_ActorPool`.
+The first call passes the instance's reduced state to the process, while the
+subsequent calls only pass the attributes, that have been replaced or deleted
+in the meantime. The resident instance is released in the worker process, when
+its counterpart in the main process is garbage collected.
+"""
+
+# pylint: disable=wrong-spelling-in-comment,wrong-spelling-in-docstring;    for some reason the spell checker does not recognize the word "CPU"
+
+import concurrent.futures
+import functools
+import itertools
+import os
+import time
+import weakref
+from connectors.connectors import Connector
+from ._profiling import profiler, timed_call
+from ._shared_memory import _attach
+
+__all__ = ()
+
+
+_resident_instances = {}    # maps actor ids to the instances, that are kept resident in an actor's worker process
+
+
+def _reduce_instance(instance):
+    """Creates a picklable representation of the given instance, by copying its
+    ``__dict__`` without the connectors, which cannot be pickled.
+
+    :param instance: the instance, that shall be reduced
+    :returns: a tuple with the class of the instance and the reduced ``__dict__``
+    """
+    state = instance.__dict__.copy()
+    to_remove = []
+    for a in state:
+        if isinstance(state[a], Connector):
+            to_remove.append(a)
+    for a in to_remove:
+        del state[a]
+    return instance.__class__, state
+
+
+def _redeployed_method(method_name, reduced_instance, *args, **kwargs):
+    """A helper function, that is passed to the separate processes for executing
+    the given method.
+    This function is necessary, because objects with connectors cannot be pickled,
+    so that their methods cannot be passed to a process directly. Instead only the
+    relevant data is serialized and passed to the process, where this function
+    unwraps this data and executes the method.
+    :param method_name: the string name of the method that shall be executed
+    :param reduced_instance: a tuple with the class, in which the method is defined
+                             and the ``__dict__`` of the instance of which the
+                             method shall be executed
+    :param `*args,**kwargs`: arguments for the method
+    """
+    class_, state = reduced_instance
+    instance = class_.__new__(class_)
+    instance.__dict__.update({a: _attach(v, unlink=False) for a, v in state.items()})
+    method = getattr(instance, method_name)
+    return method(*(_attach(a, unlink=False) for a in args), **kwargs)
+
+
+def _resident_method(actor_id, class_, changes, removals, method_name, *args, **kwargs):
+    """A helper function, that is passed to the worker process of an actor for
+    executing the given method on the instance, that is resident in that process.
+    Similar to :func:`_redeployed_method`, but only the changes of the instance's
+    state since the previous call are passed to the process.
+
+    :param actor_id: the ID under which the resident instance is stored in the worker process
+    :param class_: the class of the instance
+    :param changes: a dictionary with the attributes, that have changed since the previous call
+    :param removals: a sequence of names of attributes, that have been deleted since the previous call
+    :param method_name: the string name of the method that shall be executed
+    :param `*args,**kwargs`: arguments for the method
+    """
+    instance = _resident_instances.get(actor_id)
+    if instance is None:
+        instance = class_.__new__(class_)
+        _resident_instances[actor_id] = instance
+    instance.__dict__.update({a: _attach(v, unlink=False) for a, v in changes.items()})
+    for a in removals:
+        instance.__dict__.pop(a, None)
+    method = getattr(instance, method_name)
+    return method(*(_attach(a, unlink=False) for a in args), **kwargs)
+
+
+def _release_resident_instance(actor_id):
+    """A helper function, that is passed to the worker process of an actor for
+    deleting a resident instance, whose counterpart in the main process has been
+    garbage collected.
+
+    :param actor_id: the ID under which the resident instance is stored in the worker process
+    """
+    _resident_instances.pop(actor_id, None)
+
+
+class _Actor:
+    """Stores the information about an instance, that is resident in a worker process."""
+
+    def __init__(self, actor_id, worker):
+        """
+        :param actor_id: the ID under which the resident instance is stored in the worker process
+        :param worker: the single process :class:`concurrent.futures.ProcessPoolExecutor`,
+                       in which the instance is resident
+        """
+        self.actor_id = actor_id
+        self.worker = worker
+        self.state = {}         # the state of the instance, that has been passed to the worker process
+        self.finalizer = None   # will be set by the ActorPool, that creates this actor
+
+
+class _ActorPool:
+    """Manages long-lived worker processes, in which the instances, whose methods
+    shall be executed in a separate process, are kept resident.
+
+    Every instance is pinned to one of the worker processes, when one of its methods
+    is executed in a separate process for the first time. After that, only the
+    attributes of the instance's state, that have been replaced or deleted since
+    the previous call, are passed to the worker process. Changes are detected by
+    comparing the identity of the attribute values, so modifying an attribute in
+    place (e.g. writing to a NumPy array) is not detected.
+    """
+
+    def __init__(self, number_of_processes):
+        """
+        :param number_of_processes: the number of worker processes or None to take
+                                    the number of CPU cores
+        """
+        if number_of_processes is None:
+            number_of_processes = os.cpu_count()
+        self.__workers = [concurrent.futures.ProcessPoolExecutor(max_workers=1) for _ in range(number_of_processes)]
+        self.__actors = {}                  # maps the ids of the instances to _Actor instances
+        self.__ids = itertools.count()
+        self.__next_worker = itertools.cycle(self.__workers)
+
+    async def run_method(self, loop, transfer, method, instance, *args, **kwargs):
+        """Executes the given method in the worker process of the given instance.
+
+        :param loop: the event loop, in which the execution is awaited
+        :param transfer: a :class:`_Transfer` instance
+        :param method: the unbound method, that shall be executed
+        :param instance: the instance of which the method shall be executed
+        :param `*args,**kwargs`: arguments for the method
+        :returns: the return value of the method
+        """
+        actor = self.__actors.get(id(instance))
+        if actor is None:
+            actor = _Actor(actor_id=next(self.__ids), worker=next(self.__next_worker))
+            actor.finalizer = weakref.finalize(instance, self.__release, id(instance))
+            self.__actors[id(instance)] = actor
+        class_, state = _reduce_instance(instance)
+        changes = {a: v for a, v in state.items() if a not in actor.state or actor.state[a] is not v}
+        removals = [a for a in actor.state if a not in state]
+        result = await loop.run_in_executor(actor.worker,
+                                            transfer.function(_resident_method),
+                                            actor.actor_id, class_, transfer.share_state(changes), removals,
+                                            method.__name__,
+                                            *transfer.share_all(args), **kwargs)
+        actor.state = state     # the state is only updated after a successful call, so that failed transfers are repeated
+        return result
+
+    def shutdown(self, wait=True):
+        """Shuts down the worker processes and forgets all resident instances.
+
+        :param wait: True, if this method shall block until the worker processes
+                     have terminated, False otherwise
+        """
+        for actor in self.__actors.values():
+            actor.finalizer.detach()
+        self.__actors.clear()
+        for worker in self.__workers:
+            worker.shutdown(wait=wait)
+
+    def __release(self, instance_id):
+        """Is called, when an instance, that has an actor, is garbage collected.
+
+        :param instance_id: the id of the garbage collected instance
+        """
+        actor = self.__actors.pop(instance_id)
+        try:
+            actor.worker.submit(_release_resident_instance, actor.actor_id)
+        except RuntimeError:    # the worker process has already been shut down
+            pass
+
+
+async def _run_in_process(loop, executor, transfer, method, instance, *args, **kwargs):     # pylint: disable=redefined-outer-name # executor is the name, that is used throughout this module
+    """Executes the given method in a worker process.
+
+    :param loop: the event loop, in which the execution is awaited
+    :param executor: a :class:`concurrent.futures.ProcessPoolExecutor` or an
+                     :class:`_ActorPool`
+    :param transfer: a :class:`_Transfer` instance
+    :param method: the unbound method, that shall be executed
+    :param instance: the instance of which the method shall be executed
+    :param `*args,**kwargs`: arguments for the method
+    :returns: the return value of the method
+    """
+    submitted = time.perf_counter()
+    try:
+        if isinstance(executor, _ActorPool):
+            result = await executor.run_method(loop, transfer, method, instance, *args, **kwargs)
+        else:
+            class_, state = _reduce_instance(instance)
+            result = await loop.run_in_executor(executor,
+                                                transfer.function(_redeployed_method),
+                                                method.__name__,
+                                                (class_, transfer.share_state(state)),
+                                                *transfer.share_all(args), **kwargs)
+        result = transfer.receive(result)
+    finally:
+        transfer.close()
+    if transfer.timing is not None:
+        profiler.report(method, instance, submitted, transfer.timing)
+    return result
+
+
+async def _run_in_thread(loop, executor, method, instance, *args, **kwargs):   # pylint: disable=redefined-outer-name # executor is the name, that is used throughout this module
+    """Executes the given method in a thread of the given thread pool and reports
+    the execution to the profiling hooks, if profiling is active.
+
+    :param loop: the event loop, in which the execution is awaited
+    :param executor: a :class:`concurrent.futures.ThreadPoolExecutor`
+    :param method: the unbound method, that shall be executed
+    :param instance: the instance of which the method shall be executed
+    :param `*args,**kwargs`: arguments for the method
+    :returns: the return value of the method
+    """
+    if not profiler.active():
+        return await loop.run_in_executor(executor, functools.partial(method, instance, *args, **kwargs))
+    submitted = time.perf_counter()
+    result, timing = await loop.run_in_executor(executor,
+                                                functools.partial(timed_call, method, instance, *args, **kwargs))
+    profiler.report(method, instance, submitted, timing)
+    return result
@@ -25,3 +25,4 @@ from ._input import *
 from ._multiinput import *
 from ._multioutput import *
 from ._output import *
+from ._plan import *
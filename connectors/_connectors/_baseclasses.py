@@ -18,6 +18,7 @@
 
 import functools
 import weakref
+from .. import _common as common
 
 __all__ = ("Connector", "InputConnector")
 
@@ -43,6 +44,7 @@ class Connector:
         """
         self._instance = weakref.ref(instance)  # the weak reference avoids reference counting errors due to circular references
         self._method = method
+        self._coroutine = common.is_coroutine_method(method)   # is determined once, since it is needed for every execution of the method
         self._parallelization = parallelization
         self._executor = executor
         functools.update_wrapper(self, method)
@@ -57,6 +59,20 @@ class Connector:
         """
         raise NotImplementedError("This method should have been implemented in a derived class")
 
+    async def async_call(self, *args, **kwargs):
+        """Is the counterpart to calling the connector for asyncio applications.
+        The computations, that are necessary to execute the replaced method, are
+        scheduled in the event loop, that is already running, so that awaiting
+        them does not block other tasks of the application. The executor's threads
+        and processes are used for the computations as usual.
+
+        This is a virtual method which shall be overridden in a derived class.
+
+        :param `*args,**kwargs`: arguments for the replaced method
+        :returns: the return value of the replaced method
+        """
+        raise NotImplementedError("This method should have been implemented in a derived class")
+
     def connect(self, connector):
         """Abstract method that defines the interface of a :class:`~connectors.connectors.Connector`
         for connecting it with other connectors.
@@ -154,7 +170,7 @@ class Connector:
 
 class InputConnector(Connector):
     """Base class for input connectors, that replace setter methods."""
-    # pylint: disable=abstract-method # pylint shall not complain, that the __call__ and _announce-methods are not overridden in InputConnector
+    # pylint: disable=abstract-method # pylint shall not complain, that the __call__, _announce and _get_observers-methods are not overridden in InputConnector
 
     def __init__(self, instance, method, laziness, parallelization, executor):
         """
@@ -208,3 +224,18 @@ class InputConnector(Connector):
         :param laziness: a flag from the :class:`connectors.Laziness` enum
         """
         self._laziness = laziness
+
+    def _downstream(self):
+        """Returns the observing output connectors, which is used for estimating
+        the length of the critical path through the processing network.
+
+        :returns: a sequence of output connectors
+        """
+        return self._get_observers()
+
+    def _get_observers(self):
+        """Returns the observing output connectors.
+
+        :returns: a sequence of output connectors
+        """
+        raise NotImplementedError("This method should have been implemented in a derived class")
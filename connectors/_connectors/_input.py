@@ -16,6 +16,7 @@
 
 """Contains the SingleInputConnector class"""
 
+import weakref
 from .. import _common as common
 from ._baseclasses import InputConnector
 
@@ -44,6 +45,7 @@ class SingleInputConnector(InputConnector):
         """
         InputConnector.__init__(self, instance, method, laziness, parallelization, executor)
         self.__observers = common.resolve_observers(instance=instance, observers=observers)
+        self.__sources = weakref.WeakSet()  # the connected output connectors, which are needed for compiling execution plans
         self.__announcement = None
         self.__notification = None
         self.__notification_is_valid = False
@@ -51,6 +53,7 @@ class SingleInputConnector(InputConnector):
         self.__computable = common.Event()  # is set, when there is no pending announcement
         self.__computable.set()
 
+    @common.guarded
     def __call__(self, *args, **kwargs):
         """By making the object callable, it mimics the replaced method.
         This method also notifies the output method that are affected by this call (observers).
@@ -58,21 +61,50 @@ class SingleInputConnector(InputConnector):
         :param `*args,**kwargs`: parameters with which the replaced method shall be called
         :returns: the return value of the replaced method
         """
-        # announce the value change
+        non_lazy_inputs = self.__announce_change()
+        result = self._executor.call_method(self._method, self._coroutine, self._instance(), *args, **kwargs)
+        self.__notify_change(*args, **kwargs)
+        non_lazy_inputs.execute(self._executor)
+        return result
+
+    async def async_call(self, *args, **kwargs):
+        """Calls the replaced method like calling the connector, but the computations
+        of the non-lazy input connectors, that are caused by this, are awaited in
+        the event loop, that is already running. If the replaced method has been
+        defined with ``async def``, it is awaited as well.
+
+        :param `*args,**kwargs`: parameters with which the replaced method shall be called
+        :returns: the return value of the replaced method
+        """
+        non_lazy_inputs = self.__announce_change()
+        result = await self._executor.run_method(common.Parallelization.SEQUENTIAL,
+                                                 self._method, self._coroutine, self._instance(), *args, **kwargs)
+        self.__notify_change(*args, **kwargs)
+        await non_lazy_inputs.execute_async(self._executor)
+        return result
+
+    @common.guarded
+    def __announce_change(self):
+        """Announces a value change to the observers.
+
+        :returns: the :class:`~connectors._common._non_lazy_inputs.NonLazyInputs`
+                  instance, whose computations have to be executed after the change
+        """
         non_lazy_inputs = common.NonLazyInputs(common.Laziness.ON_ANNOUNCE)
         for o in self.__observers:
             o._announce(self, non_lazy_inputs)
-        # call the replaced method
-        result = self._method(self._instance(), *args, **kwargs)
+        return non_lazy_inputs
+
+    @common.guarded
+    def __notify_change(self, *args, **kwargs):
+        """Notifies the observers, after the replaced method has been called.
+
+        :param `*args,**kwargs`: parameters with which the replaced method has been called
+        """
         self.__announcement = None
         self.__notification = None
         self.__notification_is_valid = False
-        # notify observers about the value change
         self._conditional_observer_notification(*args, **kwargs)
-        # execute the non-lazy inputs
-        non_lazy_inputs.execute(self._executor)
-        # return the result of the method call
-        return result
 
     def _connect(self, connector):
         """This method is called from an :class:`~connectors.connectors.OutputConnector`,
@@ -86,6 +118,9 @@ class SingleInputConnector(InputConnector):
                   instances that it exports)
         """
         yield self
+        self.__sources.add(connector)
+        common.topology.changed()
+        common.thread_safety.connected(connector._get_instance(), self._instance())
         non_lazy_inputs = common.NonLazyInputs(situation=common.Laziness.ON_CONNECT)
         self._announce(connector, non_lazy_inputs=non_lazy_inputs)
         non_lazy_inputs.execute(self._executor)
@@ -100,6 +135,8 @@ class SingleInputConnector(InputConnector):
                   all the :class:`~connectors.SingleInputConnector`s that it exports)
         """
         self._executor.run_coroutine(self._request(self._executor))
+        self.__sources.discard(connector)
+        common.topology.changed()
         yield self
 
     def _announce(self, connector, non_lazy_inputs):
@@ -133,12 +170,24 @@ class SingleInputConnector(InputConnector):
                          connector, and which shall be used for the computation
                          of this connector, in case it is not lazy.
         """
+        if self._receive(connector, value):
+            await self._request(executor)
+
+    def _receive(self, connector, value):   # pylint: disable=unused-argument # this method has the same signature as _notify
+        """A synchronous variant of :meth:`_notify`, which stores the updated
+        data, but leaves its processing to the caller. This is used by the
+        :class:`~connectors.connectors.ExecutionPlan`.
+
+        :param connector: the output connector whose value has changed
+        :param value: the updated data from the output connector
+        :returns: True, if this input connector shall be executed immediately,
+                  because its laziness is :attr:`~connectors.Laziness.ON_NOTIFY`
+        """
         self.__notification = value
         self.__notification_is_valid = True
         self.__announcement = None
         self.__computable.set()
-        if self._laziness == common.Laziness.ON_NOTIFY:
-            await self._request(executor)
+        return self._laziness == common.Laziness.ON_NOTIFY
 
     def _cancel(self, connector):   # pylint: disable=unused-argument # this method has to be compatible with other input connectors
         """Notifies this input connector, that an announced value change is not
@@ -170,7 +219,8 @@ class SingleInputConnector(InputConnector):
                 # execute the setter
                 if self.__notification_is_valid:
                     notification = self.__notification
-                    await executor.run_method(self._parallelization, self._method, self._instance(), notification)
+                    await executor.run_method(self._parallelization, self._method, self._coroutine,
+                                              self._instance(), notification)
                     self.__notification_is_valid = False
                     self.__notification = None
                     # notify the observers
@@ -178,7 +228,48 @@ class SingleInputConnector(InputConnector):
             finally:
                 self.__running = False
 
-    def _conditional_observer_notification(self, *args, **kwargs):  # pylint: disable=unused-argument # this method has to be compatible with other input connectors
+    def _get_observers(self):
+        """Returns the observing output connectors.
+
+        :returns: a sequence of output connectors
+        """
+        return self.__observers
+
+    def _plan_upstream(self):
+        """Returns the connected output connectors, which is used for compiling
+        an :class:`~connectors.connectors.ExecutionPlan`.
+
+        :returns: a tuple of output connectors
+        """
+        return tuple(self.__sources)
+
+    def _plan_pending(self):
+        """Returns the connector, whose announced value change is still pending.
+
+        :returns: a tuple, that is either empty or contains the announcing output connector
+        """
+        return () if self.__announcement is None else (self.__announcement,)
+
+    def _plan_notification(self):
+        """Returns the value, with which the setter has to be called by an
+        :class:`~connectors.connectors.ExecutionPlan`.
+
+        :returns: the value or :data:`~connectors._common._memoization.NO_VALUE`,
+                  if the setter does not have to be called
+        """
+        return self.__notification if self.__notification_is_valid else common.NO_VALUE
+
+    def _plan_finish(self, value):
+        """Is called by an :class:`~connectors.connectors.ExecutionPlan` after
+        it has called the setter with the value from :meth:`_plan_notification`.
+
+        :param value: the value, with which the setter has been called
+        """
+        self.__notification_is_valid = False
+        self.__notification = None
+        self._conditional_observer_notification(value)
+
+    def _conditional_observer_notification(self, *args, **kwargs):
         """Notifies the observing output connectors, that this input has changed
         the instance's state.
 
@@ -188,8 +279,9 @@ class SingleInputConnector(InputConnector):
         :param `*args,**kwargs`: the parameters, with which the replaced setter
                                 method has been called (excluding ``self``)
         """
+        value = common.pack_arguments(*args, **kwargs)
         for o in self.__observers:
-            o._notify(self)
+            o._notify(self, value)
 
 
 class ConditionalSingleInputConnector(SingleInputConnector):
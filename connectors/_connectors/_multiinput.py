@@ -30,6 +30,7 @@ class MultiInputConnector(InputConnector):
     multiple values, so they can be used to connect different objects in a processing
     chain.
     """
+    # pylint: disable=too-many-instance-attributes # the connections and the pending changes are all needed for the protocol between the connectors
 
     def __init__(self, instance, method, remove_method, replace_method, observers, laziness, parallelization, executor):
         """
@@ -53,17 +54,20 @@ class MultiInputConnector(InputConnector):
         """
         InputConnector.__init__(self, instance, method, laziness, parallelization, executor)
         self.__remove = remove_method
+        self.__remove_coroutine = common.is_coroutine_method(remove_method)
         self.__replace = replace_method
+        self.__replace_coroutine = common.is_coroutine_method(replace_method)
         self.__observers = common.resolve_observers(instance=instance, observers=observers)
         self._connections = weakref.WeakKeyDictionary()
         self._multi_connections = weakref.WeakKeyDictionary()
         self.__announcements = set()        # stores output connectors, that announced a value change
         self.__notifications = {}           # maps output connectors, that notified about a value change, to pending input values
-        self.__multi_notifications = {}     # maps data ids to pending input values; is used, when a multi-output notifies this connector
+        self.__multi_notifications = {}     # maps multi-output connectors to tuples (changed, removed) of pending changes. removed is None, if changed contains all values
         self.__running = False              # is used to prevent, that the setter is executed multiple times for the same changes
         self.__computable = common.Event()  # is set, when there is no pending announcement
         self.__computable.set()
 
+    @common.guarded
     def __call__(self, *args, **kwargs):
         """By making the object callable, it mimics the replaced method.
         This method also notifies the output method that are affected by this call (observers).
@@ -71,27 +75,66 @@ class MultiInputConnector(InputConnector):
         :param `*args,**kwargs`: parameters with which the replaced method has been called
         :returns: the return value of the replaced method
         """
-        # announce the value change
-        non_lazy_inputs = common.NonLazyInputs(common.Laziness.ON_ANNOUNCE)
-        for o in self.__observers:
-            o._announce(self, non_lazy_inputs)
-        # call the replaced method
+        non_lazy_inputs = self.__announce_change()
         self.__running = True
         try:
             changed = self._executor.run_coroutine(self.__request_pending(self._executor))    # retrieve the announced values from the connectors first, so that everything is added in the correct order
         finally:
             self.__running = False
-        result = self._method(self._instance(), *args, **kwargs)
-        # notify observers about the value change
+        result = self._executor.call_method(self._method, self._coroutine, self._instance(), *args, **kwargs)
+        self.__notify_change(changed, result, *args, **kwargs)
+        non_lazy_inputs.execute(self._executor)
+        return result
+
+    async def async_call(self, *args, **kwargs):
+        """Calls the replaced method like calling the connector, but the pending
+        values from the connected output connectors and the computations of the
+        non-lazy input connectors, that are caused by this call, are awaited in
+        the event loop, that is already running. If the replaced method has been
+        defined with ``async def``, it is awaited as well.
+
+        :param `*args,**kwargs`: parameters with which the replaced method has been called
+        :returns: the return value of the replaced method
+        """
+        executor = self._executor
+        non_lazy_inputs = self.__announce_change()
+        self.__running = True
+        try:
+            changed = await executor.run_async(self.__request_pending(executor))
+        finally:
+            self.__running = False
+        result = await executor.run_method(common.Parallelization.SEQUENTIAL, self._method, self._coroutine,
+                                           self._instance(), *args, **kwargs)
+        self.__notify_change(changed, result, *args, **kwargs)
+        await non_lazy_inputs.execute_async(executor)
+        return result
+
+    @common.guarded
+    def __announce_change(self):
+        """Announces a value change to the observers.
+
+        :returns: the :class:`~connectors._common._non_lazy_inputs.NonLazyInputs`
+                  instance, whose computations have to be executed after the change
+        """
+        non_lazy_inputs = common.NonLazyInputs(common.Laziness.ON_ANNOUNCE)
+        for o in self.__observers:
+            o._announce(self, non_lazy_inputs)
+        return non_lazy_inputs
+
+    @common.guarded
+    def __notify_change(self, changed, result, *args, **kwargs):
+        """Notifies the observers, after the replaced method has been called.
+
+        :param changed: a dictionary, that maps data ids to the values, which
+                        have been retrieved from the connected output connectors
+        :param result: the return value of the replaced method
+        :param `*args,**kwargs`: parameters with which the replaced method has been called
+        """
         for data_id, value in changed.items():
             self._add_to_notification_condition_checks(data_id, value)
         value = common.get_first_argument(self._method, *args, **kwargs)
         self._add_to_notification_condition_checks(data_id=result, value=value)
         self._notify_observers()
-        # execute the non-lazy inputs
-        non_lazy_inputs.execute(self._executor)
-        # return the result of the method call
-        return result
 
     def __getitem__(self, key):
         """Allows to use a multi-input connector as multiple single-input connectors.
@@ -108,6 +151,7 @@ class MultiInputConnector(InputConnector):
         return common.MultiInputItem(connector=self,
                                      instance=self._instance(),
                                      replace_method=self.__replace,
+                                     coroutine=self.__replace_coroutine,
                                      key=key,
                                      observers=self.__observers,
                                      executor=self._executor)
@@ -123,6 +167,8 @@ class MultiInputConnector(InputConnector):
                   all the :class:`~connectors.SingleInputConnector`s that it exports)
         """
         yield self
+        common.topology.changed()
+        common.thread_safety.connected(connector._get_instance(), self._instance())
         self.__announcements.add(connector)
         if isinstance(connector, multioutput.MultiOutputConnector):
             self._multi_connections[connector] = set()
@@ -155,6 +201,7 @@ class MultiInputConnector(InputConnector):
                 self.__remove(self._instance(), data_id)
                 self._add_to_notification_condition_checks(data_id)
             del self._multi_connections[connector]
+            self.__multi_notifications.pop(connector, None)
         else:
             data_id = self._connections[connector]
             if data_id is not None:
@@ -162,6 +209,7 @@ class MultiInputConnector(InputConnector):
             self._add_to_notification_condition_checks(data_id)
             del self._connections[connector]
         self._notify_observers()
+        common.topology.changed()
         non_lazy_inputs.execute(self._executor)
         yield self
 
@@ -201,18 +249,31 @@ class MultiInputConnector(InputConnector):
         if self._laziness == common.Laziness.ON_NOTIFY:
             await self._request(executor)
 
-    async def _notify_multi(self, connector, values, executor):
+    async def _notify_multi(self, connector, changed, removed, executor):
         """This method is to notify this multi-input connector, when a connected
         multi-output connector has produced updated data.
+        Depending on the multi-output's change detection, either all values or
+        only the changes since the previous notification are passed, so that the
+        effort for processing them does not depend on the total number of values.
+        If the changes have not been processed, when the next notification arrives,
+        they are merged.
 
         :param connector: the output connector whose value has changed
-        :param values: a dictionary, that maps data ids to the updated values
+        :param changed: a dictionary, that maps the data ids of new or changed
+                        values to these values
+        :param removed: a set of the data ids of the values, that shall be removed,
+                        or None, if ``changed`` contains all values, so that all
+                        other values shall be removed
         :param executor: the :class:`~connectors._common._executors.Executor`
                          instance, which managed the computation of the output
                          connector, and which shall be used for the computation
                          of this connector, in case it is not lazy.
         """
-        self.__multi_notifications[connector] = values
+        pending = self.__multi_notifications.get(connector)
+        if pending is None or removed is None:
+            self.__multi_notifications[connector] = (changed, removed)
+        else:
+            self.__multi_notifications[connector] = _merge_changes(*pending, changed, removed)
         self.__announcements.discard(connector)
         if not self.__announcements:
             self.__computable.set()
@@ -269,58 +330,115 @@ class MultiInputConnector(InputConnector):
             await asyncio.gather(*(a._request(executor) for a in self.__announcements))
             await self.__computable.wait(executor)
         # execute the setter
-        single_tasks = {}
-        if self.__notifications:
-            for connector, value in self.__notifications.items():
-                data_id = self._connections[connector]
-                if data_id is None:
-                    task = executor.run_method(self._parallelization,
-                                               self._method,
-                                               self._instance(),
-                                               value)
-                else:
-                    task = executor.run_method(self._parallelization,
-                                               self.__replace,
-                                               self._instance(),
-                                               data_id,
-                                               value)
-                single_tasks[connector] = (task, value)
-            self.__notifications.clear()
+        jobs = []           # a list of tuples (coroutine, value, ordered), in which ordered is True for adding new data, which has to happen in the order of the connections
+        single_jobs = self.__single_jobs(executor, jobs)
         remove_tasks = []
-        multi_tasks = {}
-        if self.__multi_notifications:
-            for connector, data in self.__multi_notifications.items():
-                to_remove = self._multi_connections[connector] - data.keys()
-                remove_tasks += [executor.run_method(self._parallelization,
-                                                     self.__remove,
-                                                     self._instance(),
-                                                     data_id)
-                                 for data_id in to_remove]
-                multi_tasks[connector] = [(executor.run_method(self._parallelization,
-                                                               self.__replace,
-                                                               self._instance(),
-                                                               data_id,
-                                                               value),
-                                           value)
-                                          for data_id, value in data.items()]
-            self.__multi_notifications.clear()
-        # save the data ids
+        multi_jobs = self.__multi_jobs(executor, jobs, remove_tasks)
         if remove_tasks:
             await asyncio.gather(*remove_tasks)
+        data_ids = await self.__run_jobs(executor, jobs)
+        # save the data ids
         changed = {}
-        for connector, (task, value) in single_tasks.items():
-            data_id = await task
+        for connector, index in single_jobs.items():
+            data_id = data_ids[index]
             self._connections[connector] = data_id
-            changed[data_id] = value
-        for connector, tasks in multi_tasks.items():
-            data_ids = set()
-            for task, value in tasks:
-                data_id = await task
-                changed[data_id] = value
-                data_ids.add(data_id)
-            self._multi_connections[connector] = data_ids
+            changed[data_id] = jobs[index][1]
+        for connector, indices in multi_jobs.items():
+            for index in indices:
+                changed[data_ids[index]] = jobs[index][1]
+            self._multi_connections[connector].update(data_ids[index] for index in indices)
         return changed
 
+    def __single_jobs(self, executor, jobs):
+        """Creates the jobs for adding or replacing the values, that have been
+        passed by the connected single-output connectors.
+
+        :param executor: the :class:`~connectors._common._executors.Executor` instance,
+                         that manages the current computations
+        :param jobs: a list, to which the jobs are appended as tuples (coroutine, value, ordered)
+        :returns: a dictionary, that maps the output connectors to the indices of their jobs
+        """
+        single_jobs = {}
+        for connector, value in self.__notifications.items():
+            data_id = self._connections[connector]
+            if data_id is None:
+                coroutine = executor.run_method(self._parallelization,
+                                                self._method,
+                                                self._coroutine,
+                                                self._instance(),
+                                                value)
+            else:
+                coroutine = executor.run_method(self._parallelization,
+                                                self.__replace,
+                                                self.__replace_coroutine,
+                                                self._instance(),
+                                                data_id,
+                                                value)
+            single_jobs[connector] = len(jobs)
+            jobs.append((coroutine, value, data_id is None))
+        self.__notifications.clear()
+        return single_jobs
+
+    def __multi_jobs(self, executor, jobs, remove_tasks):
+        """Creates the jobs for replacing and removing the values, that have been
+        passed by the connected multi-output connectors.
+
+        :param executor: the :class:`~connectors._common._executors.Executor` instance,
+                         that manages the current computations
+        :param jobs: a list, to which the jobs for replacing the values are appended
+                     as tuples (coroutine, value, ordered)
+        :param remove_tasks: a list, to which the coroutines for removing the values are appended
+        :returns: a dictionary, that maps the multi-output connectors to the indices of their jobs
+        """
+        multi_jobs = {}
+        for connector, (data, removed) in self.__multi_notifications.items():
+            previous = self._multi_connections[connector]
+            if removed is None:
+                removed = previous - data.keys()
+            else:
+                removed = [data_id for data_id in removed if data_id in previous]    # values, that have been added and removed again before this request, have never been passed to the remove method
+            remove_tasks.extend(executor.run_method(self._parallelization, self.__remove, self.__remove_coroutine,
+                                                    self._instance(), data_id)
+                                for data_id in removed)
+            previous.difference_update(removed)
+            multi_jobs[connector] = []
+            for data_id, value in data.items():
+                multi_jobs[connector].append(len(jobs))
+                jobs.append((executor.run_method(self._parallelization,
+                                                 self.__replace,
+                                                 self.__replace_coroutine,
+                                                 self._instance(),
+                                                 data_id,
+                                                 value),
+                             value,
+                             data_id not in previous))
+        self.__multi_notifications.clear()
+        return multi_jobs
+
+    async def __run_jobs(self, executor, jobs):
+        """Executes the add- and replace-methods for the pending input values.
+        Replacing existing data can happen concurrently, if the parallelization
+        setting and the executor allow that, while new data is added sequentially
+        in the order of the jobs, so that the order of the data ids is reproducible.
+        If a method raises an exception, the jobs, that have not been finished,
+        are canceled, before the exception is passed on.
+
+        :param executor: the :class:`~connectors._common._executors.Executor` instance,
+                         that manages the current computations
+        :param jobs: a list of tuples (coroutine, value, ordered)
+        :returns: a list with the return values of the methods (the data ids)
+        """
+        if executor.runs_sequentially(self._parallelization):
+            return await _run_sequentially(jobs)
+        return await _run_concurrently(jobs)
+
+    def _get_observers(self):
+        """Returns the observing output connectors.
+
+        :returns: a sequence of output connectors
+        """
+        return self.__observers
+
     def _notify_observers(self):
         """Checks the notification condition and notifies the observers about value
         changes or cancellations.
@@ -437,3 +555,65 @@ class ConditionalMultiInputConnector(MultiInputConnector):
             result = result or self.__notify_condition(self._instance(), data_id, value)
         self.__pending_notification_condition_checks.clear()
         return result
+
+
+async def _run_sequentially(jobs):
+    """Awaits the coroutines of the given jobs one after the other.
+
+    :param jobs: a list of tuples (coroutine, value, ordered)
+    :returns: a list with the return values of the coroutines
+    """
+    results = []
+    try:
+        for coroutine, _, _ in jobs:
+            results.append(await coroutine)
+    finally:
+        for coroutine, _, _ in jobs[len(results):]:
+            coroutine.close()   # prevents warnings about coroutines, that have never been awaited
+    return results
+
+
+async def _run_concurrently(jobs):
+    """Awaits the coroutines of the unordered jobs concurrently, while the ordered
+    ones are awaited one after the other.
+
+    :param jobs: a list of tuples (coroutine, value, ordered)
+    :returns: a list with the return values of the coroutines
+    """
+    tasks = {i: asyncio.ensure_future(coroutine) for i, (coroutine, _, ordered) in enumerate(jobs) if not ordered}
+    results = [None] * len(jobs)
+    try:
+        for i, (coroutine, _, ordered) in enumerate(jobs):
+            if ordered:
+                results[i] = await coroutine
+        for i, task in tasks.items():
+            results[i] = await task
+    except BaseException:
+        for coroutine, _, ordered in jobs:
+            if ordered:
+                coroutine.close()   # prevents warnings about coroutines, that have never been awaited
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+    return results
+
+
+def _merge_changes(pending_changed, pending_removed, changed, removed):
+    """Merges the changes of a multi-output's notification into the changes of
+    a previous notification, that have not been processed yet.
+    The given collections are not modified, since they may be shared with other
+    multi-input connectors.
+
+    :param pending_changed: a dictionary with the pending new or changed values
+    :param pending_removed: a set of the pending removed data ids, or None, if
+                            ``pending_changed`` contains all values
+    :param changed: a dictionary with the new or changed values of the new notification
+    :param removed: a set of the removed data ids of the new notification
+    :returns: a tuple (changed, removed) with the merged changes
+    """
+    merged = {data_id: value for data_id, value in pending_changed.items() if data_id not in removed}
+    merged.update(changed)
+    if pending_removed is None:
+        return merged, None
+    return merged, {data_id for data_id in pending_removed.union(removed) if data_id not in changed}
@@ -18,6 +18,8 @@
 
 import asyncio
 import collections
+import operator
+import time
 import weakref
 from .. import _common as common
 from . import _multiinput as multiinput
@@ -36,8 +38,9 @@ class MultiOutputConnector(Connector):
     to a multi-input connector. Or the argument for the ``[]``-operator can be used
     to parameterize the getter method.
     """
+    # pylint: disable=too-many-instance-attributes # the connections, the caches and the state of the running computations are all needed for the protocol between the connectors
 
-    def __init__(self, instance, method, caching, parallelization, executor, keys):
+    def __init__(self, instance, method, caching, parallelization, executor, options):
         """
         :param instance: the instance of which the method is replaced by this connector
         :param method: the unbound method that is replaced by this connector
@@ -51,22 +54,27 @@ class MultiOutputConnector(Connector):
                          that can be created with the :func:`connectors.executor`
                          function. See the :meth:`~connectors.connectors.MultiOutputConnector.set_executor`
                          method for details
-        :param keys: an unbound method, that returns the keys for which this multi-output
-                     connector shall compute values, when it is connected to a
-                     multi-input connector
+        :param options: a :class:`~connectors._common._multioutput_options.MultiOutputOptions`
+                        tuple with the further settings of this connector
         """
         Connector.__init__(self, instance, method, parallelization, executor)
         self.__caching = caching
-        self.__keys = keys
+        self.__memo = common.Memo(options.memoize, options.hasher)
+        self.__options = options            # the keys, batch and version methods and the change detection are read from the options
+        self.__batch_coroutine = common.is_coroutine_method(options.batch)
         self.__announcements = weakref.WeakSet()
         self.__multi_connections = set()    # stores tuples (connector, instance). The instance is only saved to prevent its deletion through reference counting
+        self.__delivered = {}               # multi-input connector -> {output key -> version, reference or fingerprint of the value, that has been passed last} or None, if unknown
         self.__single_connections = {}      # output key -> set([(connector, instance), ...])
         self.__items = {}                   # output key -> MultiOutputItem
-        self.__results = {}                 # output key -> result. Cached results
+        self.__results = common.ResultCache(options.max_entries, options.max_bytes, options.eviction_policy,
+                                            owner=self)    # output key -> result. Cached results
         self.__valid_results = set()        # set of output keys, for which the cached results are still valid
         self.__running = set()              # set of output keys, is used to prevent, that the getter is executed multiple times for the same changes
         self.__computable = common.Event()  # is set, when there is no pending announcement
         self.__computable.set()
+        self.__generation = None            # the generation of the last announcement pass, that has been forwarded
+        self.__flights = common.Flights()   # shares the computations between concurrent calls of async_call
 
     def __call__(self, *args, **kwargs):
         """By making the object callable, it mimics the replaced method.
@@ -76,10 +84,42 @@ class MultiOutputConnector(Connector):
         :param `*args,**kwargs`: parameters with which the replaced method has been called
         :returns: the return value of the replaced method
         """
+        if common.thread_safety.enabled:
+            key = common.get_first_argument(self._method, *args, **kwargs)
+            flight = (self, key) if len(args) + len(kwargs) == 1 else None     # calls with additional arguments are not shared
+            return common.thread_safety.run(flight, self._instance(), self._executor, self.__get, *args, **kwargs)
+        return self.__get(self._executor, *args, **kwargs)
+
+    def __get(self, executor, *args, **kwargs):
+        """Returns the cached result for the given key or computes it.
+
+        :param executor: the :class:`~connectors._common._executors.Executor` for the computation
+        :param `*args,**kwargs`: parameters for the replaced method
+        :returns: the return value of the replaced method
+        """
+        key = common.get_first_argument(self._method, *args, **kwargs)
+        if key in self.__valid_results:
+            self.__report("cache_hit")
+            return self.__results[key]
+        return executor.run_coroutine(self._request_key(executor, key, True, *args, **kwargs))
+
+    async def async_call(self, *args, **kwargs):
+        """Returns the cached result for the given key or computes it in the event
+        loop, that is already running, without blocking it.
+        Concurrent calls, which only pass the key, share one computation.
+
+        :param `*args,**kwargs`: parameters for the replaced method
+        :returns: the return value of the replaced method
+        """
         key = common.get_first_argument(self._method, *args, **kwargs)
         if key in self.__valid_results:
+            self.__report("cache_hit")
             return self.__results[key]
-        return self._executor.run_coroutine(self._request_key(self._executor, key, True, *args, **kwargs))
+        executor = self._executor
+        if len(args) + len(kwargs) == 1:
+            return await self.__flights.run(key, lambda: executor.run_async(self._request_key(executor, key, True,
+                                                                                              *args, **kwargs)))
+        return await executor.run_async(self._request_key(executor, key, True, *args, **kwargs))
 
     def __getitem__(self, key):
         """Allows to use a multi-output connector as multiple single-output connectors.
@@ -91,6 +131,7 @@ class MultiOutputConnector(Connector):
         """
         return common.MultiOutputItem(connector=self, instance=self._instance(), key=key)
 
+    @common.guarded
     def connect(self, connector):
         """A method for connecting this output connector to an input connector.
         This is only allowed with multi-input connectors. In order to establish
@@ -103,11 +144,13 @@ class MultiOutputConnector(Connector):
         if isinstance(connector, (multiinput.MultiInputConnector, proxies.MultiInputProxy)):
             for c in connector._connect(self):
                 self.__multi_connections.add((c, c._get_instance()))
+                self.__delivered[c] = None
             return self._instance()
         else:
             raise TypeError("MultiOutputConnectors can only be connected to MultiInputConnectors."
                             "Select a single output with the MultiOutputConnector's [] operator.")
 
+    @common.guarded
     def disconnect(self, connector):
         """A method for disconnecting this output connector from an input connector,
         to which it is currently connected.
@@ -118,12 +161,13 @@ class MultiOutputConnector(Connector):
         if isinstance(connector, (multiinput.MultiInputConnector, proxies.MultiInputProxy)):
             for c in connector._disconnect(self):
                 self.__multi_connections.remove((c, c._get_instance()))
+                del self.__delivered[c]
             return self._instance()
         else:
             raise TypeError("MultiOutputConnectors can only be connected to MultiInputConnectors."
                             "Select a single output with the MultiOutputConnector's [] operator.")
 
-    def set_caching(self, caching):
+    def set_caching(self, caching, max_entries=None, max_bytes=None, eviction_policy=common.EvictionPolicy.LRU):
         """Specifies, if the result value of this output connector shall be cached.
         If caching is enabled and the result value is retrieved (e.g. through a
         connection or by calling the connector), the cached value is returned and
@@ -133,12 +177,88 @@ class MultiOutputConnector(Connector):
         independent of the number of connections through which the result value
         has to be passed.
 
+        Since the getter method is parameterized with a key, the number of cached
+        results can grow without bounds. To prevent this, a maximum number of
+        cached results and a maximum memory consumption can be specified. When
+        one of these limits is exceeded, results are evicted from the cache according
+        to the given policy. The memory consumption of a result is estimated by
+        its ``nbytes`` attribute (e.g. for NumPy arrays) or :func:`sys.getsizeof`.
+        The cached results are discarded, when this method is called. Statistics
+        about the usage of the cache can be retrieved with the
+        :meth:`~connectors.connectors.MultiOutputConnector.get_cache_statistics`
+        method.
+
         :param caching: True, if caching shall be enabled, False otherwise
+        :param max_entries: the maximum number of cached results or None for no limit
+        :param max_bytes: the maximum memory consumption of the cached results in
+                          bytes or None for no limit
+        :param eviction_policy: a flag from the :class:`connectors.EvictionPolicy` enum
         """
         self.__caching = caching
+        self.__valid_results.clear()
+        self.__results.configure(max_entries, max_bytes, eviction_policy)
         if not self.__caching:
-            self.__valid_results.clear()
-            self.__results.clear()
+            self.__memo.clear()
+
+    def set_memoization(self, memoize, hasher=None):
+        """Specifies, if the results shall be remembered for the states of the
+        observed input connectors, in which they have been computed.
+        This works like the :meth:`~connectors.connectors.OutputConnector.set_memoization`
+        method of the :class:`~connectors.connectors.OutputConnector`, except
+        that the results are remembered for the combination of the state and the
+        key, with which the getter method has been called.
+
+        :param memoize: the number of results, that shall be remembered, 0 to
+                        disable the memoization or None for no limit
+        :param hasher: a function, that takes a value, that has been passed to an
+                       input connector, and returns a hashable fingerprint, that
+                       is equal for equal values, or None for the default function
+        """
+        self.__memo = common.Memo(memoize, hasher)
+
+    def set_change_detection(self, change_detection):
+        """Specifies, which of the re-computed values are passed to the connected
+        multi-input connectors.
+        With :attr:`~connectors.ChangeDetection.ALWAYS`, all values are passed
+        after every re-computation, and the multi-input connectors find the removed
+        keys on their own. With the other flags, the multi-output connector remembers,
+        which values it has passed to each of the connected multi-input connectors.
+        After a re-computation, it only
+        passes the values for new keys and the values, which are considered as
+        changed according to the given flag, while the keys, that are no longer
+        returned by the keys-method, are removed from the multi-input connectors.
+        This way, the multi-input connectors only have to call their replace- and
+        remove-methods for the values, that have actually changed.
+
+        If a version method has been specified with the :meth:`~connectors.MultiOutput.version`
+        decorator, the versions are compared instead of the values, and the values
+        for the keys with unchanged versions are not even computed.
+
+        After changing this setting, all values are passed with the next re-computation,
+        because the values, that have been passed before, are not known to the
+        new setting.
+
+        :param change_detection: a flag from the :class:`connectors.ChangeDetection` enum
+        """
+        self.__options = self.__options._replace(change_detection=change_detection)   # pylint: disable=protected-access # _replace is a public method of named tuples
+        for connector in self.__delivered:
+            self.__delivered[connector] = None
+
+    def get_cache_statistics(self):
+        """Returns statistics about the usage of the cache for the results of this
+        multi-output connector, which help to choose the limits of the cache (see
+        :meth:`~connectors.connectors.MultiOutputConnector.set_caching`).
+        The statistics are a named tuple with the following fields:
+
+        * ``hits``: the number of results, that have been taken from the cache
+        * ``misses``: the number of results, that had to be computed and have been added to the cache
+        * ``evictions``: the number of results, that have been removed to comply with the limits
+        * ``entries``: the number of currently cached results
+        * ``bytes``: the estimated memory consumption of the currently cached results
+
+        :returns: a :class:`~connectors._common._result_cache.CacheStatistics` tuple
+        """
+        return self.__results.statistics()
 
     def _connect(self, item, connector):
         """Connects a virtual single output to the given input connector.
@@ -179,6 +299,17 @@ class MultiOutputConnector(Connector):
             del self.__single_connections[key]
             del self.__items[key]
 
+    def _downstream(self):
+        """Returns the connected input connectors, which is used for estimating
+        the length of the critical path through the processing network.
+
+        :returns: a tuple of input connectors
+        """
+        connectors = [c for c, _ in self.__multi_connections]
+        for connections in self.__single_connections.values():
+            connectors.extend(c for c, _ in connections)
+        return tuple(connectors)
+
     def _announce(self, connector, non_lazy_inputs):
         """This method is to notify this output connector, when an observed input
         connector (a setter from the instance to which this connector belongs)
@@ -195,6 +326,34 @@ class MultiOutputConnector(Connector):
         self.__announcements.add(connector)
         self.__valid_results.clear()
         self.__computable.clear()
+        transaction = common.Transaction.active()
+        if transaction is None:
+            self.__forward_announcement(non_lazy_inputs)
+        else:
+            transaction.defer_announcement(self)
+
+    def _commit_announcement(self, non_lazy_inputs):
+        """Is called at the end of a :func:`connectors.transaction`, to forward
+        the announcement, that has been deferred during the transaction, to the
+        connected input connectors.
+
+        :param non_lazy_inputs: a :class:`~connectors._common._non_lazy_inputs.NonLazyInputs`
+                                instance to which input connectors can be appended,
+                                if they request an immediate re-computation
+        """
+        if not self.__announcements:    # otherwise, the announcement has already been forwarded by the commit of an output connector further up the processing chain
+            self.__forward_announcement(non_lazy_inputs)
+
+    def __forward_announcement(self, non_lazy_inputs):
+        """Forwards an announcement to the connected input connectors.
+
+        :param non_lazy_inputs: a :class:`~connectors._common._non_lazy_inputs.NonLazyInputs`
+                                instance to which input connectors can be appended,
+                                if they request an immediate re-computation
+        """
+        if self.__generation == non_lazy_inputs.generation:
+            return  # the announcement has already been forwarded in this pass through another path, for example, in a diamond shaped network
+        self.__generation = non_lazy_inputs.generation
         for c, _ in self.__multi_connections:
             c._announce(self, non_lazy_inputs)
         for key, connections in self.__single_connections.items():
@@ -202,12 +361,15 @@ class MultiOutputConnector(Connector):
             for c, _ in connections:
                 c._announce(item, non_lazy_inputs)
 
-    def _notify(self, connector):
+    def _notify(self, connector, value=common.NO_VALUE):
         """This method is to notify this multi-output connector, when an observed
         input connector (a setter from the instance to which this connector belongs)
         has retrieved updated data.
 
         :param connector: the input connector, which has changed a value
+        :param value: the new value of the input connector, which is used for the
+                      memoization, or :data:`~connectors._common._memoization.NO_VALUE`,
+                      if the value is not known
         :param non_lazy_inputs: a :class:`~connectors._common._non_lazy_inputs.NonLazyInputs`
                                 instance to which input connectors can be appended,
                                 if they request an immediate re-computation (see
@@ -217,6 +379,7 @@ class MultiOutputConnector(Connector):
         """
         self.__valid_results.clear()
         self.__results.clear()
+        self.__memo.notify(connector, value)
         self.__announcements.discard(connector)
         if not self.__announcements:
             self.__computable.set()
@@ -251,12 +414,85 @@ class MultiOutputConnector(Connector):
                          that manages the current computations
         """
         await self.__request_announcements(executor)
-        keys = self.__keys(self._instance())
+        keys = self.__options.keys(self._instance())
         if not isinstance(keys, collections.abc.Sequence):  # repack to a tuple, if necessary, to allow multiple iteration passes
             keys = tuple(keys)
-        values = await asyncio.gather(*(self.__compute_key(executor, key, False, *args, **kwargs) for key in keys))
-        dictionary = dict(zip(keys, values))
-        await asyncio.gather(*(mi._notify_multi(self, dictionary, executor) for mi, _ in self.__multi_connections))  # pylint: disable=protected-access # these methods are called by the connectors, but are not part of the public API.
+        if self.__options.version is None:
+            versions = None
+            computed = keys
+        else:
+            instance = self._instance()
+            versions = {key: self.__options.version(instance, key) for key in keys}
+            delivered = self.__delivered.values()
+            computed = [key for key in keys if any(d is None or _outdated(d, key, versions[key]) for d in delivered)]
+        if self.__options.batch is None or args or kwargs:
+            values = await asyncio.gather(*(self.__compute_key(executor, key, False, *args, **kwargs)
+                                            for key in computed))
+        else:
+            batch = await self.__compute_batch(executor, computed)
+            values = await asyncio.gather(*(self.__compute_key(executor, key, False,
+                                                               batch_result=batch.get(key, common.NO_VALUE))
+                                            for key in computed))
+        dictionary = dict(zip(computed, values))
+        if self.__multi_connections:
+            tokens = self.__tokens(dictionary, versions)
+            await asyncio.gather(*(mi._notify_multi(self, *self.__diff(mi, dictionary, tokens), executor)   # pylint: disable=protected-access # these methods are called by the connectors, but are not part of the public API.
+                                   for mi, _ in self.__multi_connections))
+
+    def __tokens(self, values, versions):
+        """Determines the tokens, with which the re-computed values are compared
+        to the values, that have been passed to the multi-input connectors before.
+        The values themselves are only used as tokens for the comparison by their
+        identity, in which case, they are referenced weakly in the remembered state.
+
+        :param values: a dictionary, that maps the keys to their re-computed values
+        :param versions: a dictionary, that maps all current keys to their versions,
+                         or None, if no version method is specified
+        :returns: a dictionary, that maps all current keys to their tokens, or None,
+                  if all values shall be passed
+        """
+        if versions is not None:
+            return versions
+        change_detection = self.__options.change_detection
+        if change_detection is common.ChangeDetection.ALWAYS:
+            return None
+        if change_detection is common.ChangeDetection.IDENTITY:
+            return values
+        return {key: common.fingerprint(value) for key, value in values.items()}
+
+    def __diff(self, connector, values, tokens):
+        """Determines the changes of the values, that have been passed to the given
+        multi-input connector, and remembers the new state.
+
+        :param connector: the connected multi-input connector
+        :param values: a dictionary, that maps the keys to their re-computed values.
+                       If a version method is specified, it only contains the
+                       values for the keys, whose version has changed
+        :param tokens: the dictionary, that has been returned by :meth:`__tokens`
+        :returns: a tuple ``(changed, removed)`` of a dictionary, that maps the
+                  keys of the new or changed values to these values, and a set
+                  of the keys, that have been removed, or None, if the dictionary
+                  contains all current values, so that the multi-input connector
+                  can determine the removed keys on its own
+        """
+        if tokens is None:
+            return values, None
+        if tokens is values:    # the values are compared by their identity
+            remember, equal = _reference, _refers_to
+        else:
+            remember, equal = _token, operator.eq
+        delivered = self.__delivered[connector]
+        if delivered is None:   # the values, that have been passed before, are not known, so all values are passed
+            self.__delivered[connector] = {key: remember(token) for key, token in tokens.items()}
+            return values, None
+        outdated = [key for key, token in tokens.items() if _outdated(delivered, key, token, equal)]
+        delivered.update((key, remember(tokens[key])) for key in outdated)
+        removed = set()
+        if len(delivered) > len(tokens):   # all current keys are in the delivered dictionary, so it can only be larger, if keys have been removed
+            removed = {key for key in delivered if key not in tokens}
+            for key in removed:
+                del delivered[key]
+        return {key: values[key] for key in outdated}, removed
 
     async def _request_key(self, executor, key, key_in_args, *args, **kwargs):
         """Causes this multi-output connector to re-compute one of its values and
@@ -277,26 +513,63 @@ class MultiOutputConnector(Connector):
                 return self.__results[key]
         return await self.__compute_key(executor, key, key_in_args, *args, **kwargs)
 
-    async def __compute_key(self, executor, key, key_in_args, *args, **kwargs):
+    async def __compute_batch(self, executor, keys):
+        """Computes the values for the given keys with one call of the batch method.
+        The keys, whose values are cached, memoized or currently being computed,
+        are skipped.
+
+        :param executor: the :class:`~connectors._common._executors.Executor` instance,
+                         that manages the current computations
+        :param keys: a sequence of keys
+        :returns: a dictionary, that maps the computed keys to their values
+        """
+        missing = [k for k in keys if k not in self.__valid_results and k not in self.__running]
+        if missing and self.__memo and self.__caching:
+            state = self.__memo.state()
+            if state is not None:
+                missing = [k for k in missing if self.__memo.get(state, k) is common.NO_VALUE]
+        if not missing:
+            return {}
+        values = await executor.run_method(self._parallelization, self.__options.batch, self.__batch_coroutine,
+                                           self._instance(), tuple(missing))
+        if isinstance(values, collections.abc.Mapping):
+            return {k: values[k] for k in missing}
+        return dict(zip(missing, values))
+
+    async def __compute_key(self, executor, key, key_in_args, *args, batch_result=common.NO_VALUE, **kwargs):
         """Similar to :meth:`~connectors.connectors.MultiOutput._request_key`, but
         it assumes, that the announced value changes have already happened.
+        If the value has already been computed by the batch method, it is passed
+        as ``batch_result``.
         """
         if key not in self.__running:
             self.__running.add(key)
             try:
                 if key in self.__valid_results:
                     result = self.__results[key]
+                    self.__report("cache_hit")
                 else:
                     # execute the getter
-                    if key_in_args:
-                        result = await executor.run_method(self._parallelization, self._method,
-                                                           self._instance(), *args, **kwargs)
-                    else:
-                        result = await executor.run_method(self._parallelization, self._method,
-                                                           self._instance(), key, *args, **kwargs)
+                    start = time.perf_counter()
+                    memoizable = self.__memo and self.__caching and len(args) + len(kwargs) == (1 if key_in_args else 0)
+                    state = self.__memo.state() if memoizable else None
+                    result = common.NO_VALUE if state is None else self.__memo.get(state, key)
+                    self.__report("cache_miss" if result is common.NO_VALUE else "memo_hit")
+                    if result is common.NO_VALUE:
+                        if batch_result is not common.NO_VALUE:
+                            result = batch_result
+                        elif key_in_args:
+                            result = await executor.run_method(self._parallelization, self._method, self._coroutine,
+                                                               self._instance(), *args, **kwargs)
+                        else:
+                            result = await executor.run_method(self._parallelization, self._method, self._coroutine,
+                                                               self._instance(), key, *args, **kwargs)
+                        if state is not None:
+                            self.__memo.remember(state, result, key)
                     if self.__caching:
-                        self.__results[key] = result
                         self.__valid_results.add(key)
+                        evicted = self.__results.add(key, result, time.perf_counter() - start)
+                        self.__valid_results.difference_update(evicted)
                 # notify the connected inputs
                 if key in self.__single_connections:
                     item = self.__items[key]
@@ -307,8 +580,79 @@ class MultiOutputConnector(Connector):
             finally:
                 self.__running.discard(key)
 
+    def __report(self, event):
+        """Reports a cache hit, a memoization hit or a cache miss to the profiling
+        hooks, if profiling is active.
+
+        :param event: ``"cache_hit"``, if the result has been taken from a cache,
+                      ``"memo_hit"``, if it has been taken from the memoization,
+                      or ``"cache_miss"``, if the getter has to be executed
+        """
+        if common.profiler.active():
+            common.profiler.count(event, self._method, self._instance())
+
+    def _evict(self, key):
+        """Is called by the :class:`~connectors._common._cache_manager.CacheManager`,
+        when a cached result shall be discarded to comply with the memory budget.
+        The result is re-computed, when it is requested the next time.
+
+        :param key: the key of the result
+        """
+        self.__results.evict(key)
+        self.__valid_results.discard(key)
+
     async def __request_announcements(self, executor):
         """Requests the announced value changes from the observed inputs."""
         if self.__announcements:
             await asyncio.gather(*(a._request(executor) for a in self.__announcements))
             await self.__computable.wait(executor)
+
+
+def _outdated(delivered, key, token, equal=operator.eq):
+    """Checks, if the value for the given key has to be passed to a multi-input
+    connector, because it differs from the value, that has been passed before.
+
+    :param delivered: a dictionary, that maps keys to the versions or the values,
+                      that have been passed to the multi-input connector
+    :param key: the key of the value
+    :param token: the current version or the current value
+    :param equal: a function for comparing the previous and the current token
+    :returns: True, if the value has to be passed, False otherwise
+    """
+    previous = delivered.get(key, common.NO_VALUE)
+    return previous is common.NO_VALUE or not equal(previous, token)
+
+
+def _token(token):
+    """Returns the given version or fingerprint unchanged, so that it can be remembered.
+
+    :param token: the version or the fingerprint
+    :returns: the token
+    """
+    return token
+
+
+def _reference(value):
+    """Creates a reference to a value, that has been passed to a multi-input connector,
+    for the comparison by identity. Weak references are used, where possible, so
+    that the remembered state does not keep the passed values alive.
+
+    :param value: the value
+    :returns: a callable, that returns the value or None, if it has been garbage collected
+    """
+    try:
+        return weakref.ref(value)
+    except TypeError:   # numbers, strings, tuples and None do not support weak references
+        return lambda: value
+
+
+def _refers_to(reference, value):
+    """Checks, if the given reference, that has been created by :func:`_reference`,
+    refers to the given value.
+
+    :param reference: the reference
+    :param value: the value
+    :returns: True, if the reference refers to the value, False otherwise
+    """
+    referent = reference()
+    return referent is value and (referent is not None or not isinstance(reference, weakref.ReferenceType))
@@ -17,9 +17,11 @@
 """Contains the :class:`~connectors.connectors.OutputConnector` class"""
 
 import asyncio
+import time
 import weakref
 from .. import _common as common
-from ._baseclasses import Connector
+from ._baseclasses import Connector, InputConnector
+from ._input import SingleInputConnector
 
 __all__ = ("OutputConnector",)
 
@@ -28,8 +30,9 @@ class OutputConnector(Connector):
     """A connector-class that replaces getter methods, so they can be used to
     connect different objects.
     """
+    # pylint: disable=too-many-instance-attributes # the connections, the caches and the state of the running computations are all needed for the protocol between the connectors
 
-    def __init__(self, instance, method, caching, parallelization, executor):
+    def __init__(self, instance, method, caching, parallelization, executor, memoize=0, hasher=None, disk_cache=None):
         """
         :param instance: the instance of which the method is replaced by this connector
         :param method: the unbound method that is replaced by this connector
@@ -43,9 +46,21 @@ class OutputConnector(Connector):
                          that can be created with the :func:`connectors.executor`
                          function. See the :meth:`~connectors.connectors.OutputConnector.set_executor`
                          method for details
+        :param memoize: the number of states of the observed inputs, for which the
+                        results shall be remembered. See the
+                        :meth:`~connectors.connectors.OutputConnector.set_memoization`
+                        method for details
+        :param hasher: a function for computing the fingerprints of the input values
+                       or None. See the :meth:`~connectors.connectors.OutputConnector.set_memoization`
+                       method for details
+        :param disk_cache: a :class:`~connectors.DiskCache` instance or None. See
+                           the :meth:`~connectors.connectors.OutputConnector.set_disk_cache`
+                           method for details
         """
         Connector.__init__(self, instance, method, parallelization, executor)
         self.__caching = caching
+        self.__memo = common.Memo(memoize, hasher)
+        self.__disk_cache = disk_cache
         self.__announcements = weakref.WeakSet()
         self.__connections = set()          # stores tuples (connector, instance). The instance is only saved to prevent its deletion through reference counting
         self.__result = None
@@ -54,6 +69,8 @@ class OutputConnector(Connector):
         self.__running = False              # is used to prevent, that the getter is executed multiple times for the same changes
         self.__computable = common.Event()  # is set, when there is no pending announcement
         self.__computable.set()
+        self.__generation = None            # the generation of the last announcement pass, that has been forwarded
+        self.__flights = common.Flights()   # shares the computations between concurrent calls of async_call
 
     def __call__(self, *args, **kwargs):
         """By making the object callable, it mimics the replaced method.
@@ -63,10 +80,42 @@ class OutputConnector(Connector):
         :param `*args,**kwargs`: parameters with which the replaced method has been called
         :returns: the return value of the replaced method
         """
+        if common.thread_safety.enabled:
+            return common.thread_safety.run(None if args or kwargs else self, self._instance(), self._executor,
+                                            self.__get, *args, **kwargs)
+        return self.__get(self._executor, *args, **kwargs)
+
+    def __get(self, executor, *args, **kwargs):
+        """Returns the cached result or computes it.
+
+        :param executor: the :class:`~connectors._common._executors.Executor` for the computation
+        :param `*args,**kwargs`: parameters for the replaced method
+        :returns: the return value of the replaced method
+        """
+        if self.__result_is_valid:
+            common.cache_manager.touch(self, None)
+            self.__report("cache_hit")
+            return self.__result
+        return executor.run_coroutine(self._request(executor, *args, **kwargs))
+
+    async def async_call(self, *args, **kwargs):
+        """Returns the cached result or computes it in the event loop, that is
+        already running, without blocking it.
+        Concurrent calls without arguments share one computation.
+
+        :param `*args,**kwargs`: parameters for the replaced method
+        :returns: the return value of the replaced method
+        """
         if self.__result_is_valid:
+            common.cache_manager.touch(self, None)
+            self.__report("cache_hit")
             return self.__result
-        return self._executor.run_coroutine(self._request(self._executor, *args, **kwargs))
+        executor = self._executor
+        if args or kwargs:
+            return await executor.run_async(self._request(executor, *args, **kwargs))
+        return await self.__flights.run(None, lambda: executor.run_async(self._request(executor)))
 
+    @common.guarded
     def connect(self, connector):
         """A method for connecting this output connector to an input connector.
 
@@ -77,6 +126,7 @@ class OutputConnector(Connector):
             self.__connections.add((c, c._get_instance()))
         return self._instance()
 
+    @common.guarded
     def disconnect(self, connector):
         """A method for disconnecting this output connector from an input connector,
         to which it is currently connected.
@@ -98,12 +148,70 @@ class OutputConnector(Connector):
         independent of the number of connections through which the result value
         has to be passed.
 
+        The memory consumption of the cached results of all output connectors can
+        be limited with the :func:`connectors.set_memory_budget` function.
+
         :param caching: True, if caching shall be enabled, False otherwise
         """
         self.__caching = caching
         if not self.__caching:
             self.__result_is_valid = False
             self.__result = None
+            common.cache_manager.remove(self, None)
+            self.__memo.clear()
+
+    def set_memoization(self, memoize, hasher=None):
+        """Specifies, if the results shall be remembered for the states of the
+        observed input connectors, in which they have been computed.
+        Normally, the cached result is discarded, whenever an observed input connector
+        changes a value. With memoization, the output connector remembers the results
+        for a number of states of its observed inputs, so that the getter method
+        is not called again, when the inputs return to a previously seen state
+        (e.g. when toggling between a few settings in a parameter sweep). The state
+        is identified by fingerprints of the values, that have been passed to
+        the input connectors.
+
+        Memoization only works with caching enabled and it requires, that the
+        result of the getter only depends on the values, that have been passed
+        to the observed input connectors, and not on the order, in which they have
+        been passed. Changes through multi-input connectors cannot be fingerprinted,
+        so the results, that have been computed before such a change, are not
+        reused afterwards. The remembered results are not limited by the memory
+        budget, which is set with :func:`connectors.set_memory_budget`.
+
+        :param memoize: the number of states, for which the results shall be remembered,
+                        0 to disable the memoization or None for no limit
+        :param hasher: a function, that takes a value, that has been passed to an
+                       input connector, and returns a hashable fingerprint, that
+                       is equal for equal values. If None is given, a default
+                       function is used, which uses the value itself, if it has
+                       a value-based hash, or a hash of its content, if it supports
+                       the buffer protocol (e.g. NumPy arrays), or a hash of its
+                       pickled representation otherwise.
+        """
+        self.__memo = common.Memo(memoize, hasher)
+
+    def set_disk_cache(self, disk_cache):
+        """Specifies a directory, in which the results shall be stored, so that
+        they survive the end of the process.
+        This is useful for expensive computations at the beginning of a processing
+        chain, which would otherwise be repeated, whenever a script is run again.
+        Before the getter method is called, the output connector looks up the
+        result in the given :class:`~connectors.DiskCache`, which identifies the
+        results by the class, the name of the getter method and a hash of the
+        instance's state. The getter must therefore not depend on anything else
+        than the attributes of its instance. Since the instance's state is hashed,
+        each look up has a cost, that grows with the amount of data in the instance,
+        so the disk cache should only be used for getters, whose computation is
+        considerably more expensive than that.
+
+        The disk cache is independent of the caching in memory, which is configured
+        with the :meth:`~connectors.connectors.OutputConnector.set_caching` method.
+
+        :param disk_cache: a :class:`~connectors.DiskCache` instance or None to
+                           disable the storing of the results on the disk
+        """
+        self.__disk_cache = disk_cache
 
     def _announce(self, connector, non_lazy_inputs):
         """This method is to notify this output connector, when an observed input
@@ -121,15 +229,46 @@ class OutputConnector(Connector):
         self.__announcements.add(connector)
         self.__result_is_valid = False
         self.__computable.clear()
+        transaction = common.Transaction.active()
+        if transaction is None:
+            self.__forward_announcement(non_lazy_inputs)
+        else:
+            transaction.defer_announcement(self)
+
+    def _commit_announcement(self, non_lazy_inputs):
+        """Is called at the end of a :func:`connectors.transaction`, to forward
+        the announcement, that has been deferred during the transaction, to the
+        connected input connectors.
+
+        :param non_lazy_inputs: a :class:`~connectors._common._non_lazy_inputs.NonLazyInputs`
+                                instance to which input connectors can be appended,
+                                if they request an immediate re-computation
+        """
+        if not self.__announcements:    # otherwise, the announcement has already been forwarded by the commit of an output connector further up the processing chain
+            self.__forward_announcement(non_lazy_inputs)
+
+    def __forward_announcement(self, non_lazy_inputs):
+        """Forwards an announcement to the connected input connectors.
+
+        :param non_lazy_inputs: a :class:`~connectors._common._non_lazy_inputs.NonLazyInputs`
+                                instance to which input connectors can be appended,
+                                if they request an immediate re-computation
+        """
+        if self.__generation == non_lazy_inputs.generation:
+            return  # the announcement has already been forwarded in this pass through another path, for example, in a diamond shaped network
+        self.__generation = non_lazy_inputs.generation
         for c, _ in self.__connections:
             c._announce(self, non_lazy_inputs)
 
-    def _notify(self, connector):
+    def _notify(self, connector, value=common.NO_VALUE):
         """This method is to notify this output connector, when an observed input
         connector (a setter from the instance to which this connector belongs)
         has retrieved updated data.
 
         :param connector: the input connector, which has changed a value
+        :param value: the new value of the input connector, which is used for the
+                      memoization, or :data:`~connectors._common._memoization.NO_VALUE`,
+                      if the value is not known
         :param non_lazy_inputs: a :class:`~connectors._common._non_lazy_inputs.NonLazyInputs`
                                 instance to which input connectors can be appended,
                                 if they request an immediate re-computation (see
@@ -140,6 +279,8 @@ class OutputConnector(Connector):
         self.__result_is_valid = False
         self.__observed_has_changed = True
         self.__result = None
+        common.cache_manager.remove(self, None)
+        self.__memo.notify(connector, value)
         self.__announcements.discard(connector)
         if not self.__announcements:
             self.__computable.set()
@@ -171,9 +312,12 @@ class OutputConnector(Connector):
             self.__running = True
             try:
                 if self.__result_is_valid:
+                    result = self.__result  # the result can be evicted from the cache, while the connected inputs are notified
+                    common.cache_manager.touch(self, None)
+                    self.__report("cache_hit")
                     if self.__connections:
-                        await asyncio.gather(*(c._notify(self, self.__result, executor) for c, _ in self.__connections))
-                    return self.__result
+                        await asyncio.gather(*(c._notify(self, result, executor) for c, _ in self.__connections))
+                    return result
                 else:
                     # wait for the announced value changes
                     if self.__announcements:
@@ -182,15 +326,152 @@ class OutputConnector(Connector):
                         if self.__result_is_valid:  # this can happen, if all announcements have been canceled
                             return self.__result
                     # execute the getter
-                    result = await executor.run_method(self._parallelization, self._method,
-                                                       self._instance(), *args, **kwargs)
-                    if self.__caching:
-                        self.__result = result
-                        self.__result_is_valid = True
-                        self.__observed_has_changed = False
+                    lookup = self.__look_up(bool(args or kwargs))
+                    result = lookup[0]
+                    if result is common.NO_VALUE:
+                        result = await executor.run_method(self._parallelization, self._method, self._coroutine,
+                                                           self._instance(), *args, **kwargs)
+                    self.__store(result, lookup)
                     # notify the connected inputs
                     if self.__connections:
                         await asyncio.gather(*(c._notify(self, result, executor) for c, _ in self.__connections))
                     return result
             finally:
                 self.__running = False
+
+    def _downstream(self):
+        """Returns the connected input connectors, which is used for estimating
+        the length of the critical path through the processing network.
+
+        :returns: a tuple of input connectors
+        """
+        return tuple(c for c, _ in self.__connections)
+
+    def _plan_upstream(self):
+        """Returns the input connectors, that are observed by this output connector,
+        which is used for compiling an :class:`~connectors.connectors.ExecutionPlan`.
+
+        :returns: a tuple of input connectors
+        """
+        return tuple(c for c in vars(self._instance()).values()
+                     if isinstance(c, InputConnector) and self in c._get_observers())     # pylint: disable=protected-access # this method is called by the connectors, but is not part of the public API
+
+    def _plan_pending(self):
+        """Returns the observed input connectors, whose announced value changes
+        are still pending.
+
+        :returns: a tuple of input connectors
+        """
+        return tuple(self.__announcements)
+
+    def _plan_result(self):
+        """Returns the cached result, if it is valid.
+
+        :returns: the result or :data:`~connectors._common._memoization.NO_VALUE`
+        """
+        if self.__result_is_valid:
+            common.cache_manager.touch(self, None)
+            self.__report("cache_hit")
+            return self.__result
+        return common.NO_VALUE
+
+    def _plan_look_up(self):
+        """Is called by an :class:`~connectors.connectors.ExecutionPlan` before
+        executing the getter, to retrieve the result from the cache, the memoization
+        or the disk cache.
+
+        :returns: a tuple, whose first element is the result or :data:`~connectors._common._memoization.NO_VALUE`,
+                  if the getter has to be executed. The tuple has to be passed
+                  to :meth:`_plan_finish`
+        """
+        result = self._plan_result()
+        if result is not common.NO_VALUE:
+            return result, None
+        return self.__look_up(False)
+
+    def _plan_finish(self, result, lookup, executor):
+        """Is called by an :class:`~connectors.connectors.ExecutionPlan` after
+        it has executed the getter. This caches the result and passes it to the
+        connected input connectors.
+
+        :param result: the result
+        :param lookup: the tuple, that has been returned by :meth:`_plan_look_up`
+        :param executor: the :class:`~connectors._common._executors.Executor` instance,
+                         that manages the current computations
+        :returns: a list of coroutines, that have to be awaited for notifying
+                  the connected input connectors, which cannot be notified synchronously
+        """
+        if lookup[1] is not None:
+            self.__store(result, lookup)
+        coroutines = []
+        for c, _ in self.__connections:
+            if isinstance(c, SingleInputConnector):
+                if c._receive(self, result):     # pylint: disable=protected-access # this method is called by the connectors, but is not part of the public API
+                    coroutines.append(c._request(executor))
+            else:
+                coroutines.append(c._notify(self, result, executor))
+        return coroutines
+
+    def __look_up(self, has_arguments):
+        """Looks up the result in the memoization and the disk cache.
+
+        :param has_arguments: True, if the getter is called with arguments, in
+                              which case, the result is not looked up
+        :returns: a tuple (result, start time, memoization state, disk cache key),
+                  in which the result is :data:`~connectors._common._memoization.NO_VALUE`,
+                  if the getter has to be executed
+        """
+        start = time.perf_counter()
+        state = self.__memo.state() if self.__memo and self.__caching and not has_arguments else None
+        result = common.NO_VALUE if state is None else self.__memo.get(state)
+        if result is not common.NO_VALUE:
+            self.__report("memo_hit")
+            return result, start, state, None
+        disk_key = None
+        if self.__disk_cache is not None and not has_arguments:
+            disk_key = self.__disk_cache.key(self._method, self._instance())
+            if disk_key is not None:
+                result = self.__disk_cache.load(disk_key)
+        self.__report("cache_miss" if result is common.NO_VALUE else "cache_hit")
+        return result, start, state, disk_key
+
+    def __report(self, event):
+        """Reports a cache hit, a memoization hit or a cache miss to the profiling
+        hooks, if profiling is active.
+
+        :param event: ``"cache_hit"``, if the result has been taken from a cache,
+                      ``"memo_hit"``, if it has been taken from the memoization,
+                      or ``"cache_miss"``, if the getter has to be executed
+        """
+        if common.profiler.active():
+            common.profiler.count(event, self._method, self._instance())
+
+    def __store(self, result, lookup):
+        """Stores a result in the cache, the memoization and the disk cache.
+
+        :param result: the result
+        :param lookup: the tuple, that has been returned by :meth:`__look_up`
+        """
+        computed = lookup[0] is common.NO_VALUE
+        _, start, state, disk_key = lookup
+        if computed and disk_key is not None:
+            self.__disk_cache.store(disk_key, result)
+        if state is not None:
+            self.__memo.remember(state, result)
+        if self.__caching:
+            self.__result = result
+            self.__result_is_valid = True
+            self.__observed_has_changed = False
+            if common.cache_manager.has_budget():
+                common.cache_manager.add(self, None, common.get_size(result), time.perf_counter() - start)
+
+    def _evict(self, key):  # pylint: disable=unused-argument # the key is always None for output connectors
+        """Is called by the :class:`~connectors._common._cache_manager.CacheManager`,
+        when the cached result shall be discarded to comply with the memory budget.
+        The result is re-computed, when it is requested the next time.
+
+        :param key: the key of the result, which is None for output connectors
+        """
+        self.__result_is_valid = False
+        self.__observed_has_changed = True  # prevents, that the discarded result is validated again, when all announcements are canceled
+        self.__result = None
@@ -0,0 +1,302 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the :class:`~connectors.connectors.ExecutionPlan` class and the
+:func:`connectors.compile_plan` function, with which it is created.
+"""
+
+import asyncio
+from .. import _common as common
+from .._macro._output import MacroOutputConnector
+from .._proxies._baseclasses import ConnectorProxy
+from ._input import SingleInputConnector
+from ._output import OutputConnector
+
+__all__ = ("ExecutionPlan", "compile_plan")
+
+
+def compile_plan(connector):
+    """Compiles an :class:`~connectors.connectors.ExecutionPlan` for the processing
+    network, that computes the result of the given output connector.
+
+    :param connector: the output connector (or its proxy or a macro output connector,
+                      that exports it), whose result shall be computed with the plan
+    :returns: an :class:`~connectors.connectors.ExecutionPlan` instance
+    :raises TypeError: if the given object is not an output connector
+    """
+    return ExecutionPlan(connector)
+
+
+class ExecutionPlan:
+    """A static execution plan for the processing network, that computes the
+    result of an output connector.
+
+    Normally, the connectors find the computations, that have to be done, by
+    recursively requesting the values from the connectors further up the processing
+    chain, which creates coroutines for every connection. For a network with a fixed
+    topology, this plan sorts the connectors topologically once, and then executes
+    the outdated connectors in that order. Connectors, that are independent of
+    each other, are executed in parallel, if their parallelization setting and
+    the executor allow that. The plan is compiled again automatically, when connectors
+    are connected or disconnected anywhere.
+
+    The plan executes single-input and output connectors directly. Multi-input
+    and multi-output connectors are requested through the usual protocol, so
+    the network above them is not part of the plan. The plan keeps the instances
+    of the connectors in its network alive.
+
+    Calling the plan returns the same value as calling the output connector.
+    """
+
+    def __init__(self, connector):
+        """
+        :param connector: the output connector (or its proxy or a macro output connector,
+                          that exports it), whose result shall be computed with the plan
+        :raises TypeError: if the given object is not an output connector
+        """
+        while isinstance(connector, MacroOutputConnector):
+            connector = connector._get_exported()      # pylint: disable=protected-access # the plan is part of the connectors' implementation
+        if isinstance(connector, ConnectorProxy):
+            connector = connector._get_connector()     # pylint: disable=protected-access # the plan is created from a connector or its proxy
+        if not isinstance(connector, OutputConnector):
+            raise TypeError("Only output connectors can be compiled to an execution plan.")
+        self.__target = connector
+        self.__levels = ()          # a tuple of tuples of connectors, in which each connector only depends on connectors in the previous tuples
+        self.__compiled = {}        # maps the connectors, which are executed by the plan, rather than through the usual protocol, to their instances. The instances are only saved to prevent their deletion through reference counting
+        self.__version = None
+        self.__compile()
+
+    def __call__(self):
+        """Computes the result of the output connector.
+
+        :returns: the result value of the output connector
+        """
+        executor = self.__target._executor    # pylint: disable=protected-access # the plan is part of the connectors' implementation
+        if common.thread_safety.enabled:
+            return common.thread_safety.run(self, self.__target._get_instance(), executor, self.__run)  # pylint: disable=protected-access # see above
+        return self.__run(executor)
+
+    def __run(self, executor):
+        """Computes the result of the output connector with the given executor.
+
+        :param executor: the :class:`~connectors._common._executors.Executor` instance,
+                         with which the outdated connectors shall be executed
+        :returns: the result value of the output connector
+        """
+        if self.__version != common.topology.version():
+            self.__compile()
+        result = self.__target._plan_result()     # pylint: disable=protected-access # the plan is part of the connectors' implementation
+        if result is common.NO_VALUE:
+            result = executor.run_coroutine(self.__execute(executor))
+        return result
+
+    async def async_call(self):
+        """Computes the result of the output connector in the event loop, that
+        is already running (see :meth:`connectors.connectors.Connector.async_call`).
+
+        :returns: the result value of the output connector
+        """
+        if self.__version != common.topology.version():
+            self.__compile()
+        result = self.__target._plan_result()     # pylint: disable=protected-access # the plan is part of the connectors' implementation
+        if result is common.NO_VALUE:
+            executor = self.__target._executor    # pylint: disable=protected-access # the plan is part of the connectors' implementation
+            result = await executor.run_async(self.__execute(executor))
+        return result
+
+    def __len__(self):
+        """Returns the number of connectors in the plan.
+
+        :returns: an integer
+        """
+        if self.__version != common.topology.version():
+            self.__compile()
+        return sum(len(level) for level in self.__levels)
+
+    def __compile(self):
+        """Takes a snapshot of the network above the output connector and sorts
+        its connectors topologically.
+        """
+        upstream = {}
+        levels = {}
+        visiting = set()
+        stack = [(self.__target, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                visiting.discard(node)
+                levels[node] = 1 + max((levels[u] for u in upstream[node]), default=-1)
+            elif node not in levels:
+                if node in visiting:
+                    raise ValueError("The processing network contains a cycle, so that it cannot be compiled.")
+                visiting.add(node)
+                stack.append((node, True))
+                if isinstance(node, (OutputConnector, SingleInputConnector)):
+                    upstream[node] = node._plan_upstream()     # pylint: disable=protected-access # the plan is part of the connectors' implementation
+                else:
+                    upstream[node] = ()     # connectors, that are not compiled, request their inputs on their own
+                stack.extend((u, False) for u in upstream[node] if u not in levels)
+        grouped = [[] for _ in range(levels[self.__target] + 1)]
+        for node, level in levels.items():
+            grouped[level].append(node)
+        self.__levels = tuple(tuple(g) for g in grouped)
+        compiled = (n for n in levels if isinstance(n, (OutputConnector, SingleInputConnector)))
+        self.__compiled = {n: n._get_instance() for n in compiled}     # pylint: disable=protected-access # the plan is part of the connectors' implementation
+        self.__version = common.topology.version()
+
+    async def __execute(self, executor):
+        """Executes the outdated connectors in the topological order.
+
+        :param executor: the :class:`~connectors._common._executors.Executor` instance,
+                         that manages the computations
+        :returns: the result value of the output connector
+        """
+        needed = self.__needed()
+        result = None
+        for level in self.__levels:
+            notifications = []
+            jobs, level_result = await self.__collect_jobs(level, needed, executor, notifications)
+            if level_result is not common.NO_VALUE:
+                result = level_result
+            if jobs:
+                result = await self.__run_jobs(jobs, executor, notifications)
+            if notifications:
+                await asyncio.gather(*notifications)
+        return result
+
+    def __needed(self):
+        """Finds the connectors, whose execution is needed for the result.
+
+        :returns: a set of connectors
+        """
+        needed = {self.__target}
+        for level in reversed(self.__levels):
+            for node in level:
+                if node in needed and node in self.__compiled:
+                    needed.update(node._plan_pending())     # pylint: disable=protected-access # the plan is part of the connectors' implementation
+        return needed
+
+    async def __collect_jobs(self, level, needed, executor, notifications):
+        """Finds the connectors of one level, whose methods have to be executed.
+        Outdated connectors, which are not compiled, are requested through the
+        usual protocol, and output connectors, whose result can be looked up, are
+        finished right away.
+
+        :param level: a tuple of connectors
+        :param needed: the set of connectors, whose execution is needed for the result
+        :param executor: the :class:`~connectors._common._executors.Executor` instance,
+                         that manages the computations
+        :param notifications: a list, to which the coroutines for notifying connected
+                              inputs, that cannot be notified synchronously, are appended
+        :returns: a tuple with a list of jobs ``(connector, arguments, context)``
+                  and the result of the last connector, that has been finished, or
+                  :data:`~connectors._common._memoization.NO_VALUE`
+        """
+        jobs = []
+        result = common.NO_VALUE
+        for node in level:
+            if node not in needed:
+                continue
+            if node not in self.__compiled or node._plan_pending():     # pylint: disable=protected-access # the plan is part of the connectors' implementation
+                result = await node._request(executor)     # pylint: disable=protected-access # fall back to the usual protocol, for example, if an announced value change does not come from the plan's network
+            elif isinstance(node, OutputConnector):
+                lookup = node._plan_look_up()     # pylint: disable=protected-access # the plan is part of the connectors' implementation
+                if lookup[0] is common.NO_VALUE:
+                    jobs.append((node, (), lookup))
+                else:
+                    result = lookup[0]
+                    notifications.extend(node._plan_finish(result, lookup, executor))     # pylint: disable=protected-access # the plan is part of the connectors' implementation
+            else:
+                value = node._plan_notification()     # pylint: disable=protected-access # the plan is part of the connectors' implementation
+                if value is not common.NO_VALUE:
+                    jobs.append((node, (value,), value))
+        return jobs, result
+
+    async def __run_jobs(self, jobs, executor, notifications):
+        """Executes the methods of the connectors of one level. Methods, that
+        block the event loop, are executed one after the other, while the others
+        are awaited concurrently.
+
+        :param jobs: a list of jobs ``(connector, arguments, context)``
+        :param executor: the :class:`~connectors._common._executors.Executor` instance,
+                         that manages the computations
+        :param notifications: a list, to which the coroutines for notifying connected
+                              inputs, that cannot be notified synchronously, are appended
+        :returns: the return value of the last executed method
+        """
+        result = None
+        sequential, parallel = [], []
+        for job in jobs:
+            (sequential if _blocks(executor, job[0]) else parallel).append(job)
+        if len(parallel) == 1 and not sequential:   # a shortcut for chains, in which there is nothing to parallelize
+            node, args, context = parallel[0]
+            value = await _run_method(executor, node, *args)
+            return self.__finish(node, value, context, executor, notifications)
+        tasks = [asyncio.ensure_future(_run_method(executor, n, *args)) for n, args, _ in parallel]
+        if tasks:
+            await asyncio.sleep(0)  # let the tasks pass their methods to the thread or process pools, before the sequential methods block the event loop
+        for node, args, context in sequential:
+            value = common.profiler.run(node._method, node._instance(), *args)     # pylint: disable=protected-access # the plan is part of the connectors' implementation
+            result = self.__finish(node, value, context, executor, notifications)
+        if tasks:
+            for (node, _, context), value in zip(parallel, await asyncio.gather(*tasks)):
+                result = self.__finish(node, value, context, executor, notifications)
+        return result
+
+    @staticmethod
+    def __finish(node, value, context, executor, notifications):
+        """Processes the return value of an executed connector.
+
+        :param node: the connector
+        :param value: the return value of the replaced method
+        :param context: the value, that has been passed to the method of an input
+                        connector, or the lookup tuple of an output connector
+        :param executor: the :class:`~connectors._common._executors.Executor` instance,
+                         that manages the computations
+        :param notifications: a list, to which the coroutines for notifying connected
+                              inputs, that cannot be notified synchronously, are appended
+        :returns: the return value of the method
+        """
+        if isinstance(node, OutputConnector):
+            notifications.extend(node._plan_finish(value, context, executor))     # pylint: disable=protected-access # the plan is part of the connectors' implementation
+        else:
+            node._plan_finish(context)     # pylint: disable=protected-access # the plan is part of the connectors' implementation
+        return value
+
+
+def _run_method(executor, node, *args):
+    """Executes the method of a connector of the plan with the given executor.
+
+    :param executor: the :class:`~connectors._common._executors.Executor` instance,
+                     that manages the computations
+    :param node: the connector
+    :param `*args`: the arguments for the method
+    :returns: an awaitable for the return value of the method
+    """
+    return executor.run_method(node._parallelization, node._method, node._coroutine, node._instance(), *args)     # pylint: disable=protected-access # the plan is part of the connectors' implementation
+
+
+def _blocks(executor, node):
+    """Checks, if the method of a connector of the plan blocks the event loop,
+    while it is executed. Coroutine methods do not block the event loop, so they
+    can be awaited concurrently.
+
+    :param executor: the :class:`~connectors._common._executors.Executor` instance,
+                     that manages the computations
+    :param node: the connector
+    :returns: True, if the method blocks the event loop, False otherwise
+    """
+    return executor.runs_sequentially(node._parallelization) and not node._coroutine     # pylint: disable=protected-access # the plan is part of the connectors' implementation
@@ -16,7 +16,7 @@
 
 """Contains the :class:`~connectors.MultiOutput` class for decorating getter methods with an input parameter."""
 
-from .._common import Parallelization
+from .._common import ChangeDetection, EvictionPolicy, MultiOutputOptions, Parallelization
 from .._proxies import MultiOutputProxy
 from ._baseclasses import ConnectorDecorator, default_executor
 
@@ -44,7 +44,13 @@ class MultiOutput(ConnectorDecorator):
     def __init__(self,
                  caching=True,
                  parallelization=Parallelization.default_multioutput_parallelization(),
-                 executor=default_executor):
+                 executor=default_executor,
+                 max_entries=None,
+                 max_bytes=None,
+                 eviction_policy=EvictionPolicy.LRU,
+                 memoize=0,
+                 hasher=None,
+                 change_detection=ChangeDetection.ALWAYS):
         """
         :param caching: True, if caching shall be enabled, False otherwise. See
                         the :class:`~connectors.connectors.MultiOutputConnector`'s
@@ -59,10 +65,42 @@ class MultiOutput(ConnectorDecorator):
                          function. See the :class:`~connectors.connectors.MultiOutputConnector`'s
                          :meth:`~connectors.connectors.MultiOutputConnector.set_executor`
                          method for details
+        :param max_entries: the maximum number of cached results or None for no limit.
+                            See the :class:`~connectors.connectors.MultiOutputConnector`'s
+                            :meth:`~connectors.connectors.MultiOutputConnector.set_caching`
+                            method for details
+        :param max_bytes: the maximum memory consumption of the cached results in
+                          bytes or None for no limit. See the :class:`~connectors.connectors.MultiOutputConnector`'s
+                          :meth:`~connectors.connectors.MultiOutputConnector.set_caching`
+                          method for details
+        :param eviction_policy: a flag from the :class:`connectors.EvictionPolicy` enum,
+                                that specifies, which results are evicted first, when
+                                a limit of the cache is exceeded
+        :param memoize: the number of states of the observed inputs, for which the
+                        results shall be remembered, so that the getter is not called
+                        again, when the inputs return to a previously seen state.
+                        0 disables the memoization and None remembers the results
+                        for all states. See the :class:`~connectors.connectors.MultiOutputConnector`'s
+                        :meth:`~connectors.connectors.MultiOutputConnector.set_memoization`
+                        method for details
+        :param hasher: a function, that computes a hashable fingerprint of a value,
+                       that has been passed to an observed input connector, or None
+                       for the default function
+        :param change_detection: a flag from the :class:`connectors.ChangeDetection` enum,
+                                 that specifies, which values are passed to connected
+                                 multi-input connectors. See the :class:`~connectors.connectors.MultiOutputConnector`'s
+                                 :meth:`~connectors.connectors.MultiOutputConnector.set_change_detection`
+                                 method for details
         """
         ConnectorDecorator.__init__(self, parallelization, executor)
         self.__caching = caching
-        self.__keys = no_keys
+        self.__options = MultiOutputOptions(keys=no_keys,
+                                            max_entries=max_entries,
+                                            max_bytes=max_bytes,
+                                            eviction_policy=eviction_policy,
+                                            memoize=memoize,
+                                            hasher=hasher,
+                                            change_detection=change_detection)
 
     def __get__(self, instance, instance_type):
         """Is called, when the decorated method is accessed.
@@ -77,7 +115,7 @@ class MultiOutput(ConnectorDecorator):
                                 caching=self.__caching,
                                 parallelization=self._parallelization,
                                 executor=self._executor,
-                                keys=self.__keys)
+                                options=self.__options)
 
     def keys(self, method):
         """A decorator for the keys-method of the multi-output.
@@ -93,5 +131,45 @@ class MultiOutput(ConnectorDecorator):
         :param method: the unbound keys-method
         :returns: the given keys-method without any modifications
         """
-        self.__keys = method
+        self.__options = self.__options._replace(keys=method)    # pylint: disable=protected-access # _replace is the public API of named tuples
+        return method
+
+    def batch(self, method):
+        """A decorator for a method, that computes the values of the multi-output
+        for many keys at once.
+        The decorated method shall accept a sequence of keys and return either
+        a mapping from these keys to the values, or a sequence (e.g. a NumPy array)
+        with the values in the order of the keys. This allows implementations,
+        that are based on vectorized libraries such as NumPy, to compute all values
+        in one pass, rather than paying the overhead of calling the getter for
+        every key.
+
+        The batch method is used, when the multi-output connector computes the
+        values for all keys, that are returned by the keys-method, in order to
+        pass them to a multi-input connector. The values for the keys, that are
+        cached or memoized, are not computed again. Retrieving the value for a
+        single key still calls the decorated getter method.
+
+        :param method: the unbound batch method
+        :returns: the given batch method without any modifications
+        """
+        self.__options = self.__options._replace(batch=method)    # pylint: disable=protected-access # _replace is the public API of named tuples
+        return method
+
+    def version(self, method):
+        """A decorator for a method, that returns a version for the value of the
+        multi-output for a given key.
+        The version can be any object, that supports the ``==`` comparison, such
+        as a counter, that is incremented, whenever the respective value changes.
+
+        When the multi-output connector passes its values to a connected multi-input
+        connector, it compares the versions with those of the values, that have
+        been passed before. The values, whose versions have not changed, are neither
+        computed nor passed to the multi-input connector, so that small changes
+        to a large number of values only cause a small amount of computation.
+
+        :param method: the unbound version method
+        :returns: the given version method without any modifications
+        """
+        self.__options = self.__options._replace(version=method)    # pylint: disable=protected-access # _replace is the public API of named tuples
         return method
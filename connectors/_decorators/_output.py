@@ -16,7 +16,7 @@
 
 """Contains the :class:`Output` class for decorating getter methods"""
 
-from connectors._common import Parallelization
+from connectors._common import Parallelization, streaming_method
 from .._proxies import OutputProxy
 from ._baseclasses import ConnectorDecorator, default_executor
 
@@ -33,7 +33,12 @@ class Output(ConnectorDecorator):
     def __init__(self,
                  caching=True,
                  parallelization=Parallelization.default_output_parallelization(),
-                 executor=default_executor):
+                 executor=default_executor,
+                 memoize=0,
+                 hasher=None,
+                 disk_cache=None,
+                 streaming=False,
+                 prefetch=0):
         """
         :param caching: True, if caching shall be enabled, False otherwise. See
                         the :class:`~connectors.connectors.OutputConnector`'s
@@ -48,9 +53,49 @@ class Output(ConnectorDecorator):
                          function. See the :class:`~connectors.connectors.OutputConnector`'s
                          :meth:`~connectors.connectors.OutputConnector.set_executor`
                          method for details
+        :param memoize: the number of states of the observed inputs, for which the
+                        results shall be remembered, so that the getter is not called
+                        again, when the inputs return to a previously seen state.
+                        0 disables the memoization and None remembers the results
+                        for all states. See the :class:`~connectors.connectors.OutputConnector`'s
+                        :meth:`~connectors.connectors.OutputConnector.set_memoization`
+                        method for details
+        :param hasher: a function, that computes a hashable fingerprint of a value,
+                       that has been passed to an observed input connector, or None
+                       for the default function
+        :param disk_cache: a :class:`~connectors.DiskCache` instance, in which
+                           the results shall be stored, so that they survive the
+                           end of the process, or None. See the :class:`~connectors.connectors.OutputConnector`'s
+                           :meth:`~connectors.connectors.OutputConnector.set_disk_cache`
+                           method for details
+        :param streaming: True, if the decorated method returns an iterable of
+                          chunks, such as a generator, which shall be passed through
+                          the connections chunk by chunk. In this case, the getter
+                          returns a :class:`~connectors.Stream`, which calls the
+                          decorated method, whenever it is iterated over
+        :param prefetch: for streaming outputs, the maximum number of chunks, that
+                         are produced in a separate thread ahead of the consumer,
+                         so that consecutive stages of a streaming processing chain
+                         work concurrently. 0 produces the chunks in the consuming
+                         thread
         """
         ConnectorDecorator.__init__(self, parallelization, executor)
         self.__caching = caching
+        self.__memoize = memoize
+        self.__hasher = hasher
+        self.__disk_cache = disk_cache
+        self.__streaming = streaming
+        self.__prefetch = prefetch
+
+    def __call__(self, method):
+        """Is called in order to replace the decorated method with this decorator.
+
+        :param method: the unbound method, that was decorated with this decorator
+        :returns: this decorator
+        """
+        if self.__streaming:
+            method = streaming_method(method, self.__prefetch)
+        return ConnectorDecorator.__call__(self, method)
 
     def __get__(self, instance, instance_type):
         """Is called, when the decorated method is accessed.
@@ -64,4 +109,7 @@ class Output(ConnectorDecorator):
                            method=self._method,
                            caching=self.__caching,
                            parallelization=self._parallelization,
-                           executor=self._executor)
+                           executor=self._executor,
+                           memoize=self.__memoize,
+                           hasher=self.__hasher,
+                           disk_cache=self.__disk_cache)
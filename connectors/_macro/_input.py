@@ -17,6 +17,7 @@
 """Contains the decorator and connector classes for the macro input connector."""
 
 import functools
+from .. import _common as common
 from ._baseclass import MacroDecorator
 
 __all__ = ("MacroInput",)
@@ -70,6 +71,7 @@ class MacroInputConnector:
         self.__method = method
         functools.update_wrapper(self, method)
 
+    @common.guarded
     def __call__(self, *args, **kwargs):
         """Calls all input connectors, that are exported by this, with the given
         parameters.
@@ -81,6 +83,18 @@ class MacroInputConnector:
             connector(*args, **kwargs)
         return self.__instance
 
+    async def async_call(self, *args, **kwargs):
+        """Calls all input connectors, that are exported by this, with the given
+        parameters in the event loop, that is already running
+        (see :meth:`connectors.connectors.Connector.async_call`).
+
+        :param `*args,**kwargs`: parameters with which the exported input connectors shall be called
+        :returns: the instance of which this connector has replaced a method
+        """
+        for connector in self.__method(self.__instance):
+            await connector.async_call(*args, **kwargs)
+        return self.__instance
+
     def set_laziness(self, laziness):
         """Configures the lazy execution of the connector.
         Normally the connectors are executed lazily, which means, that any computation
@@ -71,6 +71,14 @@ class MacroOutputConnector:
         """
         return self.__method(self.__instance)()
 
+    async def async_call(self):
+        """Calls the output connector, that is exported by this, in the event loop,
+        that is already running (see :meth:`connectors.connectors.Connector.async_call`).
+
+        :returns: the return value from the call
+        """
+        return await self.__method(self.__instance).async_call()
+
     def set_caching(self, caching):
         """Specifies, if the result value of this output connector shall be cached.
         If caching is enabled and the result value is retrieved (e.g. through a
@@ -133,3 +141,10 @@ class MacroOutputConnector:
         """
         self.__method(self.__instance).disconnect(connector)
         return self.__instance
+
+    def _get_exported(self):
+        """Returns the output connector, that is exported by this.
+
+        :returns: an output connector, its proxy or another :class:`MacroOutputConnector`
+        """
+        return self.__method(self.__instance)
@@ -17,6 +17,7 @@
 """Contains :class:`ConnectorProxy`, the base class for connector proxies."""
 
 import functools
+from .. import _common as common
 
 
 class ConnectorProxy:
@@ -45,6 +46,7 @@ class ConnectorProxy:
         """
         self.__instance = instance
         self.__method = method
+        self.__coroutine = common.is_coroutine_method(method)
         self._parallelization = parallelization
         self._executor = executor
         self.__connector = None
@@ -55,7 +57,27 @@ class ConnectorProxy:
 
         :param `*args,**kwargs`: possible arguments for the replaced method
         """
-        return self.__method(self.__instance, *args, **kwargs)
+        return self._executor.call_method(self.__method, self.__coroutine, self.__instance, *args, **kwargs)
+
+    async def async_call(self, *args, **kwargs):
+        """Executes the replaced method with the executor in the event loop, that
+        is already running (see :meth:`connectors.connectors.Connector.async_call`).
+
+        :param `*args,**kwargs`: possible arguments for the replaced method
+        :returns: the return value of the replaced method
+        """
+        executor = self._executor
+        return await executor.run_async(self._run_method(self._parallelization, *args, **kwargs))
+
+    async def _run_method(self, parallelization, *args, **kwargs):
+        """Executes the replaced method with the executor.
+
+        :param parallelization: a flag from the :class:`connectors.Parallelization` enum
+        :param `*args,**kwargs`: possible arguments for the replaced method
+        :returns: the return value of the replaced method
+        """
+        return await self._executor.run_method(parallelization, self.__method, self.__coroutine, self.__instance,
+                                               *args, **kwargs)
 
     def connect(self, connector):
         """Connects this connector with another one.
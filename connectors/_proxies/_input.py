@@ -67,24 +67,55 @@ class SingleInputProxy(ConnectorProxy):
         self._announce_condition = announce_condition
         self._notify_condition = notify_condition
 
+    @common.guarded
     def __call__(self, *args, **kwargs):
         """Executes the replaced method and notifies the observing output connectors.
         :param `*args,**kwargs`: possible arguments for the replaced method
         """
+        non_lazy_inputs = self.__announce_change()
+        result = ConnectorProxy.__call__(self, *args, **kwargs)
+        self.__notify_change(*args, **kwargs)
+        non_lazy_inputs.execute(self._executor)
+        return result
+
+    async def async_call(self, *args, **kwargs):
+        """Executes the replaced method and notifies the observing output connectors.
+        The computations of the non-lazy input connectors, that are caused by this,
+        are awaited in the event loop, that is already running. If the replaced
+        method has been defined with ``async def``, it is awaited as well.
+
+        :param `*args,**kwargs`: possible arguments for the replaced method
+        :returns: the return value of the replaced method
+        """
+        non_lazy_inputs = self.__announce_change()
+        result = await self._run_method(common.Parallelization.SEQUENTIAL, *args, **kwargs)
+        self.__notify_change(*args, **kwargs)
+        await non_lazy_inputs.execute_async(self._executor)
+        return result
+
+    @common.guarded
+    def __announce_change(self):
+        """Announces a value change to the observing output connectors.
+
+        :returns: the :class:`~connectors._common._non_lazy_inputs.NonLazyInputs`
+                  instance, whose computations have to be executed after the change
+        """
         instance = self._get_instance()
-        # announce the value change
         non_lazy_inputs = common.NonLazyInputs(common.Laziness.ON_ANNOUNCE)
         for o in self._observers:
             getattr(instance, o)._announce(self, non_lazy_inputs)
-        # call the replaced method
-        result = ConnectorProxy.__call__(self, *args, **kwargs)
-        # notify observers about the value change
+        return non_lazy_inputs
+
+    @common.guarded
+    def __notify_change(self, *args, **kwargs):
+        """Notifies the observing output connectors, after the replaced method has been called.
+
+        :param `*args,**kwargs`: the arguments, with which the replaced method has been called
+        """
+        instance = self._get_instance()
+        value = common.pack_arguments(*args, **kwargs)
         for o in self._observers:
-            getattr(instance, o)._notify(self)
-        # execute the non-lazy inputs
-        non_lazy_inputs.execute(self._executor)
-        # return the result of the method call
-        return result
+            getattr(instance, o)._notify(self, value)
 
     def set_laziness(self, laziness):
         """Configures the lazy execution of the connector.
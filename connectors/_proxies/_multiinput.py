@@ -16,6 +16,7 @@
 
 """Contains classes for the multi-input proxies"""
 
+import inspect
 from .. import _connectors as connectors
 from .. import _common as common
 from ._input import SingleInputProxy
@@ -49,6 +50,36 @@ class ReplaceMethod:
         return self.__add(instance, value)
 
 
+class AsyncReplaceMethod:
+    """Like :class:`ReplaceMethod`, but for multi-input connectors, whose add or
+    remove method has been defined with ``async def``.
+    """
+
+    def __init__(self, add_method, remove_method):
+        """
+        :param method: the unbound method, that is replaced by the multi-input connector
+        :param remove_method: the unbound method, that is used to remove data, that
+                              has been added through the multi-input connector
+        """
+        self.__add = add_method
+        self.__remove = remove_method
+
+    async def __call__(self, instance, data_id, value):
+        """
+        :param instance: the instance in which the method has been replaced by the multi-input connector
+        :param data_id: the ID under which the data, that shall be replaced, has been stored
+        :param value: the new value
+        :returns: the new data ID, under which the new data is stored
+        """
+        removed = self.__remove(instance, data_id)
+        if inspect.isawaitable(removed):
+            await removed
+        data_id = self.__add(instance, value)
+        if inspect.isawaitable(data_id):
+            data_id = await data_id
+        return data_id
+
+
 class MultiInputProxy(SingleInputProxy):
     """A proxy class for multi-input connectors.
     Connector proxies are returned by the connector decorators, while the methods
@@ -105,9 +136,14 @@ class MultiInputProxy(SingleInputProxy):
                                   executor=executor)
         self.__remove = remove_method
         if replace_method is None:
-            self.__replace = ReplaceMethod(add_method=method, remove_method=remove_method)
+            self.__replace_coroutine = common.is_coroutine_method(method) or common.is_coroutine_method(remove_method)
+            if self.__replace_coroutine:
+                self.__replace = AsyncReplaceMethod(add_method=method, remove_method=remove_method)
+            else:
+                self.__replace = ReplaceMethod(add_method=method, remove_method=remove_method)
         else:
             self.__replace = replace_method
+            self.__replace_coroutine = common.is_coroutine_method(replace_method)
 
     def __getitem__(self, key):
         """Allows to use a multi-input connector as multiple single-input connectors.
@@ -127,6 +163,7 @@ class MultiInputProxy(SingleInputProxy):
         return common.MultiInputItem(connector=self,
                                      instance=self._get_instance(),
                                      replace_method=self.__replace,
+                                     coroutine=self.__replace_coroutine,
                                      key=key,
                                      observers=(),
                                      executor=self._executor)
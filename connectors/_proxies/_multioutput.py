@@ -43,7 +43,7 @@ class MultiOutputProxy(ConnectorProxy):
     during its call.
     """
 
-    def __init__(self, instance, method, caching, parallelization, executor, keys):
+    def __init__(self, instance, method, caching, parallelization, executor, options):
         """
         :param instance: the instance in which the method is replaced by this connector proxy
         :param method: the unbound method that is replaced by this connector proxy
@@ -56,10 +56,12 @@ class MultiOutputProxy(ConnectorProxy):
                          function. See the :class:`~connectors.connectors.OutputConnector`'s
                          :meth:`~connectors.connectors.OutputConnector.set_executor`
                          method for details
+        :param options: a :class:`~connectors._common._multioutput_options.MultiOutputOptions`
+                        tuple with the further settings of the multi-output connector
         """
         ConnectorProxy.__init__(self, instance, method, parallelization, executor)
         self.__caching = caching
-        self.__keys = keys
+        self.__options = options
 
     def __getitem__(self, key):
         """Allows to use a multi-output connector as multiple single-output connectors.
@@ -71,7 +73,7 @@ class MultiOutputProxy(ConnectorProxy):
         """
         return common.MultiOutputItem(connector=self, instance=self._get_instance(), key=key)
 
-    def set_caching(self, caching):
+    def set_caching(self, caching, max_entries=None, max_bytes=None, eviction_policy=common.EvictionPolicy.LRU):
         """Specifies, if the result value of this output connector shall be cached.
         If caching is enabled and the result value is retrieved (e.g. through a
         connection or by calling the connector), the cached value is returned and
@@ -80,10 +82,49 @@ class MultiOutputProxy(ConnectorProxy):
         for the computation. In this case, the getter method is only called once,
         independent of the number of connections through which the result value
         has to be passed.
+        See the :meth:`~connectors.connectors.MultiOutputConnector.set_caching`
+        method of the multi-output connector for details about the limits of the cache.
 
         :param caching: True, if caching shall be enabled, False otherwise
+        :param max_entries: the maximum number of cached results or None for no limit
+        :param max_bytes: the maximum memory consumption of the cached results in
+                          bytes or None for no limit
+        :param eviction_policy: a flag from the :class:`connectors.EvictionPolicy` enum
         """
-        self._get_connector().set_caching(caching)
+        self._get_connector().set_caching(caching, max_entries, max_bytes, eviction_policy)
+
+    def get_cache_statistics(self):
+        """Returns statistics about the usage of the cache for the results of the
+        multi-output connector. See the :meth:`~connectors.connectors.MultiOutputConnector.get_cache_statistics`
+        method of the multi-output connector for details.
+
+        :returns: a :class:`~connectors._common._result_cache.CacheStatistics` tuple
+        """
+        return self._get_connector().get_cache_statistics()
+
+    def set_memoization(self, memoize, hasher=None):
+        """Specifies, if the results shall be remembered for the states of the
+        observed input connectors, in which they have been computed.
+        See the :meth:`~connectors.connectors.MultiOutputConnector.set_memoization` method of the
+        multi-output connector for details.
+
+        :param memoize: the number of states, for which the results shall be remembered,
+                        0 to disable the memoization or None for no limit
+        :param hasher: a function, that takes a value, that has been passed to an
+                       input connector, and returns a hashable fingerprint, or None
+                       for the default function
+        """
+        self._get_connector().set_memoization(memoize, hasher)
+
+    def set_change_detection(self, change_detection):
+        """Specifies, which of the re-computed values are passed to the connected
+        multi-input connectors.
+        See the :meth:`~connectors.connectors.MultiOutputConnector.set_change_detection`
+        method of the multi-output connector for details.
+
+        :param change_detection: a flag from the :class:`connectors.ChangeDetection` enum
+        """
+        self._get_connector().set_change_detection(change_detection)
 
     def _create_connector(self, instance, method, parallelization, executor):
         """Creates and returns the output connector.
@@ -104,7 +145,7 @@ class MultiOutputProxy(ConnectorProxy):
                                                caching=self.__caching,
                                                parallelization=parallelization,
                                                executor=executor,
-                                               keys=self.__keys)
+                                               options=self.__options)
 
     def _connect(self, key, connector):
         """Connects a virtual single output to the given input connector.
@@ -133,12 +174,13 @@ class MultiOutputProxy(ConnectorProxy):
         """
         # nothing to do for a proxy
 
-    def _notify(self, connector):
+    def _notify(self, connector, value=common.NO_VALUE):
         """This method is to notify this multi-output connector, when an observed
         input connector (a setter from the instance to which this connector belongs)
         has retrieved updated data.
 
         :param connector: the input connector, which has changed a value
+        :param value: the new value of the input connector or :data:`~connectors._common._memoization.NO_VALUE`
         :param non_lazy_inputs: a :class:`~connectors._common._non_lazy_inputs.NonLazyInputs`
                                 instance to which input connectors can be appended,
                                 if they request an immediate re-computation (see
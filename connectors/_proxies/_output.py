@@ -17,6 +17,7 @@
 """Contains the OutputProxy class"""
 
 from .. import _connectors as connectors
+from .. import _common as common
 from ._baseclasses import ConnectorProxy
 
 __all__ = ("OutputProxy",)
@@ -35,7 +36,7 @@ class OutputProxy(ConnectorProxy):
     during its call.
     """
 
-    def __init__(self, instance, method, caching, parallelization, executor):
+    def __init__(self, instance, method, caching, parallelization, executor, memoize=0, hasher=None, disk_cache=None):
         """
         :param instance: the instance in which the method is replaced by this connector proxy
         :param method: the unbound method that is replaced by this connector proxy
@@ -48,9 +49,19 @@ class OutputProxy(ConnectorProxy):
                          function. See the :class:`~connectors.connectors.OutputConnector`'s
                          :meth:`~connectors.connectors.OutputConnector.set_executor`
                          method for details
+        :param memoize: the number of states of the observed inputs, for which the
+                        results shall be remembered. See the :meth:`set_memoization`
+                        method for details
+        :param hasher: a function for computing the fingerprints of the input values
+                       or None. See the :meth:`set_memoization` method for details
+        :param disk_cache: a :class:`~connectors.DiskCache` instance or None. See
+                           the :meth:`set_disk_cache` method for details
         """
         ConnectorProxy.__init__(self, instance, method, parallelization, executor)
         self.__caching = caching
+        self.__memoize = memoize
+        self.__hasher = hasher
+        self.__disk_cache = disk_cache
 
     def set_caching(self, caching):
         """Specifies, if the result value of this output connector shall be cached.
@@ -66,6 +77,31 @@ class OutputProxy(ConnectorProxy):
         """
         self._get_connector().set_caching(caching)
 
+    def set_memoization(self, memoize, hasher=None):
+        """Specifies, if the results shall be remembered for the states of the
+        observed input connectors, in which they have been computed.
+        See the :meth:`~connectors.connectors.OutputConnector.set_memoization` method of the
+        output connector for details.
+
+        :param memoize: the number of states, for which the results shall be remembered,
+                        0 to disable the memoization or None for no limit
+        :param hasher: a function, that takes a value, that has been passed to an
+                       input connector, and returns a hashable fingerprint, or None
+                       for the default function
+        """
+        self._get_connector().set_memoization(memoize, hasher)
+
+    def set_disk_cache(self, disk_cache):
+        """Specifies a directory, in which the results shall be stored, so that
+        they survive the end of the process.
+        See the :meth:`~connectors.connectors.OutputConnector.set_disk_cache` method
+        of the output connector for details.
+
+        :param disk_cache: a :class:`~connectors.DiskCache` instance or None to
+                           disable the storing of the results on the disk
+        """
+        self._get_connector().set_disk_cache(disk_cache)
+
     def _create_connector(self, instance, method, parallelization, executor):
         """Creates and returns the output connector.
 
@@ -84,7 +120,10 @@ class OutputProxy(ConnectorProxy):
                                           method=method,
                                           caching=self.__caching,
                                           parallelization=parallelization,
-                                          executor=executor)
+                                          executor=executor,
+                                          memoize=self.__memoize,
+                                          hasher=self.__hasher,
+                                          disk_cache=self.__disk_cache)
 
     def _announce(self, connector, non_lazy_inputs):
         """This method is to notify this output connector, when an observed input
@@ -100,11 +139,12 @@ class OutputProxy(ConnectorProxy):
         """
         # nothing to do for a proxy
 
-    def _notify(self, connector):
+    def _notify(self, connector, value=common.NO_VALUE):
         """This method is to notify this output connector, when an observed input
         connector (a setter from self._instance) has retrieved updated data.
 
         :param connector: the input connector, which has changed a value
+        :param value: the new value of the input connector or :data:`~connectors._common._memoization.NO_VALUE`
         :param non_lazy_inputs: a :class:`~connectors._common._non_lazy_inputs.NonLazyInputs`
                                 instance to which input connectors can be appended,
                                 if they request an immediate re-computation (see
@@ -16,6 +16,8 @@
 
 """Contains processing blocks for common tasks with the *Connectors* package."""
 
+from ._buffer import *
 from ._multiplexer import *
 from ._passthrough import *
+from ._sliding_window import *
 from ._weakrefproxygenerator import *
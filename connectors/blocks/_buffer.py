@@ -0,0 +1,116 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the :class:`Buffer` class."""
+
+import connectors
+
+__all__ = ("Buffer",)
+
+
+class Buffer:
+    """A processing block, that is inserted into the connection between two stages
+    of a streaming processing chain (see :ref:`streaming`), in order to decouple
+    them with a bounded buffer.
+
+    The stage before the buffer produces its chunks in a separate thread, while
+    the stage after it consumes them. The capacity of the buffer limits the number
+    of chunks in between, and the policy specifies, what happens, when the buffer
+    is full (see :class:`~connectors.BufferPolicy`). With the default policy,
+    the producer waits for the consumer, so that the chain runs at the throughput
+    of its slowest stage with a constant memory consumption.
+
+    Usage Example:
+
+    >>> import connectors
+    >>> buffer = connectors.blocks.Buffer(capacity=2)
+    >>> _ = buffer.input(connectors.Stream.chunks([1, 2, 3, 4, 5], 2))
+    >>> list(buffer.output())
+    [[1, 2], [3, 4], [5]]
+    >>> buffer.statistics().consumed
+    3
+    """
+
+    def __init__(self, capacity=1, policy=connectors.BufferPolicy.BLOCK, coalesce=None):
+        """
+        :param capacity: the maximum number of buffered chunks
+        :param policy: a flag of :class:`~connectors.BufferPolicy`, that specifies
+                       the behavior, when the buffer is full
+        :param coalesce: a function, that merges two chunks for the
+                         :attr:`~connectors.BufferPolicy.COALESCE` policy, or
+                         None for concatenating them
+        """
+        self.__stream = ()
+        self.__capacity = capacity
+        self.__policy = policy
+        self.__coalesce = coalesce
+        self.__output = None    # the most recent BufferedStream, which provides the statistics
+
+    @connectors.Output(parallelization=connectors.Parallelization.SEQUENTIAL)
+    def output(self):
+        """Returns a stream, whose chunks are passed through a bounded buffer.
+
+        :returns: a :class:`~connectors.BufferedStream`
+        """
+        self.__output = connectors.BufferedStream(self.__stream,
+                                                  capacity=self.__capacity,
+                                                  policy=self.__policy,
+                                                  coalesce=self.__coalesce)
+        return self.__output
+
+    @connectors.Input("output")
+    def input(self, stream):
+        """Specifies the input stream.
+
+        :param stream: a :class:`~connectors.Stream` or another iterable of chunks
+        :returns: the :class:`~connectors.blocks.Buffer` instance
+        """
+        self.__stream = stream
+        return self
+
+    @connectors.Input("output")
+    def set_capacity(self, capacity):
+        """Specifies the maximum number of buffered chunks.
+
+        :param capacity: the capacity of the buffer
+        :returns: the :class:`~connectors.blocks.Buffer` instance
+        """
+        self.__capacity = capacity
+        return self
+
+    @connectors.Input("output")
+    def set_policy(self, policy, coalesce=None):
+        """Specifies the behavior, when the buffer is full.
+
+        :param policy: a flag of :class:`~connectors.BufferPolicy`
+        :param coalesce: a function, that merges two chunks for the
+                         :attr:`~connectors.BufferPolicy.COALESCE` policy, or
+                         None for concatenating them
+        :returns: the :class:`~connectors.blocks.Buffer` instance
+        """
+        self.__policy = policy
+        self.__coalesce = coalesce
+        return self
+
+    def statistics(self):
+        """Returns the statistics about the depth of the buffer and the passed
+        chunks for the stream, that has most recently been returned by the output.
+
+        :returns: a :class:`~connectors._common._stream.BufferStatistics` tuple
+        """
+        if self.__output is None:
+            return connectors.BufferedStream(()).statistics()    # the statistics of a stream, that has not been iterated over
+        return self.__output.statistics()
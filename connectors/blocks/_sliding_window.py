@@ -0,0 +1,143 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the :class:`SlidingWindow` class."""
+
+import connectors
+
+__all__ = ("SlidingWindow",)
+
+
+class SlidingWindow:
+    """A processing block, that collects incoming chunks of samples in a ring
+    buffer and provides fixed-size windows, whose start positions are a hop size
+    apart, e.g. for overlap-save convolutions or short-time spectral analysis.
+
+    The ring buffer is a NumPy array, that is allocated once. It has twice the
+    capacity, and every sample is written to both halves, so that every window
+    is a contiguous slice of the buffer. This way, neither adding a chunk nor
+    retrieving a window requires the concatenation of arrays.
+
+    The windows are retrieved through the multi-output connector :meth:`window`,
+    whose keys are the indices of the windows, that are completely available in
+    the buffer. Window ``k`` contains the samples ``k * hop`` to ``k * hop + size - 1``
+    of the concatenation of all chunks, that have been added so far. The chunks
+    can also be passed as a :class:`~connectors.Stream`, whose chunks are then
+    added one after another.
+
+    Usage Example:
+
+    >>> import connectors
+    >>> sliding_window = connectors.blocks.SlidingWindow(size=4, hop=2, dtype=int)
+    >>> _ = sliding_window.input([0, 1, 2])
+    >>> tuple(sliding_window.keys())
+    ()
+    >>> _ = sliding_window.input([3, 4, 5, 6])
+    >>> tuple(sliding_window.keys())
+    (0, 1)
+    >>> sliding_window.window[1]()
+    array([2, 3, 4, 5])
+    """
+
+    def __init__(self, size, hop=None, capacity=None, dtype=float, copy=True):
+        """
+        :param size: the number of samples per window
+        :param hop: the distance between the start positions of two consecutive
+                    windows or None to make the windows adjacent
+        :param capacity: the number of most recent samples, that are kept in the
+                         buffer, or None for twice the window size. It must not
+                         be smaller than the window size
+        :param dtype: the NumPy data type of the samples
+        :param copy: True, if the windows shall be returned as copies, False, if
+                     they shall be returned as read-only views of the buffer, which
+                     avoids copying the samples, but whose content changes, when
+                     the samples are overwritten by newer chunks
+        """
+        import numpy    # pylint: disable=import-outside-toplevel # NumPy is an optional dependency, which is only required for this block
+        hop = size if hop is None else hop
+        capacity = max(2 * size, size + hop) if capacity is None else capacity
+        if not 0 < size <= capacity or hop < 1:
+            raise ValueError("The window size and the hop size must be positive "
+                             "and the capacity must not be smaller than the window size.")
+        self.__size = size
+        self.__hop = hop
+        self.__capacity = capacity
+        self.__copy = copy
+        self.__buffer = numpy.zeros(2 * capacity, dtype=dtype)
+        self.__written = 0      # the total number of samples, that have been added
+
+    @connectors.Input("window")
+    def input(self, chunk):
+        """Adds a chunk of samples to the buffer.
+        If a :class:`~connectors.Stream` is passed, all of its chunks are added
+        in the order of its iteration.
+
+        :param chunk: a one-dimensional NumPy array or another sequence of samples,
+                      or a :class:`~connectors.Stream` of such chunks
+        :returns: the :class:`~connectors.blocks.SlidingWindow` instance
+        """
+        if isinstance(chunk, connectors.Stream):
+            for c in chunk:
+                self.__add(c)
+        else:
+            self.__add(chunk)
+        return self
+
+    @connectors.MultiOutput(parallelization=connectors.Parallelization.SEQUENTIAL)
+    def window(self, index):
+        """Returns the window with the given index.
+
+        :param index: the index of the window
+        :returns: a NumPy array with the samples of the window
+        """
+        if index not in self.keys():
+            raise KeyError(f"The window {index} is not available in the buffer.")
+        offset = (index * self.__hop) % self.__capacity
+        window = self.__buffer[offset:offset + self.__size]
+        if self.__copy:
+            return window.copy()
+        window = window.view()
+        window.flags.writeable = False
+        return window
+
+    @window.keys
+    def keys(self):
+        """Returns the indices of the windows, that are completely available in the buffer.
+
+        :returns: a :class:`range` of window indices
+        """
+        first = -(-max(self.__written - self.__capacity, 0) // self.__hop)     # the first window, whose samples have not been overwritten
+        last = (self.__written - self.__size) // self.__hop                    # the last window, whose samples have all been added
+        return range(first, max(first, last + 1))
+
+    def __add(self, chunk):
+        """Writes a chunk of samples to both halves of the ring buffer.
+
+        :param chunk: a one-dimensional NumPy array or another sequence of samples
+        """
+        length = len(chunk)
+        if length > self.__capacity:     # only the most recent samples are kept
+            chunk = chunk[length - self.__capacity:]
+        position = (self.__written + length - len(chunk)) % self.__capacity
+        start = 0
+        while start < len(chunk):
+            stop = min(len(chunk), start + self.__capacity - position)
+            part = chunk[start:stop]
+            self.__buffer[position:position + stop - start] = part
+            self.__buffer[position + self.__capacity:position + self.__capacity + stop - start] = part
+            position = 0
+            start = stop
+        self.__written += length
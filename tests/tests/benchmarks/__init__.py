@@ -0,0 +1,23 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains benchmarks for measuring the overhead of the *Connectors* package.
+
+The benchmarks are not executed by the test suite. They can be run from the
+repository's root directory with ``make benchmark`` or ``python3 -m tests.tests.benchmarks``.
+The names of individual benchmark modules can be passed as arguments to run only
+these benchmarks.
+"""
@@ -0,0 +1,85 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains helper functions for timing and reporting the benchmarks"""
+
+import time
+
+__all__ = ("measure", "measure_phases", "print_table")
+
+
+def measure(function, repetitions, rounds=3):
+    """Measures the average duration of a function call.
+    The function is called ``repetitions`` times in a row for a couple of rounds
+    and the average duration of the fastest round is returned, so that occasional
+    disturbances by other processes do not distort the result.
+
+    :param function: a function, that does not take any parameters
+    :param repetitions: the number of calls per round
+    :param rounds: the number of rounds
+    :returns: the duration of one call in seconds
+    """
+    durations = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(repetitions):
+            function()
+        durations.append((time.perf_counter() - start) / repetitions)
+    return min(durations)
+
+
+def measure_phases(phases, repetitions, rounds=3):
+    """Measures the average durations of a sequence of function calls, that depend
+    on each other, such as changing a parameter and retrieving the updated result.
+    The functions are called in the given order ``repetitions`` times in a row
+    for a couple of rounds and the average durations of the fastest round are
+    returned.
+
+    :param phases: a sequence of functions, that do not take any parameters
+    :param repetitions: the number of calls of each function per round
+    :param rounds: the number of rounds
+    :returns: a list with the duration of one call of each function in seconds
+    """
+    best = None
+    for _ in range(rounds):
+        durations = [0.0] * len(phases)
+        for _ in range(repetitions):
+            for i, function in enumerate(phases):
+                start = time.perf_counter()
+                function()
+                durations[i] += time.perf_counter() - start
+        if best is None or sum(durations) < sum(best):
+            best = durations
+    return [d / repetitions for d in best]
+
+
+def print_table(title, header, rows):
+    """Prints the results of a benchmark as a table.
+
+    :param title: the title of the table
+    :param header: a sequence of column titles
+    :param rows: a sequence of rows, each of which is a sequence of values, that
+                 are converted to strings for the table
+    """
+    rows = [[str(c) for c in r] for r in rows]
+    widths = [max(len(c) for c in column) for column in zip(header, *rows)]
+    print(title)
+    print("=" * len(title))
+    print("  ".join(h.ljust(w) for h, w in zip(header, widths)))
+    print("  ".join("-" * w for w in widths))
+    for r in rows:
+        print("  ".join(c.ljust(w) for c, w in zip(r, widths)))
+    print()
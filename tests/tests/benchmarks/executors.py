@@ -0,0 +1,81 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks for the overhead of the executors, when retrieving results with
+and without a persistent session.
+"""
+
+import connectors
+from .. import testclasses
+from ._timing import measure, print_table
+
+
+def run():
+    """Runs all benchmarks of this module."""
+    benchmark_persistent_sessions()
+    benchmark_actors()
+
+
+def benchmark_persistent_sessions():
+    """Measures the per-call overhead of retrieving a result through an output
+    connector, that has to be re-computed for every call.
+    """
+    rows = []
+    for threads, processes, parallelization in ((0, 0, connectors.Parallelization.SEQUENTIAL),
+                                                (2, 0, connectors.Parallelization.THREAD),
+                                                (0, 2, connectors.Parallelization.PROCESS),
+                                                (2, 2, connectors.Parallelization.PROCESS)):
+        executor = connectors.executor(threads=threads, processes=processes)
+        t = testclasses.Simple()
+        t.set_value(1.0)
+        t.get_value.set_caching(False)
+        t.get_value.set_parallelization(parallelization)
+        t.get_value.set_executor(executor)
+        repetitions = 20 if processes else 500
+        temporary = measure(t.get_value, repetitions)
+        with executor:
+            persistent = measure(t.get_value, repetitions)
+        rows.append((type(executor).__name__,
+                     parallelization.name,
+                     f"{temporary * 1e6:.1f}",
+                     f"{persistent * 1e6:.1f}",
+                     f"{temporary / persistent:.1f}"))
+    print_table(title="Per-call overhead of the executors",
+                header=("executor", "parallelization", "temporary [µs]", "persistent [µs]", "speedup"),
+                rows=rows)
+
+
+def benchmark_actors():
+    """Measures the per-call overhead of executing a getter in a separate process,
+    when the instance has a large state, with and without the actor mode.
+    """
+    rows = []
+    for size in (2 ** 10, 2 ** 20, 2 ** 26):
+        t = testclasses.Simple()
+        t.payload = bytes(size)     # an attribute, that is not changed between the calls
+        t.set_value(1.0)
+        t.get_value.set_caching(False)
+        t.get_value.set_parallelization(connectors.Parallelization.PROCESS)
+        durations = []
+        for actors in (False, True):
+            executor = connectors.executor(threads=0, processes=1, actors=actors)
+            t.get_value.set_executor(executor)
+            with executor:
+                durations.append(measure(t.get_value, repetitions=10))
+        rows.append((size, f"{durations[0] * 1e6:.1f}", f"{durations[1] * 1e6:.1f}", f"{durations[0] / durations[1]:.1f}"))
+    print_table(title="Per-call overhead of the process based parallelization with a large state",
+                header=("state size [bytes]", "redeployed [µs]", "actor [µs]", "speedup"),
+                rows=rows)
@@ -0,0 +1,181 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks for the overhead of propagating value changes through processing
+networks of different shapes, which is dominated by the announcements, the
+notifications and the requests between the connectors.
+"""
+
+import collections
+import itertools
+import connectors
+from .. import testclasses
+from ._timing import measure_phases, print_table
+
+EXECUTORS = (("sequential", {"threads": 0}),
+             ("threads", {"threads": 2}),
+             ("processes", {"threads": 0, "processes": 2}),
+             ("threads+processes", {"threads": 2, "processes": 2}))
+
+Graph = collections.namedtuple("Graph", ("update", "requests", "connections", "nodes"))
+
+
+def run():
+    """Runs all benchmarks of this module."""
+    benchmark_propagation()
+    benchmark_stacked_diamonds()
+
+
+def benchmark_propagation():
+    """Measures the time for changing a parameter at the top of a processing network
+    (announcements and notifications) and for retrieving the updated results at
+    the bottom (requests and the execution of the methods).
+    """
+    rows = []
+    for name, build, repetitions in (("chain (200)", chain, 20),
+                                     ("fan-out (200)", fan_out, 20),
+                                     ("stacked diamonds (6)", diamonds, 50),
+                                     ("nested macros (20x10)", nested_macros, 50),
+                                     ("multi-input fan-in (1000)", fan_in, 20)):
+        for executor_name, parameters in EXECUTORS:
+            graph = build()
+            executor = connectors.executor(**parameters)
+            for request in graph.requests:
+                request.set_executor(executor)
+            with executor:
+                announce, request = measure_phases((graph.update, lambda g=graph: [r() for r in g.requests]), repetitions)
+            total = announce + request
+            rows.append((name, executor_name, graph.connections,
+                         f"{announce * 1e6:.0f}", f"{request * 1e6:.0f}",
+                         f"{1.0 / total:.0f}", f"{total / graph.connections * 1e6:.2f}"))
+    print_table(title="Propagation of a value change through processing networks",
+                header=("network", "executor", "connections", "announce [µs]", "request [µs]", "updates/s", "per connection [µs]"),
+                rows=rows)
+
+
+def benchmark_stacked_diamonds():
+    """Measures, how the cost of announcing a value change grows with the number
+    of stacked diamonds, in which the announcement reaches every join through two
+    paths.
+    """
+    rows = []
+    for depth in (2, 4, 8, 12, 16):
+        graph = diamonds(depth)
+        graph.requests[0]()
+        announce, request = measure_phases((graph.update, graph.requests[0]), repetitions=5)
+        rows.append((depth, graph.connections, f"{announce * 1e6:.0f}", f"{request * 1e6:.0f}",
+                     f"{announce / graph.connections * 1e6:.2f}"))
+    print_table(title="Announcements in stacked diamonds",
+                header=("diamonds", "connections", "announce [µs]", "request [µs]", "announce per connection [µs]"),
+                rows=rows)
+
+
+def _updater(setter):
+    """Returns a function, that calls the given setter with a new value on every call."""
+    counter = itertools.count()
+    return lambda: setter(next(counter))
+
+
+def chain(length=200):
+    """Creates a chain of :class:`~tests.testclasses.Simple` instances.
+
+    :param length: the number of instances
+    :returns: a :class:`Graph`
+    """
+    nodes = [testclasses.Simple()]
+    for _ in range(length - 1):
+        nodes.append(testclasses.Simple().set_value.connect(nodes[-1].get_value))
+    return Graph(update=_updater(nodes[0].set_value), requests=[nodes[-1].get_value], connections=length - 1, nodes=nodes)
+
+
+def fan_out(width=200):
+    """Creates a source, whose output is connected to many sinks, which are all
+    requested after a value change.
+
+    :param width: the number of sinks
+    :returns: a :class:`Graph`
+    """
+    source = testclasses.Simple()
+    sinks = [testclasses.Simple().set_value.connect(source.get_value) for _ in range(width)]
+    return Graph(update=_updater(source.set_value), requests=[s.get_value for s in sinks], connections=width, nodes=[source] + sinks)
+
+
+def diamonds(depth=6):
+    """Creates a stack of diamond shaped networks, in which a value is split up
+    into two branches, which are joined again in the next node.
+
+    :param depth: the number of stacked diamonds
+    :returns: a :class:`Graph`
+    """
+    source = testclasses.Simple()
+    nodes = [source]
+    output = source.get_value
+    for _ in range(depth):
+        left = testclasses.Simple().set_value.connect(output)
+        right = testclasses.Simple().set_value.connect(output)
+        join = testclasses.MultipleInputs().set_value1.connect(left.get_value).set_value2.connect(right.get_value)
+        nodes.extend((left, right, join))
+        output = join.get_values
+    return Graph(update=_updater(source.set_value), requests=[output], connections=4 * depth, nodes=nodes)
+
+
+class NestedMacro:
+    """A class, that exports the connectors of a :class:`~tests.testclasses.Simple`
+    instance through several levels of nested macro connectors.
+    """
+
+    def __init__(self, depth):
+        """
+        :param depth: the number of nested levels below this one
+        """
+        self.__internal = NestedMacro(depth - 1) if depth > 1 else testclasses.Simple()
+
+    @connectors.MacroInput()
+    def set_value(self, *_):    # pylint: disable=missing-docstring
+        yield self.__internal.set_value
+
+    @connectors.MacroOutput()
+    def get_value(self):        # pylint: disable=missing-docstring
+        return self.__internal.get_value
+
+
+def nested_macros(length=20, depth=10):
+    """Creates a chain of deeply nested macros.
+
+    :param length: the number of macros in the chain
+    :param depth: the nesting depth of each macro
+    :returns: a :class:`Graph`
+    """
+    nodes = [NestedMacro(depth)]
+    for _ in range(length - 1):
+        nodes.append(NestedMacro(depth).set_value.connect(nodes[-1].get_value))
+    return Graph(update=_updater(nodes[0].set_value), requests=[nodes[-1].get_value], connections=length - 1, nodes=nodes)
+
+
+def fan_in(width=1000):
+    """Creates many sources, that are connected to the same multi-input connector.
+    On every update, the value of one of the sources is changed.
+
+    :param width: the number of sources
+    :returns: a :class:`Graph`
+    """
+    sources = [testclasses.Simple() for _ in range(width)]
+    sink = testclasses.ReplacingMultiInput()
+    for s in sources:
+        sink.add_value.connect(s.get_value)
+    setters = itertools.cycle([s.set_value for s in sources])
+    counter = itertools.count()
+    return Graph(update=lambda: next(setters)(next(counter)), requests=[sink.get_values], connections=width, nodes=sources + [sink])
@@ -0,0 +1,73 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks for the scaling of the announcements and the scheduling to large,
+randomly generated processing networks.
+"""
+
+import functools
+import time
+import connectors
+from .. import helper
+from ._timing import measure_phases, print_table
+
+SIZES = ((10, 100), (100, 100))     # tuples (layers, width), larger networks with 10^5 connectors can be benchmarked by adding (100, 1000)
+
+
+def run():
+    """Runs all benchmarks of this module."""
+    benchmark_scaling()
+    benchmark_workloads()
+
+
+def benchmark_scaling():
+    """Measures the time for building random networks of different sizes and
+    for propagating a change of one of their sources.
+    """
+    rows = []
+    for layers, width in SIZES:
+        start = time.perf_counter()
+        network = helper.generate_network(layers=layers, width=width)
+        build = time.perf_counter() - start
+        network.request()
+        announce, request = measure_phases((network.update, network.request), repetitions=3, rounds=1)
+        rows.append((len(network), network.connections, f"{build:.2f}", f"{announce * 1e3:.2f}", f"{request * 1e3:.1f}",
+                     f"{(announce + request) / network.connections * 1e6:.2f}"))
+    print_table(title="Scaling to large random networks",
+                header=("instances", "connections", "build [s]", "announce [ms]", "request [ms]", "per connection [µs]"),
+                rows=rows)
+
+
+def benchmark_workloads():
+    """Measures the time for recomputing a random network, whose nodes execute
+    different workloads, with different executors.
+    """
+    rows = []
+    for name, work in (("busy loop", functools.partial(helper.busy_loop, 20000)),
+                       ("NumPy", functools.partial(helper.numpy_kernel, 20000)),
+                       ("sleep", functools.partial(helper.sleep, 0.001))):
+        durations = []
+        for threads in (0, 4):
+            network = helper.generate_network(layers=10, width=10, work=work, join=True)
+            executor = connectors.executor(threads=threads)
+            network.set_executor(executor)
+            with executor:
+                _, request = measure_phases((lambda n=network: n.update(10), network.request), repetitions=3)
+            durations.append(request)
+        rows.append((name, f"{durations[0] * 1e3:.1f}", f"{durations[1] * 1e3:.1f}", f"{durations[0] / durations[1]:.2f}"))
+    print_table(title="Recomputation of a random network with 100 instances",
+                header=("workload", "sequential [ms]", "4 threads [ms]", "speedup"),
+                rows=rows)
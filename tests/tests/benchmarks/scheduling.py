@@ -0,0 +1,76 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks for the critical path aware scheduling of the executors on an
+unbalanced processing network.
+"""
+
+import functools
+import connectors
+from .. import helper
+from .. import testclasses
+from ._timing import measure_phases, print_table
+
+DURATION = 0.01     # the execution time of each getter in seconds
+THREADS = 2
+SHAPES = ((8, 4), (16, 8), (32, 8))     # tuples (number of short branches, length of the long branch)
+
+
+def run():
+    """Runs all benchmarks of this module."""
+    benchmark_unbalanced_network()
+
+
+def _update(sources):
+    """Changes the values of the sources of the network.
+
+    :param sources: a sequence of :class:`~tests.testclasses.Worker` instances
+    """
+    for t in sources:
+        t.set_value(1)
+
+
+def benchmark_unbalanced_network():
+    """Measures the time for recomputing a network, in which many short branches
+    and one long chain are joined by a multi-input connector, with the FIFO and
+    the critical path aware scheduling.
+    The short branches are connected first, so that the FIFO scheduling passes
+    them to the thread pool before the long chain.
+    """
+    rows = []
+    work = functools.partial(helper.sleep, DURATION)
+    for shorts, length in SHAPES:
+        durations = []
+        for scheduling in (connectors.Scheduling.FIFO, connectors.Scheduling.CRITICAL_PATH):
+            sources = [testclasses.Worker(work) for _ in range(shorts)]
+            chain = [testclasses.Worker(work)]
+            for _ in range(length - 1):
+                chain.append(testclasses.Worker(work).set_value.connect(chain[-1].get_value))
+            sources.append(chain[0])
+            join = testclasses.MultiInputWorker()
+            for t in sources[:-1] + chain[-1:]:
+                join.add_value.connect(t.get_value)
+            executor = connectors.executor(threads=THREADS, scheduling=scheduling)
+            join.get_value.set_executor(executor)
+            with executor:
+                join.get_value()    # the first computation measures the execution times for the critical path aware scheduling
+                durations.append(measure_phases((functools.partial(_update, sources), join.get_value), repetitions=3)[1])
+        lower_bound = max(length, (shorts + length) / THREADS) * DURATION
+        rows.append((shorts, length, f"{lower_bound * 1e3:.0f}",
+                     f"{durations[0] * 1e3:.0f}", f"{durations[1] * 1e3:.0f}", f"{durations[0] / durations[1]:.2f}"))
+    print_table(title=f"Recomputation of an unbalanced network with {THREADS} threads and {DURATION * 1e3:.0f} ms per getter",
+                header=("short branches", "long branch", "lower bound [ms]", "FIFO [ms]", "critical path [ms]", "speedup"),
+                rows=rows)
@@ -0,0 +1,159 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""A benchmark for the shared memory transport of the process based parallelization
+on the processing chain of the ``transfer_function.py`` tutorial.
+
+The classes of the tutorial are replicated here without the plotting, so that
+the benchmark does not depend on *matplotlib*. Their getters are executed in
+separate processes and the impulse response of the linear system is shortened
+to its non-zero samples, so that the duration of the computations is dominated
+by passing the signals between the processes.
+"""
+
+import functools
+import math
+import numpy
+import connectors
+from ._timing import measure, print_table
+
+sampling_rate = 48000.0
+
+
+def run():
+    """Runs all benchmarks of this module."""
+    benchmark_transfer_function()
+
+
+class LinearSystem:
+    """Filters a signal with an impulse response"""
+
+    def __init__(self, impulse_response):
+        self.__impulse_response = impulse_response
+        self.__input = None
+
+    @connectors.Input("get_output")
+    def set_input(self, signal):
+        """sets the signal, that shall be filtered"""
+        self.__input = signal
+
+    @connectors.Output(parallelization=connectors.Parallelization.PROCESS)
+    def get_output(self):
+        """returns the filtered signal"""
+        return numpy.convolve(self.__input, self.__impulse_response, mode="full")[0:len(self.__input)]
+
+
+class SweepGenerator:
+    """Generates an exponential sweep"""
+
+    def __init__(self, length, start_frequency=20.0, stop_frequency=20000.0):
+        self.__start_frequency = start_frequency
+        self.__stop_frequency = stop_frequency
+        self.__length = length
+
+    @connectors.Input("get_sweep")
+    def set_start_frequency(self, frequency):
+        """sets the frequency, at which the sweep starts"""
+        self.__start_frequency = frequency
+
+    @connectors.Output(parallelization=connectors.Parallelization.PROCESS)
+    def get_sweep(self):
+        """returns the sweep"""
+        f0 = self.__start_frequency
+        fT = self.__stop_frequency
+        T = self.__length / sampling_rate
+        t = numpy.arange(0.0, T, 1.0 / sampling_rate)
+        k = (fT - f0) / T
+        return numpy.sin(2.0 * math.pi * f0 * t + math.pi * k * (t ** 2))
+
+
+class FourierTransform:
+    """Computes the spectrum of a signal"""
+
+    def __init__(self):
+        self.__signal = None
+
+    @connectors.Input("get_spectrum")
+    def set_signal(self, signal):
+        """sets the signal, whose spectrum shall be computed"""
+        self.__signal = signal
+
+    @connectors.Output(parallelization=connectors.Parallelization.PROCESS)
+    def get_spectrum(self):
+        """returns the spectrum of the signal"""
+        return numpy.fft.rfft(self.__signal)
+
+
+class TransferFunction:
+    """Divides the spectrum of the response by that of the excitation"""
+
+    def __init__(self):
+        self.__excitation = None
+        self.__response = None
+
+    @connectors.Input("get_transfer_function")
+    def set_excitation(self, signal):
+        """sets the spectrum of the excitation signal"""
+        self.__excitation = signal
+
+    @connectors.Input("get_transfer_function")
+    def set_response(self, signal):
+        """sets the spectrum of the system's response"""
+        self.__response = signal
+
+    @connectors.Output(parallelization=connectors.Parallelization.PROCESS)
+    def get_transfer_function(self):
+        """returns the transfer function"""
+        return numpy.divide(self.__response, self.__excitation)
+
+
+def _compute(sweep, frequencies, transfer_function):
+    """Changes the start frequency of the sweep and re-computes the transfer function.
+
+    :param sweep: the :class:`SweepGenerator` instance
+    :param frequencies: an iterator, that yields a new start frequency for every call
+    :param transfer_function: the :class:`TransferFunction` instance
+    :returns: the transfer function
+    """
+    sweep.set_start_frequency(next(frequencies))
+    return transfer_function.get_transfer_function()
+
+
+def benchmark_transfer_function():
+    """Measures the duration of re-computing the transfer function after changing
+    the sweep, with and without passing the signals through shared memory.
+    """
+    rows = []
+    for length in (2 ** 16, 2 ** 20, 2 ** 23):
+        sweep = SweepGenerator(length)
+        system = LinearSystem(numpy.array((-1.0, 0.0, 1.0))).set_input.connect(sweep.get_sweep)
+        excitation_fft = FourierTransform().set_signal.connect(sweep.get_sweep)
+        response_fft = FourierTransform().set_signal.connect(system.get_output)
+        transfer_function = TransferFunction()
+        transfer_function.set_excitation.connect(excitation_fft.get_spectrum)
+        transfer_function.set_response.connect(response_fft.get_spectrum)
+        compute = functools.partial(_compute, sweep, iter(range(20, 2 ** 31)), transfer_function)
+        durations = []
+        for shared_memory in (False, True):
+            executor = connectors.executor(threads=2, processes=2, shared_memory=shared_memory)
+            transfer_function.get_transfer_function.set_executor(executor)
+            with executor:
+                durations.append(measure(compute, repetitions=3))
+        rows.append((length, f"{durations[0] * 1e3:.1f}", f"{durations[1] * 1e3:.1f}",
+                     f"{durations[0] / durations[1]:.1f}"))
+    print_table(title="Re-computing the transfer function with the getters in separate processes",
+                header=("signal length", "pickled [ms]", "shared memory [ms]", "speedup"),
+                rows=rows)
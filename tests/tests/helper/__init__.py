@@ -17,3 +17,4 @@
 """Contains helper objects for the unit tests"""
 
 from ._call_logger import *
+from ._network_generator import *
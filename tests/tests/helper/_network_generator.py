@@ -0,0 +1,227 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains a generator for random processing networks, with which the scaling
+of the connectors can be benchmarked and stress tested
+"""
+
+import collections
+import functools
+import itertools
+import random
+import time
+import numpy
+from .. import testclasses     # the module is imported instead of its classes, because the test classes import this package, too
+
+__all__ = ("Network", "NodeShares", "generate_network", "busy_loop", "numpy_kernel", "sleep")
+
+NodeShares = collections.namedtuple("NodeShares", ("multi_input", "multi_output", "conditional", "macro"),
+                                    defaults=(0.1, 0.1, 0.1, 0.1))
+NodeShares.__doc__ = """The probabilities, with which :func:`generate_network` creates the different
+kinds of nodes. The remaining nodes have a single input and a single output.
+
+* ``multi_input``: the probability, that a node has a multi-input connector
+* ``multi_output``: the probability, that a node has a multi-output connector
+* ``conditional``: the probability, that a node has an input connector with conditions
+* ``macro``: the probability, that a node is a chain, that is wrapped in macro connectors
+"""
+
+
+def busy_loop(iterations):
+    """A workload, that keeps the CPU busy, while holding the global interpreter lock.
+
+    :param iterations: the number of loop iterations
+    """
+    x = 0
+    for i in range(iterations):
+        x += i
+
+
+def numpy_kernel(size):
+    """A workload, that keeps the CPU busy in a NumPy function, which releases
+    the global interpreter lock.
+
+    :param size: the length of the array, that is sorted
+    """
+    numpy.sort(numpy.sin(numpy.arange(size, dtype=numpy.float64)))
+
+
+def sleep(duration):
+    """A workload, that waits without keeping the CPU busy.
+
+    :param duration: the time to wait in seconds
+    """
+    time.sleep(duration)
+
+
+class Network:
+    """A processing network, that has been created by :func:`generate_network`.
+    Besides the methods for changing the parameters of the network and retrieving
+    its results, it has a model of the computations, with which the results can
+    be verified.
+    """
+
+    def __init__(self, nodes, model, sources, sinks, connections):
+        """
+        :param nodes: a list of all instances in the network
+        :param model: a list with a tuple (kind, parents) for each node, where
+                      the parents are tuples (node index, key) of the outputs,
+                      from which the node receives its values
+        :param sources: the indices of the nodes, whose parameters are changed by :meth:`update`
+        :param sinks: a list of tuples (node index, key) of the outputs, that are retrieved by :meth:`request`
+        :param connections: the number of connections in the network
+        """
+        self.nodes = nodes
+        self.connections = connections
+        self.__model = model
+        self.__sinks = sinks
+        self.__values = {s: 0 for s in sources}
+        self.__next_source = itertools.cycle(sources)
+        self.__counter = itertools.count(1)
+
+    def __len__(self):
+        """Returns the number of instances in the network."""
+        return len(self.nodes)
+
+    def update(self, count=1):
+        """Changes the value of the next sources in the network.
+
+        :param count: the number of sources, whose value is changed
+        """
+        for _ in range(count):
+            source = next(self.__next_source)
+            value = next(self.__counter)
+            self.__values[source] = value
+            self.nodes[source].set_value(value)
+
+    def request(self):
+        """Retrieves the results of the network.
+
+        :returns: a list with the values of the outputs, that are not connected to other nodes
+        """
+        return [self.__output(i, key)() for i, key in self.__sinks]
+
+    def expected(self):
+        """Computes the results, that :meth:`request` shall return, from the model of the network.
+
+        :returns: a list of values
+        """
+        values = dict(self.__values)
+        for i, (kind, parents) in enumerate(self.__model):
+            if parents:
+                inputs = [values[p] + (0 if k is None else k) for p, k in parents]
+                values[i] = sum(inputs) if kind is testclasses.MultiInputWorker else inputs[0]
+        return [values[i] + (0 if key is None else key) for i, key in self.__sinks]
+
+    def set_executor(self, executor):
+        """Sets the executor for the outputs, that are retrieved by :meth:`request`.
+
+        :param executor: an executor, that has been created with :func:`connectors.executor`
+        """
+        for i, _ in self.__sinks:
+            self.nodes[i].get_value.set_executor(executor)
+
+    def __output(self, index, key):
+        """Returns a callable, that retrieves the value of an output.
+
+        :param index: the index of the node
+        :param key: the key of a multi-output connector or None
+        """
+        if key is None:
+            return self.nodes[index].get_value
+        return functools.partial(self.nodes[index].get_value, key)
+
+
+def generate_network(layers=10, width=10, fan_in=2, shares=NodeShares(), keys=2, work=None, join=False, seed=0):
+    """Creates a random processing network from the test classes in
+    :mod:`tests.testclasses._workload`. The nodes are arranged in layers, and
+    every node receives its values from the outputs of the previous layer.
+
+    :param layers: the number of layers including the layer of the sources
+    :param width: the number of nodes per layer
+    :param fan_in: the number of outputs, that are connected to a multi-input connector
+    :param shares: a :class:`NodeShares` tuple with the probabilities of the different kinds of nodes
+    :param keys: the number of keys of the multi-output connectors
+    :param work: a picklable function without parameters, that is executed by every
+                 getter, such as ``functools.partial(busy_loop, 1000)``, or None
+    :param join: True, if all outputs, that are not connected to other nodes, shall
+                 be joined in one final multi-input connector, so that all results
+                 are retrieved with one request
+    :param seed: the seed for the random number generator
+    :returns: a :class:`Network` instance
+    """
+    if sum(shares) > 1.0:
+        raise ValueError("The sum of the shares of the different node types must not exceed 1")
+    kinds = (testclasses.MultiInputWorker, testclasses.MultiOutputWorker,
+             testclasses.ConditionalWorker, testclasses.MacroWorker)     # in the order of the fields of NodeShares
+    thresholds = tuple(itertools.accumulate(shares))
+    arguments = {} if work is None else {"work": work}
+    rng = random.Random(seed)
+    nodes = [testclasses.Worker(**arguments) for _ in range(width)]
+    model = [(testclasses.Worker, ()) for _ in range(width)]
+    previous = [(i, None) for i in range(width)]
+    connected = set()
+    connections = 0
+    for _ in range(layers - 1):
+        outputs = []
+        for _ in range(width):
+            r = rng.random()
+            kind = next((k for k, t in zip(kinds, thresholds) if r < t), testclasses.Worker)
+            if kind is testclasses.MultiOutputWorker:
+                node = kind(keys=keys, **arguments)
+            else:
+                node = kind(**arguments)
+            if kind is testclasses.MultiInputWorker:
+                parents = tuple(rng.sample(previous, min(fan_in, len(previous))))
+                for p in parents:
+                    node.add_value.connect(_connector(nodes, *p))
+            else:
+                parents = (rng.choice(previous),)
+                node.set_value.connect(_connector(nodes, *parents[0]))
+            connections += len(parents)
+            connected.update(parents)
+            index = len(nodes)
+            nodes.append(node)
+            model.append((kind, parents))
+            if kind is testclasses.MultiOutputWorker:
+                outputs.extend((index, k) for k in range(keys))
+            else:
+                outputs.append((index, None))
+        previous = outputs
+    sinks = [o for i, (kind, _) in enumerate(model)
+             for o in ([(i, k) for k in range(keys)] if kind is testclasses.MultiOutputWorker else [(i, None)])
+             if o not in connected]
+    if join:
+        node = testclasses.MultiInputWorker(**arguments)
+        for s in sinks:
+            node.add_value.connect(_connector(nodes, *s))
+        connections += len(sinks)
+        model.append((testclasses.MultiInputWorker, tuple(sinks)))
+        nodes.append(node)
+        sinks = [(len(nodes) - 1, None)]
+    return Network(nodes=nodes, model=model, sources=list(range(width)), sinks=sinks, connections=connections)
+
+
+def _connector(nodes, index, key):
+    """Returns the output connector of a node.
+
+    :param nodes: the list of nodes
+    :param index: the index of the node
+    :param key: the key of a multi-output connector or None
+    """
+    if key is None:
+        return nodes[index].get_value
+    return nodes[index].get_value[key]
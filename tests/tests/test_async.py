@@ -0,0 +1,163 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the awaitable connectors, that run in the event loop of an asyncio application"""
+
+import asyncio
+import functools
+import time
+import connectors
+from . import helper
+from . import testclasses
+
+
+def test_async_chain():
+    """Tests the async_call methods of the input and output connectors in a processing chain"""
+    async def run():
+        t1 = testclasses.Simple()
+        t2 = testclasses.Simple().set_value.connect(t1.get_value)
+        assert await t2.get_value.async_call() is None
+        assert await t1.set_value.async_call(2) is t1
+        assert await t2.get_value.async_call() == 2
+        assert t2.get_value() == 2
+        p = testclasses.NonReplacingMultiInput()
+        p.add_value.connect(t2.get_value)
+        await p.add_value.async_call(3)
+        assert await p.get_values.async_call() == (2, 3)
+        plan = connectors.compile_plan(p.get_values)
+        await t1.set_value.async_call(4)
+        assert await plan.async_call() == (3, 4)     # the non-replacing multi-input connector removes the old value and appends the new one
+    asyncio.run(run())
+
+
+def test_async_single_flight():
+    """Tests if concurrent awaits of the same output share one computation"""
+    call_logger = helper.CallLogger()
+    t = testclasses.Worker(work=functools.partial(time.sleep, 0.1), call_logger=call_logger)
+    t.get_value.set_caching(False)
+    t.get_value.set_executor(connectors.executor(threads=2))
+    t.set_value(1)
+    call_logger.clear()
+
+    async def run():
+        return await asyncio.gather(*(t.get_value.async_call() for _ in range(4)))
+    assert asyncio.run(run()) == [1, 1, 1, 1]
+    assert call_logger.get_number_of_calls() == 1
+
+
+def test_async_overlap():
+    """Tests if a computation in a thread does not block the event loop"""
+    t = testclasses.Worker(work=functools.partial(time.sleep, 0.3))
+    t.get_value.set_executor(connectors.executor(threads=2))
+    t.set_value(5)
+
+    async def run():
+        ticks = []
+
+        async def tick():
+            for _ in range(3):
+                await asyncio.sleep(0.05)
+                ticks.append(time.perf_counter())
+        start = time.perf_counter()
+        result, _ = await asyncio.gather(t.get_value.async_call(), tick())
+        return result, ticks, start
+    result, ticks, start = asyncio.run(run())
+    assert result == 5
+    assert ticks[-1] - start < 0.25     # the ticks have happened during the computation of the getter
+
+
+def test_async_persistent_session():
+    """Tests the async_call methods during a persistent session of the executor"""
+    t1 = testclasses.Simple()
+    t2 = testclasses.Simple().set_value.connect(t1.get_value)
+    with connectors.executor(threads=2) as executor:
+        t2.get_value.set_executor(executor)
+        t1.set_value.set_executor(executor)
+
+        async def run():
+            await t1.set_value.async_call(7)
+            return await t2.get_value.async_call()
+        assert asyncio.run(run()) == 7
+        t1.set_value(8)
+        assert t2.get_value() == 8
+
+
+def test_async_tear_down():
+    """Tests if the pools are shut down without blocking the event loop after an async_call"""
+    class Executor(connectors._common._executors.ThreadingExecutor):    # pylint: disable=protected-access # the tear down is not part of the public API
+        """Records the arguments, with which the pools are shut down"""
+        def __init__(self):
+            connectors._common._executors.ThreadingExecutor.__init__(self, number_of_threads=2)   # pylint: disable=protected-access # see above
+            self.waits = []
+
+        def _tear_down(self, wait=True):
+            self.waits.append(wait)
+            connectors._common._executors.ThreadingExecutor._tear_down(self, wait)     # pylint: disable=protected-access # see above
+    t = testclasses.Worker(work=functools.partial(time.sleep, 0.01))
+    executor = Executor()
+    t.get_value.set_executor(executor)
+    t.set_value(3)
+    assert t.get_value() == 3
+    assert executor.waits == [True]
+    t.set_value(4)
+    assert asyncio.run(t.get_value.async_call()) == 4
+    assert executor.waits == [True, False]
+
+
+def test_coroutine_methods():
+    """Tests connectors, that replace methods, which have been defined with ``async def``"""
+    for executor in (connectors.executor(threads=0),
+                     connectors.executor(threads=2),
+                     connectors.executor(threads=2, processes=2)):
+        t1 = testclasses.AsyncSimple()
+        t2 = testclasses.Simple().set_value.connect(t1.get_value)
+        t1.get_value.set_executor(executor)
+        t2.get_value.set_executor(executor)
+        assert t1.set_value(2) is t1
+        assert t1.get_value() == 2
+        assert t2.get_value() == 2
+        s = testclasses.AsyncMultiInput()
+        s.get_sum.set_executor(executor)
+        s.add_value.connect(t1.get_value)
+        data_id = s.add_value(3)
+        assert s.get_sum() == 5
+        s.remove_value(data_id)
+        assert s.get_sum() == 2
+        m = testclasses.AsyncMultiOutput()
+        m.get_value.set_executor(executor)
+        s.add_value.connect(m.get_value[3])
+        m.set_value(4)
+        assert s.get_sum() == 14
+        assert m.get_value(2) == 8
+
+        async def run(t1=t1, s=s):  # the default arguments bind the objects of the current iteration
+            await t1.set_value.async_call(5)
+            return await s.get_sum.async_call()
+        assert asyncio.run(run()) == 17
+
+
+def test_coroutine_overlap():
+    """Tests if coroutine methods, that wait for I/O, are awaited concurrently
+    without occupying a thread"""
+    sources = [testclasses.AsyncSimple(delay=0.2) for _ in range(5)]
+    s = testclasses.AsyncMultiInput()
+    s.get_sum.set_executor(connectors.executor(threads=0))
+    for i, t in enumerate(sources):
+        t.set_value(i)
+        s.add_value.connect(t.get_value)
+    start = time.perf_counter()
+    assert s.get_sum() == 10
+    assert time.perf_counter() - start < 0.6   # sequentially, the getters would take one second
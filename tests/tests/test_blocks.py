@@ -18,6 +18,8 @@
 
 import gc
 import weakref
+import numpy
+import pytest
 import connectors
 from . import helper
 from . import testclasses
@@ -135,3 +137,45 @@ def test_weakref_proxy_generator_data_types():
     for data in (1, 2.0, (3, 4.0), [5, 6.0], None):
         t.input(data)
         assert t.output() == data
+
+
+def test_sliding_window():
+    """Tests the :class:`SlidingWindow` class."""
+    data = numpy.arange(100, dtype=float)
+    for size, hop, capacity in ((8, 8, None), (8, 3, None), (8, 2, 9), (5, 7, 12)):
+        sliding_window = connectors.blocks.SlidingWindow(size=size, hop=hop, capacity=capacity)
+        position = 0
+        for length in (1, 4, 13, 2, 9, 30, 1, 40):
+            assert sliding_window.input(data[position:position + length]) is sliding_window
+            position += length
+            keys = sliding_window.keys()
+            retained = position - (capacity or max(2 * size, size + hop))
+            assert list(keys) == [k for k in range(position) if k * hop >= retained and k * hop + size <= position]
+            for k in keys:
+                assert numpy.array_equal(sliding_window.window[k](), data[k * hop:k * hop + size])
+            if keys.start > 0:
+                with pytest.raises(KeyError):
+                    sliding_window.window[keys.start - 1]()
+    # views instead of copies
+    sliding_window = connectors.blocks.SlidingWindow(size=4, hop=2, copy=False)
+    sliding_window.input(data[0:6])
+    first = sliding_window.window[0]()
+    sliding_window.input(data[6:20])
+    assert numpy.shares_memory(first, sliding_window.window[sliding_window.keys()[-1]]())  # the buffer is not reallocated
+    assert not first.flags.writeable
+    # connections
+    sliding_window = connectors.blocks.SlidingWindow(size=2)
+    t = testclasses.Simple().set_value.connect(sliding_window.window[1])
+    sliding_window.input([1.0, 2.0, 3.0, 4.0])
+    assert numpy.array_equal(t.get_value(), [3.0, 4.0])
+    sliding_window.input([5.0, 6.0])
+    assert numpy.array_equal(t.get_value(), [3.0, 4.0])
+    # streams
+    sliding_window = connectors.blocks.SlidingWindow(size=8, hop=3)
+    sliding_window.input(connectors.Stream.chunks(data[0:20], 7))
+    assert list(sliding_window.keys()) == [2, 3, 4]
+    assert numpy.array_equal(sliding_window.window[4](), data[12:20])
+    sliding_window.input(connectors.Stream.chunks(data[20:30], 3).buffered(capacity=2))
+    assert numpy.array_equal(sliding_window.window[7](), data[21:29])
+    with pytest.raises(ValueError):
+        connectors.blocks.SlidingWindow(size=4, capacity=3)
@@ -0,0 +1,73 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the process-wide memory budget for cached results"""
+
+import gc
+import sys
+import connectors
+from . import helper
+from . import testclasses
+
+
+def test_memory_budget():
+    """Tests if cached results are evicted, when the memory budget is exceeded,
+    and if evicted results are re-computed, when they are requested."""
+    gc.collect()    # discard the cached results of the previous tests
+    call_logger = helper.CallLogger()
+    small = testclasses.Simple(call_logger).set_value(bytes(100))
+    large = testclasses.Simple(call_logger).set_value(bytes(100000))
+    multi = testclasses.MultiOutputWithoutKeys(call_logger).set_value(bytes(1000))
+    call_logger.set_name_mapping(small=small, large=large, multi=multi)
+    small.get_value.set_caching(True)   # this replaces the methods with the connectors
+    large.get_value.set_caching(True)
+    multi.get_value.set_caching(True)
+    assert small.get_value() == bytes(100)
+    assert connectors.get_memory_usage() == 0    # without a budget, the memory consumption is not tracked
+    connectors.set_memory_budget(2 ** 40)
+    usage = connectors.get_memory_usage()
+    try:
+        # the memory consumption of the cached results is tracked
+        small.set_value(bytes(100))
+        assert small.get_value() == bytes(100)
+        assert large.get_value() == bytes(100000)
+        assert multi.get_value(3) == bytes(3000)
+        sizes = sys.getsizeof(bytes(100)) + sys.getsizeof(bytes(100000)) + sys.getsizeof(bytes(3000))
+        assert connectors.get_memory_usage() == usage + sizes
+        # the result, that is the cheapest to re-compute per byte, is evicted
+        connectors.set_memory_budget(connectors.get_memory_usage() - sys.getsizeof(bytes(100000)))
+        assert connectors.get_memory_usage() == usage + sys.getsizeof(bytes(100)) + sys.getsizeof(bytes(3000))
+        call_logger.clear()
+        assert small.get_value() == bytes(100)
+        assert multi.get_value(3) == bytes(3000)
+        assert call_logger.get_number_of_calls() == 0
+        # evicted results are re-computed transparently
+        assert large.get_value() == bytes(100000)
+        call_logger.compare([(large, "get_value", [], bytes(100000))]).clear()
+        # results of multi-output connectors are evicted, too
+        connectors.set_memory_budget(usage + sys.getsizeof(bytes(100)))
+        assert multi.get_value(3) == bytes(3000)
+        call_logger.compare([(multi, "get_value", [3], bytes(3000))]).clear()
+        assert multi.get_value.get_cache_statistics().evictions >= 1
+        # results, that are no longer valid, are no longer counted
+        connectors.set_memory_budget(2 ** 40)
+        multi.get_value(3)
+        small.set_value(bytes(10))
+        multi.set_value(bytes(10))
+        assert connectors.get_memory_usage() <= usage + sys.getsizeof(bytes(100000))
+    finally:
+        connectors.set_memory_budget(None)
+    assert connectors.get_memory_usage() == 0
@@ -16,6 +16,9 @@
 
 """Tests for multi-input connectors"""
 
+import gc
+import warnings
+import pytest
 import connectors
 from . import testclasses
 from . import helper
@@ -322,3 +325,21 @@ def test_condition_on_notify():
     assert t3.get_value() == (3.0,)  # the value from calling the method directly
     call_logger.compare([(t2, "set_condition", [True], t2), (t2, "get_values", [], (3.0,)),
                          (t3, "set_value", [(3.0,)], t3), (t3, "get_value", [], (3.0,))])
+
+
+def test_failing_replace():
+    """tests if the pending replace methods are cleaned up, when one of them raises an exception"""
+    for parallelization, executor in ((connectors.Parallelization.SEQUENTIAL, connectors.executor(threads=0)),
+                                      (connectors.Parallelization.THREAD, connectors.executor(threads=2))):
+        t1 = testclasses.MultiOutputWithKeys()
+        t2 = testclasses.FailingMultiInput().add_value.connect(t1.get_value)
+        t2.add_value.set_parallelization(parallelization)
+        t2.get_values.set_executor(executor)
+        assert t2.get_values() == (0, 0, 0)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            t1.set_value(-1)
+            with pytest.raises(ValueError):
+                t2.get_values()
+            gc.collect()
+        assert not [w for w in caught if "never awaited" in str(w.message)]
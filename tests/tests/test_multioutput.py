@@ -16,7 +16,11 @@
 
 """Tests for multi-output connectors"""
 
+import random
+import sys
+import numpy
 import pytest
+import connectors
 from . import helper
 from . import testclasses
 
@@ -116,6 +120,75 @@ def test_caching_in_parallelization():
                         (t5, "get_values", (), (3, 3, 12))])
 
 
+def test_cache_limits():
+    """tests if the cached results are evicted, when the limits of the cache are exceeded"""
+    call_logger = helper.CallLogger()
+    t = testclasses.MultiOutputWithoutKeys(call_logger).set_value(2)
+    call_logger.set_name_mapping(t=t).clear()
+    t.get_value.set_caching(True, max_entries=2)
+    assert [t.get_value(k) for k in (1, 2, 1, 3)] == [2, 4, 2, 6]    # the result for the key 2 is evicted, since it is least recently used
+    assert t.get_value(1) == 2
+    assert t.get_value(2) == 4
+    call_logger.compare([(t, "get_value", [1], 2), (t, "get_value", [2], 4),
+                         (t, "get_value", [3], 6), (t, "get_value", [2], 4)]).clear()
+    statistics = t.get_value.get_cache_statistics()
+    assert (statistics.hits, statistics.misses, statistics.evictions, statistics.entries) == (2, 4, 2, 2)
+    # a limit for the memory consumption
+    t.get_value.set_caching(True, max_bytes=2 * sys.getsizeof(2 ** 40))
+    for k in range(2 ** 40, 2 ** 40 + 4):
+        t.get_value(k)
+    statistics = t.get_value.get_cache_statistics()
+    assert statistics.entries == 2
+    assert statistics.bytes <= 2 * sys.getsizeof(2 ** 40)
+    # the least frequently used result is evicted
+    t = testclasses.MultiOutputWithCacheLimits(call_logger).set_value(2)
+    call_logger.set_name_mapping(t=t).clear()
+    assert t.get_value.get_cache_statistics().misses == 0   # this also replaces the method with the connector
+    assert [t.get_value(k) for k in (1, 1, 2, 3, 1, 2)] == [2, 2, 4, 6, 2, 4]
+    call_logger.compare([(t, "get_value", [1], 2), (t, "get_value", [2], 4),
+                         (t, "get_value", [3], 6), (t, "get_value", [2], 4)])
+    # changing a parameter clears the cache, but the statistics are kept
+    t.set_value(3)
+    assert t.get_value.get_cache_statistics().entries == 0
+    assert t.get_value(1) == 3
+    assert t.get_value.get_cache_statistics().misses == 5
+
+
+def test_lfu_eviction():
+    """tests if the LFU policy evicts the least frequently used result and the least
+    recently used one of equally often used results."""
+    cache = connectors._common.ResultCache(max_entries=8, eviction_policy=connectors.EvictionPolicy.LFU)   # pylint: disable=protected-access # the cache is not part of the public API
+    uses = {}       # a reference model, that maps the keys to the tuples (number of accesses, time of the last access)
+    rng = random.Random(0)
+    for time in range(2000):
+        key = rng.randrange(20)
+        if key in cache:
+            assert cache[key] == key
+            uses[key] = (uses[key][0] + 1, time)
+        else:
+            expected = min((k for k in uses if k != key), key=uses.__getitem__) if len(uses) == 8 else None
+            evicted = cache.add(key, key)
+            assert evicted == ([] if expected is None else [expected])
+            uses.pop(expected, None)
+            uses[key] = (1, time)
+    assert sorted(cache.keys()) == sorted(uses)
+
+
+def test_memoization():
+    """tests if the results are remembered for previously seen states of the observed inputs"""
+    call_logger = helper.CallLogger()
+    t = testclasses.MultiOutputWithoutKeys(call_logger)
+    call_logger.set_name_mapping(t=t)
+    t.get_value.set_memoization(None)
+    for value in (1, 2, 1):
+        t.set_value(value)
+        assert t.get_value(3) == 3 * value
+        assert t.get_value[4]() == 4 * value
+    call_logger.compare([(t, "set_value", [1], t), (t, "get_value", [3], 3), (t, "get_value", [4], 4),
+                         (t, "set_value", [2], t), (t, "get_value", [3], 6), (t, "get_value", [4], 8),
+                         (t, "set_value", [1], t)])
+
+
 def test_single_connections():
     """tests if connecting single-inputs to a multi-output connector works as expected."""
     t1 = testclasses.MultiOutputWithKeys()
@@ -221,3 +294,118 @@ def test_multi_connections_with_dynamic_keys():
     assert set(t3.get_values()) == {21, 35, 49}
     t2.get_value.disconnect(t3.add_value)
     assert t3.get_values() == ()
+
+
+def test_batch():
+    """tests if the batch method is used to compute all values for a multi-input connector at once."""
+    call_logger = helper.CallLogger()
+    t1 = testclasses.MultiOutputWithBatch(call_logger)
+    t2 = testclasses.ReplacingMultiInput().add_value.connect(t1.get_value)
+    assert t2.get_values() == (0, 0, 0)
+    call_logger.compare([(t1, "get_values", [(2, 3, 5)], {2: 0, 3: 0, 5: 0})]).clear()
+    t1.set_value(7)
+    assert set(t2.get_values()) == {14, 21, 35}
+    call_logger.compare([(t1, "set_value", [7], t1), (t1, "get_values", [(2, 3, 5)], {2: 14, 3: 21, 5: 35})]).clear()
+    # the batch method may also return a sequence
+    t1.set_as_mapping(False)
+    t1.set_keys((3, 5, 7))
+    assert set(t2.get_values()) == {21, 35, 49}
+    call_logger.compare([(t1, "set_keys", [(3, 5, 7)], t1), (t1, "get_values", [(3, 5, 7)], [21, 35, 49])]).clear()
+    # cached values are not computed again
+    assert t1.get_value(3) == 21
+    assert call_logger.get_number_of_calls() == 0
+    # single keys are computed with the getter
+    assert t1.get_value(4) == 28
+    call_logger.compare([(t1, "get_value", [4], 28)])
+
+
+def test_change_detection():
+    """tests if only the changed values are passed to a multi-input connector."""
+    call_logger = helper.CallLogger()
+    t1 = testclasses.MultiOutputWithKeys()
+    t2 = testclasses.ReplacingMultiInput(call_logger).add_value.connect(t1.get_value)
+    call_logger.set_name_mapping(t1=t1, t2=t2)
+    assert t2.get_values() == (0, 0, 0)
+    call_logger.clear()
+    # with the default setting, all values are passed
+    t1.set_value(0)
+    assert t2.get_values() == (0, 0, 0)
+    call_logger.compare([{((t2, "replace_value", (k, 0)),) for k in (2, 3, 5)},
+                         (t2, "get_values", [], (0, 0, 0))]).clear()
+    # with the equality check, only new and changed values are passed
+    t1.get_value.set_change_detection(connectors.ChangeDetection.EQUALITY)
+    t1.set_value(0)
+    assert t2.get_values() == (0, 0, 0)
+    call_logger.compare([{((t2, "replace_value", (k, 0)),) for k in (2, 3, 5)},
+                         (t2, "get_values", [], (0, 0, 0))]).clear()
+    t1.set_value(0)
+    assert t2.get_values() == (0, 0, 0)
+    call_logger.compare([(t2, "get_values", [], (0, 0, 0))]).clear()
+    t1.set_keys({2, 3, 7})
+    assert set(t2.get_values()) == {0}
+    call_logger.compare([(t2, "remove_value", [5]), (t2, "replace_value", [7, 0]), (t2, "get_values")]).clear()
+    t1.set_value(1)
+    assert set(t2.get_values()) == {2, 3, 7}
+    call_logger.compare([{((t2, "replace_value", (k, k)),) for k in (2, 3, 7)},
+                         (t2, "get_values")]).clear()
+    # a new connection receives all values first, and pending changes are merged, until they are processed
+    t3 = testclasses.ReplacingMultiInput().add_value.connect(t1.get_value)
+    assert set(t3.get_values()) == {2, 3, 7}
+    t1.set_keys({2, 3})
+    assert set(t2.get_values()) == {2, 3}
+    t1.set_value(2)
+    assert set(t2.get_values()) == {4, 6}
+    assert set(t3.get_values()) == {4, 6}
+
+
+def test_change_detection_with_arrays():
+    """tests if the equality check compares NumPy arrays by their content."""
+    call_logger = helper.CallLogger()
+    t1 = testclasses.MultiOutputWithKeys().set_value(numpy.arange(3))
+    t1.get_value.set_change_detection(connectors.ChangeDetection.EQUALITY)
+    t2 = testclasses.ReplacingMultiInput(call_logger).add_value.connect(t1.get_value)
+    assert len(t2.get_values()) == 3
+    call_logger.clear()
+    t1.set_value(numpy.arange(3))       # the products are new, but equal arrays
+    assert len(t2.get_values()) == 3
+    assert call_logger.get_number_of_calls() == 1     # only the call of get_values
+    call_logger.clear()
+    t1.set_keys({2, 3, 7})
+    values = t2.get_values()
+    assert (values[-1] == numpy.arange(3) * 7).all()
+    call_logger.compare([(t2, "remove_value", [5]), (t2, "replace_value", [7, values[-1]]),
+                         (t2, "get_values", [], values)])
+
+
+def test_change_detection_with_versions():
+    """tests if the values with unchanged versions are neither computed nor passed to a multi-input connector."""
+    call_logger = helper.CallLogger()
+    t1 = testclasses.MultiOutputWithVersions(call_logger)
+    t2 = testclasses.ReplacingMultiInput(call_logger).add_value.connect(t1.get_value)
+    call_logger.set_name_mapping(t1=t1, t2=t2)
+    for i in range(4):
+        t1.set_item((i, i * 10))
+    assert t2.get_values() == (0, 10, 20, 30)
+    call_logger.clear()
+    # changing a single value
+    t1.set_item((2, 21))
+    assert t2.get_values() == (0, 10, 21, 30)
+    call_logger.compare([(t1, "set_item", [(2, 21)]),
+                         (t1, "get_value", [2], 21),
+                         (t2, "replace_value", [2, 21]),
+                         (t2, "get_values")]).clear()
+    # removing a value
+    t1.delete_item(1)
+    assert t2.get_values() == (0, 21, 30)
+    call_logger.compare([(t1, "delete_item", [1]), (t2, "remove_value", [1]), (t2, "get_values")]).clear()
+    # the changes are merged, if they are not processed before the next notification
+    t3 = testclasses.ReplacingMultiInput().add_value.connect(t1.get_value)
+    assert t3.get_values() == (0, 21, 30)
+    t1.set_item((1, 11))
+    assert t2.get_values() == (0, 21, 30, 11)
+    t1.delete_item(1)
+    assert t2.get_values() == (0, 21, 30)
+    t1.set_item((0, 1))
+    t1.delete_item(3)
+    assert t2.get_values() == (1, 21)
+    assert t3.get_values() == (1, 21)
@@ -16,6 +16,11 @@
 
 """Tests for functionalities specific for output connectors"""
 
+import os
+import subprocess
+import sys
+import numpy
+import connectors
 from . import helper
 from . import testclasses
 
@@ -62,3 +67,131 @@ def test_caching():
     t1.set_value(2.0)
     assert t4.get_values() == (2.0,)
     assert t5.get_values() == (2.0,)
+
+
+def test_memoization():
+    """Tests if the results are remembered for previously seen states of the observed inputs"""
+    call_logger = helper.CallLogger()
+    t1 = testclasses.Simple(call_logger)
+    t2 = testclasses.Simple(call_logger).set_value.connect(t1.get_value)
+    call_logger.set_name_mapping(t1=t1, t2=t2)
+    t2.get_value.set_memoization(2)
+    # the getter is not called again, when the input returns to a previous value
+    for value in (1, 2, 1, 2):
+        t1.set_value(value)
+        assert t2.get_value() == value
+    call_logger.compare([(t1, "set_value", [1], t1), (t1, "get_value", [], 1),
+                         (t2, "set_value", [1], t2), (t2, "get_value", [], 1),
+                         (t1, "set_value", [2], t1), (t1, "get_value", [], 2),
+                         (t2, "set_value", [2], t2), (t2, "get_value", [], 2),
+                         (t1, "set_value", [1], t1), (t1, "get_value", [], 1), (t2, "set_value", [1], t2),
+                         (t1, "set_value", [2], t1), (t1, "get_value", [], 2), (t2, "set_value", [2], t2)]).clear()
+    # only the given number of states is remembered
+    for value in (3, 1):
+        t2.set_value(value)
+        assert t2.get_value() == value
+    call_logger.compare([(t2, "set_value", [3], t2), (t2, "get_value", [], 3),
+                         (t2, "set_value", [1], t2), (t2, "get_value", [], 1)]).clear()
+    # NumPy arrays are compared by their content
+    t2.set_value(numpy.arange(4))
+    t2.get_value()
+    t2.set_value(numpy.zeros(4))
+    t2.get_value()
+    t2.set_value(numpy.arange(4))
+    assert (t2.get_value() == numpy.arange(4)).all()
+    assert call_logger.get_number_of_calls() == 5
+    call_logger.clear()
+    # a custom hasher
+    t2.get_value.set_memoization(None, hasher=round)
+    for value in (1.0, 2.0, 1.2):
+        t2.set_value(value)
+        t2.get_value()
+    assert t2.get_value() == 1.0    # the result for 1.0 is reused for 1.2, because the hasher rounds the values
+    assert call_logger.get_number_of_calls() == 5
+    call_logger.clear()
+    # memoization is disabled by default
+    t3 = testclasses.Simple(call_logger).set_value.connect(t1.get_value)
+    call_logger.set_name_mapping(t3=t3)
+    for value in (1, 2, 1):
+        t1.set_value(value)
+        assert t3.get_value() == value
+    assert call_logger.get_number_of_calls() == 12
+
+
+def test_disk_cache(tmp_path):
+    """Tests the storing of results on the disk"""
+    disk_cache = connectors.DiskCache(tmp_path / "cache")
+    testclasses.DiskCached.calls = 0
+    t1 = testclasses.DiskCached().set_value(numpy.arange(1000))
+    t1.get_value.set_disk_cache(disk_cache)
+    assert (t1.get_value() == numpy.arange(1000) * 2).all()
+    assert testclasses.DiskCached.calls == 1
+    # a new instance with the same state loads the result from the disk
+    t2 = testclasses.DiskCached().set_value(numpy.arange(1000))
+    t2.get_value.set_disk_cache(disk_cache)
+    result = t2.get_value()
+    assert isinstance(result, numpy.memmap)
+    assert (result == numpy.arange(1000) * 2).all()
+    assert testclasses.DiskCached.calls == 1
+    # a different state causes a re-computation
+    t2.set_value(numpy.arange(1001))
+    t2.get_value()
+    assert testclasses.DiskCached.calls == 2
+    # other results than arrays are pickled
+    t1.set_value("abc")
+    t2.set_value("abc")
+    assert t1.get_value() == t2.get_value() == "abcabc"
+    assert testclasses.DiskCached.calls == 3
+    # the least recently used results are deleted, when the size limit is exceeded
+    assert disk_cache.get_size() > 16000
+    limited = connectors.DiskCache(tmp_path / "cache", max_bytes=16000)
+    t3 = testclasses.DiskCached().set_value(numpy.arange(1000))
+    t3.get_value.set_disk_cache(limited)
+    t3.get_value()                                      # touches the first result
+    t3.set_value(numpy.arange(500))
+    t3.get_value()                                      # adds a new result, which exceeds the limit
+    assert testclasses.DiskCached.calls == 4
+    assert limited.get_size() <= 16000
+    t3.set_value(numpy.arange(1000))
+    t3.get_value()
+    assert testclasses.DiskCached.calls == 4            # the recently used result has not been deleted
+    limited.clear()
+    assert limited.get_size() == 0
+
+
+def test_disk_cache_versions(tmp_path):
+    """Tests if editing the getter or changing the version invalidates the stored results"""
+    class Container:    # pylint: disable=missing-docstring,too-few-public-methods
+        def get_value(self):    # pylint: disable=missing-docstring
+            return 1
+
+    class Edited:       # pylint: disable=missing-docstring,too-few-public-methods
+        def get_value(self):    # pylint: disable=missing-docstring
+            return 2
+
+    Edited.__name__ = Edited.__qualname__ = Container.__qualname__    # simulates an edit of the Container class
+    disk_cache = connectors.DiskCache(tmp_path)
+    key = disk_cache.key(Container.get_value, Container())
+    assert disk_cache.key(Container.get_value, Container()) == key
+    assert disk_cache.key(Edited.get_value, Edited()) != key
+    assert connectors.DiskCache(tmp_path, version="2").key(Container.get_value, Container()) != key
+
+
+def test_disk_cache_keys(tmp_path):
+    """Tests if the keys of the disk cache do not depend on the randomized hashes of strings"""
+    script = ("import connectors\n"
+              "class Container:\n"
+              "    def get_value(self):\n"
+              "        pass\n"
+              "c = Container()\n"
+              "c.names = {'alpha', 'beta', 'gamma', 'delta', 'epsilon'}\n"
+              "c.nested = [frozenset({'x', 'y', 'z'}), {'key': {'u', 'v', 'w'}}]\n"
+              f"print(connectors.DiskCache({str(tmp_path)!r}).key(Container.get_value, c))\n")
+    keys = set()
+    for seed in range(4):
+        environment = dict(os.environ, PYTHONHASHSEED=str(seed))
+        process = subprocess.run([sys.executable, "-c", script], env=environment,
+                                 cwd=os.path.dirname(os.path.dirname(connectors.__file__)),
+                                 capture_output=True, check=True, text=True)
+        keys.add(process.stdout.strip())
+    assert len(keys) == 1
@@ -16,11 +16,26 @@
 
 """Tests for the automatic parallelization"""
 
+import gc
+import os
+import functools
 import time
+import numpy
+import pytest
 import connectors
 from . import testclasses
 
 
+def _logged_work(path):
+    """A workload, that logs its executions to a file and fails in its second execution."""
+    time.sleep(0.01)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("called\n")
+    with open(path, encoding="utf-8") as f:
+        if len(f.readlines()) == 2:
+            raise ValueError("the second execution fails")
+
+
 def test_parallelization_and_executors():
     """Tests the correctness of the computation with different parallelization configurations"""
     t1 = testclasses.Simple()
@@ -30,7 +45,8 @@ def test_parallelization_and_executors():
     for executor in (connectors.executor(threads=t, processes=p) for p in (0, 2) for t in (0, 2)):
         for output_parallelization in (connectors.Parallelization.SEQUENTIAL,
                                        connectors.Parallelization.THREAD,
-                                       connectors.Parallelization.PROCESS):
+                                       connectors.Parallelization.PROCESS,
+                                       connectors.Parallelization.AUTO):
             for input_parallelization in (connectors.Parallelization.SEQUENTIAL,            # putting setter in a separate process
                                           connectors.Parallelization.THREAD):               # will not work, since the changes will
                 for multiinput_parallelization in (connectors.Parallelization.SEQUENTIAL,   # not be applied to the objects in the
@@ -65,6 +81,24 @@ def test_concurrency():
     assert run_duration < 2.0   # since both paths can be executed in parallel, their sleep times must not be added
 
 
+def test_multiinput_concurrency():
+    """Tests if the replace methods of a multi-input connector are executed concurrently
+    for the different connections, while new values are added in the order of the connections."""
+    source = testclasses.Simple().set_value(1)
+    branches = [testclasses.Simple().set_value.connect(source.get_value) for _ in range(3)]
+    sink = testclasses.SleepInReplace()
+    for b in branches:
+        b.get_value.connect(sink.add_value)
+    sink.get_values.set_executor(connectors.executor(threads=4))
+    assert sink.get_values() == (1, 1, 1)
+    source.set_value(2)     # changes the values of all branches, so that all values are replaced
+    start_time = time.time()
+    assert sink.get_values() == (2, 2, 2)
+    run_duration = time.time() - start_time
+    assert run_duration > 1.0   # each replace method has a sleep time of 1s
+    assert run_duration < 2.0   # since the replace methods can be executed concurrently, their sleep times must not be added
+
+
 def test_multioutput_parallelization():
     """tests if the getter method is executed concurrently with the different parameters."""
     t1 = testclasses.SleepInMultiOutput()
@@ -81,3 +115,149 @@ def test_multioutput_parallelization():
     run_duration = time.time() - start_time
     assert run_duration > 1.0                   # the longest running path has a sleep time of 1s
     assert run_duration < 2.0                   # since the getter can be executed in parallel, its sleep times must not be added
+
+
+def test_persistent_executor():
+    """Tests if a persistent session of an executor reuses its event loop and computes correct results"""
+    t1 = testclasses.Simple()
+    t2 = testclasses.Simple().set_value.connect(t1.get_value)
+    t1.get_value.set_caching(False)
+    for executor in (connectors.executor(threads=t, processes=p) for p in (0, 2) for t in (0, 2)):
+        t1.get_value.set_parallelization(connectors.Parallelization.PROCESS)
+        t2.get_value.set_executor(executor)
+        with executor:
+            loop = executor.get_event_loop()
+            assert loop is not None
+            for i in range(3):
+                t1.set_value(i)
+                assert t2.get_value() == i
+                assert executor.get_event_loop() is loop
+        assert executor.get_event_loop() is None
+        assert loop.is_closed()
+        executor.start()
+        t1.set_value("restarted")
+        assert t2.get_value() == "restarted"
+        executor.shutdown()
+        executor.shutdown()     # shutting down an executor without a persistent session shall have no effect
+        t1.set_value("temporary")
+        assert t2.get_value() == "temporary"
+
+
+def test_actors():
+    """Tests if the instances are kept resident in worker processes, when the actor mode is enabled"""
+    for threads in (0, 2):
+        t = testclasses.CallCounter().set_value(1)
+        # without the actor mode, the instance is recreated in the process for every call
+        t.get_value.set_executor(connectors.executor(threads=threads, processes=2))
+        assert t.get_value()[0:2] == (1, 1)
+        assert t.get_value()[0:2] == (1, 1)
+        # with the actor mode, the instance's state persists in the worker process
+        executor = connectors.executor(threads=threads, processes=2, actors=True)
+        t.get_value.set_executor(executor)
+        with executor:
+            value, calls, pid = t.get_value()
+            assert (value, calls) == (1, 1)
+            assert pid != os.getpid()
+            assert t.get_value() == (1, 2, pid)
+            t.set_value(2)
+            assert t.get_value() == (2, 3, pid)
+            other = testclasses.CallCounter().set_value(3)
+            other.get_value.set_executor(executor)
+            assert other.get_value()[0:2] == (3, 1)
+            del other
+            gc.collect()
+            assert t.get_value() == (2, 4, pid)
+        # the resident instances are discarded at the end of a persistent session
+        with executor:
+            assert t.get_value()[0:2] == (2, 1)
+
+
+def test_shared_memory():
+    """Tests the passing of large buffers to and from the worker processes through shared memory"""
+    for threads in (0, 2):
+        for actors in (False, True):
+            t = testclasses.Doubler()
+            executor = connectors.executor(threads=threads, processes=2, actors=actors, shared_memory=True)
+            t.get_value.set_executor(executor)
+            with executor:
+                # a NumPy array, that is large enough to be shared
+                array = numpy.arange(2 ** 17, dtype=numpy.complex64).reshape(2, -1)
+                result = t.set_value(array).get_value()
+                assert isinstance(result, numpy.ndarray)
+                assert result.shape == array.shape and result.dtype == array.dtype
+                assert (result == array * 2).all()
+                # bytes objects
+                assert t.set_value(b"ab" * 2 ** 16).get_value() == b"abab" * 2 ** 16
+                # small values and values, that cannot be shared, are pickled as usual
+                assert t.set_value(3).get_value() == 6
+                assert t.set_value([1.0] * 2 ** 16).get_value() == [1.0] * 2 ** 17
+
+
+def test_automatic_parallelization():
+    """Tests if the automatic parallelization chooses the execution from the measured execution times"""
+    for threads, processes, expected in ((2, 0, connectors.Parallelization.THREAD),
+                                         (2, 2, connectors.Parallelization.PROCESS),
+                                         (0, 2, connectors.Parallelization.PROCESS)):
+        executor = connectors.executor(threads=threads, processes=processes)
+        fast = testclasses.Worker()
+        slow = testclasses.Worker(work=functools.partial(time.sleep, 0.05))
+        unpicklable = testclasses.Worker(work=lambda: time.sleep(0.05))
+        for t in (fast, slow, unpicklable):
+            t.get_value.set_caching(False)
+            t.get_value.set_parallelization(connectors.Parallelization.AUTO)
+            t.get_value.set_executor(executor)
+            t.set_value(id(t))
+        assert executor.get_parallelization(fast.get_value) is None
+        with executor:
+            for _ in range(6):
+                for t in (fast, slow, unpicklable):
+                    assert t.get_value() == id(t)
+        assert executor.get_parallelization(fast.get_value) == connectors.Parallelization.SEQUENTIAL
+        assert executor.get_parallelization(slow.get_value) == expected
+        expected = connectors.Parallelization.THREAD if threads else connectors.Parallelization.SEQUENTIAL
+        assert executor.get_parallelization(unpicklable.get_value) == expected
+
+
+def test_automatic_parallelization_errors(tmp_path):
+    """Tests if the exceptions, that are raised by a method in a worker process,
+    are passed on without executing the method again in the current process"""
+    log = tmp_path / "calls.log"
+    executor = connectors.executor(threads=0, processes=2)
+    t = testclasses.Worker(work=functools.partial(_logged_work, str(log)))
+    t.get_value.set_caching(False)
+    t.get_value.set_parallelization(connectors.Parallelization.AUTO)
+    t.get_value.set_executor(executor)
+    with executor:
+        assert t.get_value() == 0           # executed sequentially
+        with pytest.raises(ValueError):
+            t.get_value()                   # executed in a process
+        assert len(log.read_text(encoding="utf-8").splitlines()) == 2
+        assert t.get_value() == 0           # the process based execution has not been disabled by the error
+        assert len(log.read_text(encoding="utf-8").splitlines()) == 3
+
+
+def test_critical_path_scheduling():
+    """Tests if the critical path aware scheduling passes the long branch of an unbalanced network to the thread pool first"""
+    order = []
+
+    def work(name):
+        order.append(name)
+        time.sleep(0.02)
+
+    for scheduling in connectors.Scheduling:
+        shorts = [testclasses.Worker(work=functools.partial(work, "short")) for _ in range(4)]
+        chain = [testclasses.Worker(work=functools.partial(work, "chain"))]
+        for _ in range(2):
+            chain.append(testclasses.Worker(work=functools.partial(work, "chain")).set_value.connect(chain[-1].get_value))
+        join = testclasses.MultiInputWorker()
+        for t in shorts + chain[-1:]:
+            join.add_value.connect(t.get_value)
+        join.get_value.set_executor(connectors.executor(threads=1, scheduling=scheduling))
+        for value in (1, 2):
+            for t in shorts + chain[:1]:
+                t.set_value(value)
+            order.clear()
+            assert join.get_value() == 5 * value
+        assert sorted(order) == ["chain"] * 3 + ["short"] * 4
+        if scheduling == connectors.Scheduling.CRITICAL_PATH:
+            assert order.index("chain") <= 1    # the first method may have reached the thread pool before the others
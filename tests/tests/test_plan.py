@@ -0,0 +1,131 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the compiled execution plans"""
+
+import pytest
+import connectors
+from . import helper
+from . import testclasses
+
+
+def test_diamond():
+    """Tests a compiled plan for a diamond shaped network, in which every connector
+    shall only be executed once."""
+    call_logger = helper.CallLogger()
+    source = testclasses.Simple(call_logger)
+    branch1 = testclasses.Simple(call_logger).set_value.connect(source.get_value)
+    branch2 = testclasses.Simple(call_logger).set_value.connect(source.get_value)
+    sink = testclasses.MultipleInputs(call_logger)
+    sink.set_value1.connect(branch1.get_value).set_value2.connect(branch2.get_value)
+    call_logger.set_name_mapping(source=source, branch1=branch1, branch2=branch2, sink=sink)
+    plan = connectors.compile_plan(sink.get_values)
+    assert len(plan) == 8
+    source.set_value(2)
+    assert plan() == (2, 2)
+    call_logger.compare([(source, "set_value", [2], source),
+                         (source, "get_value", [], 2),
+                         {((branch1, "set_value", (2,), branch1),
+                           (branch1, "get_value", (), 2),
+                           (sink, "set_value1", (2,), sink)),
+                          ((branch2, "set_value", (2,), branch2),
+                           (branch2, "get_value", (), 2),
+                           (sink, "set_value2", (2,), sink))},
+                         (sink, "get_values", [], (2, 2))]).clear()
+    # the cached result is returned without executing anything
+    assert plan() == (2, 2)
+    assert call_logger.get_number_of_calls() == 0
+    # only the outdated connectors are executed
+    branch2.set_value(3)
+    assert plan() == (2, 3)
+    call_logger.compare([(branch2, "set_value", [3], branch2),
+                         (branch2, "get_value", [], 3),
+                         (sink, "set_value2", [3], sink),
+                         (sink, "get_values", [], (2, 3))]).clear()
+    # the plan leaves the network in the same state, as if it had been computed through the connectors
+    assert sink.get_values() == (2, 3)
+    assert call_logger.get_number_of_calls() == 0
+
+
+def test_recompilation():
+    """Tests if the plan is compiled again, when the network is changed"""
+    source1 = testclasses.Simple().set_value(1)
+    source2 = testclasses.Simple().set_value(2)
+    sink = testclasses.Simple().set_value.connect(source1.get_value)
+    plan = connectors.compile_plan(sink.get_value)
+    assert plan() == 1
+    assert len(plan) == 3
+    intermediate = testclasses.Simple().set_value.connect(source2.get_value)
+    intermediate.get_value.connect(sink.set_value)
+    assert plan() == 2
+    assert len(plan) == 6
+    source2.set_value(3)
+    assert plan() == 3
+    intermediate.get_value.disconnect(sink.set_value)
+    assert len(plan) == 3
+    source1.set_value(4)
+    assert plan() == 4
+
+
+def test_fallback():
+    """Tests a compiled plan for a network with multi-input and multi-output
+    connectors, which are requested through the usual protocol."""
+    multi_output = testclasses.MultiOutputWithKeys().set_value(2)
+    item = testclasses.Simple().set_value.connect(multi_output.get_value[3])
+    multi_input = testclasses.ReplacingMultiInput().add_value.connect(item.get_value)
+    sink = testclasses.Simple().set_value.connect(multi_input.get_values)
+    plan = connectors.compile_plan(sink.get_value)
+    assert plan() == (6,)
+    multi_output.set_value(3)
+    assert plan() == (9,)
+    assert sink.get_value() == (9,)
+
+
+def test_macro():
+    """Tests a compiled plan for an output connector, that is exported by macro connectors"""
+    macro = testclasses.MacroInMacro()
+    macro.set_input(1)
+    plan = connectors.compile_plan(macro.get_output)
+    assert plan() == ((1, 1), 1)
+    macro.set_input(2)
+    assert plan() == ((2, 2), 2)
+    assert macro.get_output() == ((2, 2), 2)   # pylint: disable=comparison-with-callable; Pylint got confused by the MacroOutput decorator
+
+
+def test_threads():
+    """Tests a compiled plan, in which the connectors are executed in threads"""
+    source = testclasses.Simple()
+    sinks = [testclasses.Simple().set_value.connect(source.get_value) for _ in range(4)]
+    sink = testclasses.ReplacingMultiInput()
+    for s in sinks:
+        s.get_value.set_parallelization(connectors.Parallelization.THREAD)
+        s.get_value.connect(sink.add_value)
+    plan = connectors.compile_plan(sink.get_values)
+    with connectors.executor(threads=4) as executor:
+        sink.get_values.set_executor(executor)
+        for value in range(3):
+            source.set_value(value)
+            assert plan() == (value,) * 4
+
+
+def test_errors():
+    """Tests the errors, when compiling an execution plan"""
+    with pytest.raises(TypeError):
+        connectors.compile_plan(testclasses.Simple().set_value)
+    with pytest.raises(TypeError):
+        connectors.compile_plan(testclasses.Macro().set_input1)
+    with pytest.raises(TypeError):
+        connectors.compile_plan(lambda: 3)
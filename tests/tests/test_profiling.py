@@ -0,0 +1,162 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the profiling hooks and the timing statistics"""
+
+import gc
+import json
+import os
+import time
+import connectors
+from . import testclasses
+
+
+def _statistics(instance, method):
+    """Returns the statistics of the given connector from the statistics table"""
+    for s in connectors.stats():
+        if s.instance == f"{type(instance).__qualname__} at {id(instance):#x}" and s.connector.endswith(f".{method}"):
+            return s
+    return None
+
+
+def test_statistics():
+    """Tests the collection of the call counts and the cache hits and misses"""
+    t1 = testclasses.Simple()
+    t2 = testclasses.Simple().set_value.connect(t1.get_value)
+    connectors.stats(reset=True)
+    t1.set_value(1)
+    assert connectors.stats() == ()     # profiling is disabled by default
+    connectors.set_profiling(True)
+    try:
+        t1.set_value(2)
+        assert t2.get_value() == 2
+        assert t2.get_value() == 2
+        setter = _statistics(t1, "set_value")
+        assert setter.calls == 1 and (setter.cache_hits, setter.cache_misses) == (0, 0)
+        assert setter.wall_time >= 0.0 and setter.cpu_time >= 0.0
+        getter = _statistics(t2, "get_value")
+        assert getter.calls == 1 and (getter.cache_hits, getter.cache_misses) == (1, 1)
+        table = str(connectors.stats(reset=True))
+        assert "Simple.get_value" in table and "misses" in table
+        assert connectors.stats() == ()
+    finally:
+        connectors.set_profiling(False)
+    t1.set_value(3)
+    assert t2.get_value() == 3
+    assert connectors.stats() == ()
+
+
+def test_memoization():
+    """Tests if the results from the memoization are counted separately from the cache hits"""
+    t1 = testclasses.Simple()
+    t2 = testclasses.Simple().set_value.connect(t1.get_value)
+    t2.get_value.set_memoization(2)
+    t3 = testclasses.MultiOutputWithoutKeys()
+    t3.get_value.set_memoization(None)
+    connectors.stats(reset=True)
+    connectors.set_profiling(True)
+    try:
+        for value in (1, 2, 1):
+            t1.set_value(value)
+            t3.set_value(value)
+            assert t2.get_value() == value
+            assert t2.get_value() == value
+            assert t3.get_value(3) == 3 * value
+        output = _statistics(t2, "get_value")
+        assert (output.cache_hits, output.memo_hits, output.cache_misses) == (3, 1, 2)
+        multioutput = _statistics(t3, "get_value")
+        assert (multioutput.cache_hits, multioutput.memo_hits, multioutput.cache_misses) == (0, 1, 2)
+    finally:
+        connectors.set_profiling(False)
+        connectors.stats(reset=True)
+
+
+def test_reused_ids():
+    """Tests if new instances, that reuse the ids of deleted ones, start with fresh statistics"""
+    connectors.stats(reset=True)
+    connectors.set_profiling(True)
+    try:
+        deleted = [testclasses.Simple() for _ in range(10)]
+        ids = set()
+        while deleted:
+            t = deleted.pop()
+            t.set_value(1)
+            t.set_value(2)
+            ids.add(id(t))
+        del t
+        gc.collect()
+        created = [testclasses.Simple() for _ in range(1000)]
+        reused = [t for t in created if id(t) in ids]
+        assert reused
+        for t in reused:
+            t.set_value(3)
+        assert sorted(s.calls for s in connectors.stats()) == [1] * len(reused) + [2] * 10
+    finally:
+        connectors.set_profiling(False)
+        connectors.stats(reset=True)
+
+
+def test_hooks():
+    """Tests if custom profiling hooks receive the records from the executors"""
+    records = []
+    connectors.add_profiling_hook(records.append)
+    try:
+        t1 = testclasses.Simple()
+        t1.get_value.set_executor(connectors.executor(threads=2))
+        t1.get_value.set_parallelization(connectors.Parallelization.THREAD)
+        t2 = testclasses.Doubler().set_value.connect(t1.get_value)
+        t2.get_value.set_executor(connectors.executor(threads=1, processes=1))
+        t1.set_value(3)
+        before = time.perf_counter()
+        assert t2.get_value() == 6
+        after = time.perf_counter()
+    finally:
+        connectors.remove_profiling_hook(records.append)
+    t1.set_value(4)
+    assert len([r for r in records if r.event == "call" and r.method == "set_value"]) == 2
+    calls = {(r.instance, r.method): r for r in records if r.event == "call"}
+    assert set(calls) == {(t1, "set_value"), (t1, "get_value"), (t2, "set_value"), (t2, "get_value")}
+    assert calls[t2, "get_value"].process_id != os.getpid()
+    assert calls[t1, "set_value"].process_id == os.getpid()
+    assert all(r.queue_time >= 0.0 for r in calls.values())
+    assert before - 0.01 < calls[t2, "get_value"].start < after     # the start time in the worker process is converted to the clock of the main process
+    assert calls[t2, "get_value"].queue_time < after - before
+    assert [r.event for r in records if r.event != "call"] == ["cache_miss", "cache_miss"]
+
+
+def test_trace(tmp_path):
+    """Tests if the trace shows the overlapping executions of parallelized getters"""
+    source = testclasses.Simple()
+    branch1 = testclasses.SleepInOutput().set_value.connect(source.get_value)
+    branch2 = testclasses.SleepInOutput().set_value.connect(source.get_value)
+    sink = testclasses.MultipleInputs().set_value1.connect(branch1.get_value).set_value2.connect(branch2.get_value)
+    sink.get_values.set_executor(connectors.executor(threads=2))
+    path = tmp_path / "trace.json"
+    with connectors.trace(path):
+        source.set_value(1)
+        assert sink.get_values() == (1, 1)
+    source.set_value(2)
+    with open(path, encoding="utf-8") as f:
+        events = json.load(f)["traceEvents"]
+    assert [e["args"]["name"] for e in events if e["ph"] == "M"] == [f"main process {os.getpid()}"]
+    calls = [e for e in events if e["ph"] == "X"]
+    assert [e["name"] for e in calls].count("SleepInOutput.get_value") == 2
+    assert [e["name"] for e in calls].count("Simple.set_value") == 1
+    sleeps = [e for e in calls if e["name"] == "SleepInOutput.get_value"]
+    assert sleeps[0]["tid"] != sleeps[1]["tid"]
+    assert sleeps[1]["ts"] < sleeps[0]["ts"] + sleeps[0]["dur"]    # the executions have overlapped
+    assert {e["args"]["instance"] for e in sleeps} == {f"SleepInOutput at {id(b):#x}" for b in (branch1, branch2)}
+    assert {e["cat"] for e in events if e["ph"] == "i"} == {"cache_miss"}
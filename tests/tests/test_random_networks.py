@@ -0,0 +1,45 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Stress tests with randomly generated processing networks"""
+
+import connectors
+from . import helper
+
+
+def test_random_networks():
+    """Tests if randomly generated networks compute the same results as their model"""
+    for seed in range(6):
+        network = helper.generate_network(layers=8, width=6, fan_in=3, shares=helper.NodeShares(0.2, 0.2, 0.2, 0.2),
+                                          join=seed % 2 == 1, seed=seed)
+        assert network.request() == network.expected()
+        for executor in (connectors.executor(threads=0), connectors.executor(threads=3)):
+            network.set_executor(executor)
+            with executor:
+                for count in (1, 3, 6):
+                    network.update(count)
+                    assert network.request() == network.expected()
+
+
+def test_workloads():
+    """Tests the workloads, which can be executed by the nodes of a generated network"""
+    for work in (helper.busy_loop, helper.numpy_kernel):
+        network = helper.generate_network(layers=3, width=3, work=lambda w=work: w(100))
+        network.update(3)
+        assert network.request() == network.expected()
+    network = helper.generate_network(layers=2, width=2, work=lambda: helper.sleep(0.001))
+    network.update()
+    assert network.request() == network.expected()
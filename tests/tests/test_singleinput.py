@@ -289,3 +289,25 @@ def test_condition_on_notify():
     call_logger.compare([(t2, "set_value", [3.0], t2)])
     assert t2.get_value() == 1.0
     t2.set_value(value=4.0)     # tests for an implementation detail, that specifying the value as keyword argument takes a slightly more complex code path
+
+
+def test_diamond_announcements():
+    """Tests if an announcement reaches the connectors below stacked diamonds only
+    once, even though there are exponentially many paths through the diamonds"""
+    source = testclasses.Simple()
+    output = source.get_value
+    for _ in range(10):
+        left = testclasses.Simple().set_value.connect(output)
+        right = testclasses.Simple().set_value.connect(output)
+        output = testclasses.MultipleInputs().set_value1.connect(left.get_value).set_value2.connect(right.get_value).get_values
+    counter = testclasses.AnnouncementCounter().set_value.connect(output)
+    counter.announcements = 0
+    source.set_value(1)
+    assert counter.announcements == 1
+    source.set_value(2)
+    assert counter.announcements == 2
+    result = counter.get_value()
+    for _ in range(10):
+        assert result == (result[0], result[0])
+        result = result[0]
+    assert result == 2
@@ -0,0 +1,133 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the streaming output connectors, which pass their data in chunks"""
+
+import threading
+import time
+import pytest
+import connectors
+from . import testclasses
+
+
+def test_streaming_chain():
+    """Tests a streaming processing chain and the propagation of parameter changes"""
+    source = testclasses.StreamSource(data=list(range(10)), chunk_size=3)
+    gain = testclasses.StreamGain(gain=2).set_input.connect(source.get_chunks)
+    total = testclasses.StreamSum().set_input.connect(gain.get_output)
+    stream = gain.get_output()
+    assert isinstance(stream, connectors.Stream)
+    assert list(stream) == [[0, 2, 4], [6, 8, 10], [12, 14, 16], [18]]
+    assert list(stream) == list(stream)     # the stream can be iterated over multiple times
+    assert total.get_sum() == 90
+    gain.set_gain(3)
+    assert total.get_sum() == 135
+    source.set_data(list(range(4)))
+    assert total.get_sum() == 18
+    source.set_chunk_size(1)
+    assert list(gain.get_output()) == [[0], [3], [6], [9]]
+    assert list(connectors.Stream.chunks(list(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+
+
+def test_block_by_block():
+    """Tests if the chunks are passed through the chain one by one rather than all at once"""
+    log = []
+    source = testclasses.StreamSource(data=list(range(8)), chunk_size=2, log=log)
+    gain = testclasses.StreamGain().set_input.connect(source.get_chunks)
+    total = testclasses.StreamSum(log=log).set_input.connect(gain.get_output)
+    assert total.get_sum() == 28
+    assert log == ["produce", "consume"] * 4
+
+
+def test_prefetching():
+    """Tests if prefetching stages of a streaming chain work concurrently"""
+    delay = 0.02
+    durations = []
+    for stage in (testclasses.StreamGain, testclasses.PrefetchingStreamGain):
+        source = testclasses.StreamSource(data=list(range(10)), chunk_size=1)
+        first = stage(delay=delay).set_input.connect(source.get_chunks)
+        second = stage(delay=delay).set_input.connect(first.get_output)
+        total = testclasses.StreamSum().set_input.connect(second.get_output)
+        start = time.perf_counter()
+        assert total.get_sum() == 45
+        durations.append(time.perf_counter() - start)
+    assert durations[0] >= 20 * delay
+    assert durations[1] < 0.8 * durations[0]
+
+
+def test_prefetching_abort():
+    """Tests if a prefetching stream stops producing chunks, when the iteration
+    is aborted, and if exceptions are passed to the consumer
+    """
+    log = []
+    source = testclasses.StreamSource(data=list(range(100)), chunk_size=1, log=log)
+    gain = testclasses.PrefetchingStreamGain().set_input.connect(source.get_chunks)
+    threads = threading.active_count()
+    for chunk in gain.get_output():
+        assert chunk == [0]
+        break
+    time.sleep(0.05)
+    assert len(log) <= 3
+    assert threading.active_count() == threads
+
+    def failing():
+        yield 1
+        raise ValueError("test")
+    iterator = iter(connectors.Stream(failing, prefetch=2))
+    assert next(iterator) == 1
+    with pytest.raises(ValueError):
+        next(iterator)
+
+
+def _slow(stream, delay):
+    """A generator, that consumes a stream with a delay per chunk"""
+    for chunk in stream:
+        time.sleep(delay)
+        yield chunk
+
+
+def test_buffer_policies():
+    """Tests the behavior of the buffered streams, when the buffer is full"""
+    source = testclasses.StreamSource(data=list(range(40)), chunk_size=1)
+    # blocking: the producer waits for the consumer, so that no chunk is lost
+    buffer = connectors.blocks.Buffer(capacity=2).input.connect(source.get_chunks)
+    assert list(_slow(buffer.output(), 0.002)) == [[i] for i in range(40)]
+    statistics = buffer.statistics()
+    assert statistics.max_depth <= 2
+    assert statistics.produced == statistics.consumed == 40
+    assert statistics.depth == statistics.dropped == statistics.coalesced == 0
+    # dropping: the consumer receives the most recent chunks
+    buffer.set_policy(connectors.BufferPolicy.DROP)
+    chunks = list(_slow(buffer.output(), 0.01))
+    statistics = buffer.statistics()
+    assert chunks[-1] == [39]
+    assert statistics.max_depth <= 2
+    assert statistics.dropped > 0
+    assert statistics.consumed + statistics.dropped == statistics.produced == 40
+    # coalescing: the chunks are merged, so that no data is lost
+    buffer.set_policy(connectors.BufferPolicy.COALESCE)
+    chunks = list(_slow(buffer.output(), 0.01))
+    statistics = buffer.statistics()
+    assert sum(chunks, []) == list(range(40))
+    assert statistics.coalesced > 0
+    assert statistics.consumed + statistics.coalesced == statistics.produced == 40
+    # custom coalescing function and buffering with the stream's method
+    stream = connectors.Stream.chunks(list(range(40)), 1).buffered(capacity=1,
+                                                                   policy=connectors.BufferPolicy.COALESCE,
+                                                                   coalesce=lambda a, b: [a[0] + b[0]])
+    assert sum(c[0] for c in _slow(stream, 0.01)) == sum(range(40))
+    with pytest.raises(ValueError):
+        connectors.BufferedStream((), capacity=0)
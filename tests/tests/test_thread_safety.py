@@ -0,0 +1,111 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the thread-safe mode, in which the connectors can be called from multiple threads"""
+
+import concurrent.futures
+import functools
+import time
+import connectors
+from . import helper
+from . import testclasses
+
+
+def test_single_flight():
+    """Tests if concurrent requests for the same result share one computation"""
+    call_logger = helper.CallLogger()
+    t = testclasses.Worker(work=functools.partial(time.sleep, 0.3), call_logger=call_logger)
+    t.get_value.set_caching(False)
+    t.set_value(1)
+    call_logger.clear()
+    connectors.set_thread_safety(True)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: t.get_value(), range(4)))
+    finally:
+        connectors.set_thread_safety(False)
+    assert results == [1, 1, 1, 1]
+    assert call_logger.get_number_of_calls() == 1
+    assert t.get_value() == 1     # without a concurrent request, the result is computed again, because caching is disabled
+    assert call_logger.get_number_of_calls() == 2
+
+
+def test_concurrent_updates():
+    """Tests if a processing network stays consistent, when it is changed and
+    requested from multiple threads"""
+    source = testclasses.Simple()
+    branch1 = testclasses.Simple().set_value.connect(source.get_value)
+    branch2 = testclasses.Simple().set_value.connect(source.get_value)
+    sink = testclasses.MultipleInputs().set_value1.connect(branch1.get_value).set_value2.connect(branch2.get_value)
+    sink.get_values.set_executor(connectors.executor(threads=2))
+
+    def work(thread):
+        for i in range(50):
+            source.set_value((thread, i))
+            value1, value2 = sink.get_values()
+            assert value1 == value2
+
+    connectors.set_thread_safety(True)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+            for f in [pool.submit(work, t) for t in range(4)]:
+                f.result()
+    finally:
+        connectors.set_thread_safety(False)
+    source.set_value(None)
+    assert sink.get_values() == (None, None)
+
+
+def test_unrelated_networks():
+    """Tests if requests for unrelated processing networks are computed in parallel"""
+    sources = [testclasses.Simple().set_value(i) for i in range(2)]
+    workers = [testclasses.Worker(work=functools.partial(time.sleep, 0.3)).set_value.connect(s.get_value)
+               for s in sources]
+    intervals = []
+
+    def work(worker):
+        start = time.perf_counter()
+        result = worker.get_value()
+        intervals.append((start, time.perf_counter()))
+        return result
+
+    connectors.set_thread_safety(True)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(work, workers))
+    finally:
+        connectors.set_thread_safety(False)
+    assert results == [0, 1]
+    starts, ends = zip(*intervals)
+    assert max(starts) < min(ends)          # the durations of the requests overlap
+    assert max(ends) - min(starts) < 0.55
+
+
+def test_connected_networks():
+    """Tests if the requests for a processing network wait for each other"""
+    source = testclasses.Simple().set_value(1)
+    sinks = [testclasses.Worker(work=functools.partial(time.sleep, 0.2)).set_value.connect(source.get_value)
+             for _ in range(2)]
+    connectors.set_thread_safety(True)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+            start = time.perf_counter()
+            results = list(pool.map(lambda s: s.get_value(), sinks))
+            duration = time.perf_counter() - start
+    finally:
+        connectors.set_thread_safety(False)
+    assert results == [1, 1]
+    assert duration >= 0.4      # the sinks share the source, so their requests are serialized
@@ -0,0 +1,70 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the transactions, that defer the propagation of value changes"""
+
+import connectors
+from . import helper
+from . import testclasses
+
+
+def test_transaction():
+    """Tests if the value changes inside a transaction are propagated only once"""
+    call_logger = helper.CallLogger()
+    source = testclasses.MultipleInputs(call_logger)
+    sink = testclasses.NonLazyInputs(call_logger).set_value.connect(source.get_values)
+    call_logger.set_name_mapping(source=source, sink=sink)
+    call_logger.clear()
+    # without a transaction, the non-lazy input is executed after every change
+    source.set_value1(1)
+    source.set_value2(2)
+    call_logger.compare([(source, "set_value1", [1], source), (source, "get_values", [], (1, None)),
+                         (sink, "set_value", [(1, None)], sink),
+                         (source, "set_value2", [2], source), (source, "get_values", [], (1, 2)),
+                         (sink, "set_value", [(1, 2)], sink)]).clear()
+    # inside a transaction, the non-lazy input is executed once at the end
+    with connectors.transaction():
+        source.set_value1(3)
+        source.set_value2(4)
+        assert call_logger.get_number_of_calls() == 2
+    call_logger.compare([(source, "set_value1", [3], source), (source, "set_value2", [4], source),
+                         (source, "get_values", [], (3, 4)), (sink, "set_value", [(3, 4)], sink)]).clear()
+    # nested transactions propagate the changes at the end of the outermost transaction
+    with connectors.transaction():
+        with connectors.transaction():
+            source.set_value1(5)
+        source.set_value2(6)
+    call_logger.compare([(source, "set_value1", [5], source), (source, "set_value2", [6], source),
+                         (source, "get_values", [], (5, 6)), (sink, "set_value", [(5, 6)], sink)]).clear()
+
+
+def test_chain():
+    """Tests if a processing chain is up to date after a transaction"""
+    call_logger = helper.CallLogger()
+    t1 = testclasses.Simple(call_logger)
+    t2 = testclasses.Simple(call_logger).set_value.connect(t1.get_value)
+    t3 = testclasses.Simple(call_logger).set_value.connect(t2.get_value)
+    call_logger.set_name_mapping(t1=t1, t2=t2, t3=t3)
+    assert t3.get_value() is None
+    call_logger.clear()
+    with connectors.transaction():
+        t1.set_value(1)
+        t2.set_value(2)
+        assert t2.get_value() == 2  # the instance, whose setter has been called, is updated
+        assert t3.get_value() is None   # the propagation is deferred
+    assert t3.get_value() == 1
+    t1.set_value(3)
+    assert t3.get_value() == 3
@@ -17,6 +17,8 @@
 """Contains classes with connectors, with which their functionality can be tested"""
 
 from ._constructor_method_call import *
+from ._coroutines import *
+from ._disk_cache import *
 from ._input_conditions import *
 from ._macro import *
 from ._multiinput import *
@@ -24,5 +26,8 @@ from ._multioutput import *
 from ._multiple_inputs import *
 from ._multiple_outputs import *
 from ._non_lazy_inputs import *
+from ._process import *
 from ._simple import *
+from ._streaming import *
 from ._sleep import *
+from ._workload import *
@@ -0,0 +1,115 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains test classes, whose connectors replace coroutine methods"""
+
+import asyncio
+import connectors
+from ._baseclass import BaseTestClass
+
+__all__ = ("AsyncSimple", "AsyncMultiInput", "AsyncMultiOutput")
+
+
+class AsyncSimple(BaseTestClass):
+    """Like :class:`Simple`, but with ``async def`` methods, that simulate I/O with a delay."""
+
+    def __init__(self, delay=0.0, call_logger=None):
+        """
+        :param delay: the time in seconds, that the getter sleeps
+        :param call_logger: a :class:`CallLogger` instance
+        """
+        self.__delay = delay
+        BaseTestClass.__init__(self, call_logger)
+
+    def _initialize(self):
+        """is called in the super class's constructor"""
+        self.__value = None
+
+    @connectors.Input("get_value")
+    async def set_value(self, value):
+        """sets the internal value"""
+        await asyncio.sleep(0)
+        self._register_call("set_value", [value], self)
+        self.__value = value
+        return self
+
+    @connectors.Output()
+    async def get_value(self):
+        """returns the internal value after a delay"""
+        await asyncio.sleep(self.__delay)
+        self._register_call("get_value", [], self.__value)
+        return self.__value
+
+
+class AsyncMultiInput(BaseTestClass):
+    """Features a multi-input connector with ``async def`` methods, that returns the sum of its values."""
+
+    def _initialize(self):
+        """is called in the super class's constructor"""
+        self.__data = connectors.MultiInputData()
+
+    @connectors.MultiInput("get_sum")
+    async def add_value(self, value):
+        """adds a value to the sum"""
+        await asyncio.sleep(0)
+        data_id = self.__data.add(value)
+        self._register_call("add_value", [value], data_id)
+        return data_id
+
+    @add_value.remove
+    async def remove_value(self, data_id):
+        """removes a value from the sum"""
+        await asyncio.sleep(0)
+        self._register_call("remove_value", [data_id], self)
+        del self.__data[data_id]
+        return self
+
+    @connectors.Output()
+    async def get_sum(self):
+        """returns the sum of the values"""
+        await asyncio.sleep(0)
+        result = sum(self.__data.values())
+        self._register_call("get_sum", [], result)
+        return result
+
+
+class AsyncMultiOutput(BaseTestClass):
+    """Features a multi-output connector with an ``async def`` method, that
+    returns the product of a value and the key."""
+
+    def _initialize(self):
+        """is called in the super class's constructor"""
+        self.__value = 0
+
+    @connectors.Input("get_value")
+    def set_value(self, value):
+        """Sets the value"""
+        self._register_call("set_value", [value], self)
+        self.__value = value
+        return self
+
+    @connectors.MultiOutput()
+    async def get_value(self, key):
+        """Returns the product of the value and the key"""
+        await asyncio.sleep(0)
+        result = self.__value * key
+        self._register_call("get_value", [key], result)
+        return result
+
+    @get_value.keys
+    def keys(self):     # pylint: disable=no-self-use # the keys method must be a method of the class
+        """Returns a couple of example keys for the get_value method"""
+        return (2, 3)
@@ -0,0 +1,45 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains a test class for caching results on the disk"""
+
+import connectors
+
+__all__ = ("DiskCached",)
+
+
+class DiskCached:
+    """Doubles its input value and counts the calls of its output connector in
+    a class attribute, so that the count is not part of the instance's state,
+    which is hashed by the disk cache.
+    """
+
+    calls = 0
+
+    def __init__(self):
+        self.__value = None
+
+    @connectors.Input("get_value")
+    def set_value(self, value):
+        """sets the internal value"""
+        self.__value = value
+        return self
+
+    @connectors.Output()
+    def get_value(self):
+        """returns the internal value multiplied with two"""
+        DiskCached.calls += 1
+        return self.__value * 2
@@ -20,7 +20,7 @@ import connectors
 from ._baseclass import BaseTestClass
 
 __all__ = ("ConditionalInputAnnouncement", "ConditionalInputNotification",
-           "ConditionalMultiInputAnnouncement", "ConditionalMultiInputNotification")
+           "ConditionalMultiInputAnnouncement", "ConditionalMultiInputNotification", "AnnouncementCounter")
 
 
 class ConditionalInputAnnouncement(BaseTestClass):
@@ -145,3 +145,27 @@ class ConditionalMultiInputNotification(BaseTestClass):
         result = tuple(self.__data.values())
         self._register_call(method_name="get_values", parameters=[], return_value=result)
         return result
+
+
+class AnnouncementCounter(BaseTestClass):
+    """Features an input connector, whose announce condition counts, how often an announcement has reached it"""
+
+    def _initialize(self):                      # pylint: disable=missing-docstring
+        self.__value = None
+        self.announcements = 0
+
+    @connectors.Input("get_value")
+    def set_value(self, value):                 # pylint: disable=missing-docstring
+        self._register_call(method_name="set_value", parameters=[value], return_value=self)
+        self.__value = value
+        return self
+
+    @connectors.Output()
+    def get_value(self):                        # pylint: disable=missing-docstring
+        self._register_call(method_name="get_value", parameters=[], return_value=self.__value)
+        return self.__value
+
+    @set_value.announce_condition
+    def __condition(self):                      # pylint: disable=missing-docstring,unused-private-member
+        self.announcements += 1
+        return True
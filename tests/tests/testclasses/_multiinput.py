@@ -19,7 +19,7 @@
 import connectors
 from ._baseclass import BaseTestClass
 
-__all__ = ("NonReplacingMultiInput", "ReplacingMultiInput")
+__all__ = ("NonReplacingMultiInput", "ReplacingMultiInput", "FailingMultiInput")
 
 
 class NonReplacingMultiInput(BaseTestClass):
@@ -85,3 +85,35 @@ class ReplacingMultiInput(BaseTestClass):
         result = tuple(self.__data.values())
         self._register_call("get_values", [], result)
         return result
+
+
+class FailingMultiInput(BaseTestClass):
+    """Features a multi-input connector, whose replace method fails for negative values"""
+
+    def _initialize(self):
+        """is called in the super class's constructor"""
+        self.__data = connectors.MultiInputData()
+
+    @connectors.MultiInput("get_values")
+    def add_value(self, value):
+        """adds a value to the output list"""
+        return self.__data.add(value)
+
+    @add_value.remove
+    def remove_value(self, data_id):
+        """removes a value from the output list"""
+        del self.__data[data_id]
+        return self
+
+    @add_value.replace
+    def replace_value(self, data_id, value):
+        """replaces a value in the output list or raises a ValueError, if the value is negative"""
+        if value < 0:
+            raise ValueError("negative values are not supported")
+        self.__data[data_id] = value
+        return data_id
+
+    @connectors.Output()
+    def get_values(self):
+        """returns the output list"""
+        return tuple(self.__data.values())
@@ -19,7 +19,8 @@
 import connectors
 from ._baseclass import BaseTestClass
 
-__all__ = ("MultiOutputWithKeys", "MultiOutputWithoutKeys", "MultiOutputWithVolatileKeys")
+__all__ = ("MultiOutputWithKeys", "MultiOutputWithoutKeys", "MultiOutputWithVolatileKeys", "MultiOutputWithCacheLimits",
+           "MultiOutputWithBatch", "MultiOutputWithVersions")
 
 
 class MultiOutputWithKeys(BaseTestClass):
@@ -115,3 +116,119 @@ class MultiOutputWithVolatileKeys(BaseTestClass):
         self._register_call("keys", [])
         for k in self.__keys:
             yield k
+
+
+class MultiOutputWithCacheLimits(BaseTestClass):
+    """Features a multi-output connector, whose cache is limited to two results."""
+
+    def _initialize(self):
+        """is called in the super class's constructor"""
+        self.__value = 0
+
+    @connectors.Input("get_value")
+    def set_value(self, value):
+        """Sets the value"""
+        self._register_call("set_value", [value], self)
+        self.__value = value
+        return self
+
+    @connectors.MultiOutput(max_entries=2, eviction_policy=connectors.EvictionPolicy.LFU)
+    def get_value(self, key):
+        """Returns the product of the value and the key"""
+        result = self.__value * key
+        self._register_call("get_value", [key], result)
+        return result
+
+
+class MultiOutputWithBatch(BaseTestClass):
+    """Features a multi-output connector with a batch method."""
+
+    def _initialize(self):
+        """is called in the super class's constructor"""
+        self.__value = 0
+        self.__keys = (2, 3, 5)
+        self.__as_mapping = True
+
+    @connectors.Input("get_value")
+    def set_value(self, value):
+        """Sets the value"""
+        self._register_call("set_value", [value], self)
+        self.__value = value
+        return self
+
+    @connectors.Input("get_value")
+    def set_keys(self, keys):
+        """Changes the return value of the keys method"""
+        self._register_call("set_keys", [keys], self)
+        self.__keys = keys
+        return self
+
+    def set_as_mapping(self, as_mapping):
+        """Specifies, if the batch method returns a mapping or a sequence"""
+        self.__as_mapping = as_mapping
+        return self
+
+    @connectors.MultiOutput()
+    def get_value(self, key):
+        """Returns the product of the value and the key"""
+        result = self.__value * key
+        self._register_call("get_value", [key], result)
+        return result
+
+    @get_value.keys
+    def keys(self):
+        """Returns a couple of example keys for the get_value method"""
+        return self.__keys
+
+    @get_value.batch
+    def get_values(self, keys):
+        """Returns the products of the value and all the given keys"""
+        if self.__as_mapping:
+            result = {k: self.__value * k for k in keys}
+        else:
+            result = [self.__value * k for k in keys]
+        self._register_call("get_values", [tuple(keys)], result)
+        return result
+
+
+class MultiOutputWithVersions(BaseTestClass):
+    """Features a multi-output connector with a version method."""
+
+    def _initialize(self):
+        """is called in the super class's constructor"""
+        self.__values = {}
+        self.__versions = {}
+
+    @connectors.Input("get_value")
+    def set_item(self, item):
+        """Sets the value for a key, which is given as a tuple (key, value)"""
+        self._register_call("set_item", [item], self)
+        key, value = item
+        self.__values[key] = value
+        self.__versions[key] = self.__versions.get(key, 0) + 1
+        return self
+
+    @connectors.Input("get_value")
+    def delete_item(self, key):
+        """Removes the value for the given key"""
+        self._register_call("delete_item", [key], self)
+        del self.__values[key]
+        del self.__versions[key]
+        return self
+
+    @connectors.MultiOutput()
+    def get_value(self, key):
+        """Returns the value for the given key"""
+        result = self.__values[key]
+        self._register_call("get_value", [key], result)
+        return result
+
+    @get_value.keys
+    def keys(self):
+        """Returns the keys of the values"""
+        return tuple(self.__values)
+
+    @get_value.version
+    def version(self, key):
+        """Returns the number of changes of the value for the given key"""
+        return self.__versions[key]
@@ -0,0 +1,69 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains test classes for the execution of methods in separate processes"""
+
+import os
+import connectors
+from ._baseclass import BaseTestClass
+
+__all__ = ("CallCounter", "Doubler")
+
+
+class CallCounter(BaseTestClass):
+    """Counts the calls of its output connector in its own state, which allows to
+    test, whether that state is kept resident in a separate process.
+    """
+
+    def _initialize(self):
+        """is called in the super class's constructor"""
+        self.__value = None
+        self.__calls = 0
+
+    @connectors.Input("get_value")
+    def set_value(self, value):
+        """sets the internal value"""
+        self._register_call("set_value", [value], self)
+        self.__value = value
+        return self
+
+    @connectors.Output(caching=False, parallelization=connectors.Parallelization.PROCESS)
+    def get_value(self):
+        """returns the internal value, the number of calls of this method and the process ID"""
+        self.__calls += 1
+        return self.__value, self.__calls, os.getpid()
+
+
+class Doubler(BaseTestClass):
+    """Doubles its input value in a separate process, which allows to test the
+    transport of large values to and from the worker processes.
+    """
+
+    def _initialize(self):
+        """is called in the super class's constructor"""
+        self.__value = None
+
+    @connectors.Input("get_value")
+    def set_value(self, value):
+        """sets the internal value"""
+        self._register_call("set_value", [value], self)
+        self.__value = value
+        return self
+
+    @connectors.Output(parallelization=connectors.Parallelization.PROCESS)
+    def get_value(self):
+        """returns the internal value multiplied with two"""
+        return self.__value * 2
@@ -20,7 +20,7 @@ import time
 import connectors
 from ._baseclass import BaseTestClass
 
-__all__ = ("SleepInOutput", "SleepInInput", "SleepInMultiInput", "SleepInMultiOutput")
+__all__ = ("SleepInOutput", "SleepInInput", "SleepInMultiInput", "SleepInMultiOutput", "SleepInReplace")
 
 
 class SleepInOutput(BaseTestClass):
@@ -117,3 +117,36 @@ class SleepInMultiOutput(BaseTestClass):
         result = self.__value * key
         self._register_call(method_name="get_value", parameters=[key], return_value=result)
         return result
+
+
+class SleepInReplace(BaseTestClass):
+    """Features a multi-input connector, that sleeps for a second, when replacing a value."""
+
+    def _initialize(self):
+        """is called in the super class's constructor"""
+        self.__data = connectors.MultiInputData()
+
+    @connectors.MultiInput("get_values", parallelization=connectors.Parallelization.THREAD)
+    def add_value(self, value):                 # pylint: disable=missing-docstring
+        data_id = self.__data.add(value)
+        self._register_call(method_name="add_value", parameters=[value], return_value=data_id)
+        return data_id
+
+    @add_value.remove
+    def remove_value(self, data_id):            # pylint: disable=missing-docstring
+        self._register_call(method_name="remove_value", parameters=[data_id], return_value=self)
+        del self.__data[data_id]
+        return self
+
+    @add_value.replace
+    def replace_value(self, data_id, value):    # pylint: disable=missing-docstring
+        time.sleep(1.0)
+        self._register_call(method_name="replace_value", parameters=[data_id, value], return_value=data_id)
+        self.__data[data_id] = value
+        return data_id
+
+    @connectors.Output()
+    def get_values(self):                       # pylint: disable=missing-docstring
+        result = tuple(self.__data.values())
+        self._register_call(method_name="get_values", parameters=[], return_value=result)
+        return result
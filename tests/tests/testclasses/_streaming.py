@@ -0,0 +1,150 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains test classes with streaming output connectors"""
+
+import time
+import connectors
+from ._baseclass import BaseTestClass
+
+__all__ = ("StreamSource", "StreamGain", "PrefetchingStreamGain", "StreamSum")
+
+
+class StreamSource(BaseTestClass):
+    """Splits its data into chunks, which are passed on as a stream."""
+
+    def __init__(self, data=(), chunk_size=1, log=None, call_logger=None):
+        """
+        :param data: a sliceable sequence
+        :param chunk_size: the number of elements per chunk
+        :param log: a list, to which a string is appended for every produced chunk, or None
+        :param call_logger: a :class:`CallLogger` instance
+        """
+        self.__data = data
+        self.__chunk_size = chunk_size
+        self.__log = log
+        BaseTestClass.__init__(self, call_logger)
+
+    @connectors.Input("get_chunks")
+    def set_data(self, data):
+        """Sets the data"""
+        self._register_call(method_name="set_data", parameters=[data], return_value=self)
+        self.__data = data
+        return self
+
+    @connectors.Input("get_chunks")
+    def set_chunk_size(self, chunk_size):
+        """Sets the number of elements per chunk"""
+        self._register_call(method_name="set_chunk_size", parameters=[chunk_size], return_value=self)
+        self.__chunk_size = chunk_size
+        return self
+
+    @connectors.Output(streaming=True)
+    def get_chunks(self):
+        """Yields the chunks of the data"""
+        self._register_call(method_name="get_chunks")
+        for start in range(0, len(self.__data), self.__chunk_size):
+            if self.__log is not None:
+                self.__log.append("produce")
+            yield self.__data[start:start + self.__chunk_size]
+
+
+class StreamGain(BaseTestClass):
+    """Multiplies the elements of the chunks of a stream with a gain factor."""
+
+    def __init__(self, gain=1, delay=0.0, call_logger=None):
+        """
+        :param gain: the factor
+        :param delay: the time in seconds, that the processing of a chunk takes
+        :param call_logger: a :class:`CallLogger` instance
+        """
+        self.__gain = gain
+        self.__delay = delay
+        BaseTestClass.__init__(self, call_logger)
+
+    def _initialize(self):
+        """is called in the super class's constructor"""
+        self.__stream = ()
+
+    @connectors.Input("get_output")
+    def set_input(self, stream):
+        """Sets the input stream"""
+        self._register_call(method_name="set_input", parameters=[stream], return_value=self)
+        self.__stream = stream
+        return self
+
+    @connectors.Input("get_output")
+    def set_gain(self, gain):
+        """Sets the gain factor"""
+        self._register_call(method_name="set_gain", parameters=[gain], return_value=self)
+        self.__gain = gain
+        return self
+
+    @connectors.Output(streaming=True)
+    def get_output(self):
+        """Yields the amplified chunks"""
+        self._register_call(method_name="get_output")
+        return self._amplify()
+
+    def _amplify(self):
+        """A generator, that amplifies the chunks of the input stream"""
+        for chunk in self.__stream:
+            time.sleep(self.__delay)
+            yield [self.__gain * e for e in chunk]
+
+
+class PrefetchingStreamGain(StreamGain):
+    """Like :class:`StreamGain`, but the chunks are amplified in a separate thread ahead of the consumer."""
+
+    @connectors.Output(streaming=True, prefetch=1)
+    def get_output(self):
+        """Yields the amplified chunks"""
+        self._register_call(method_name="get_output")
+        return self._amplify()
+
+
+class StreamSum(BaseTestClass):
+    """Consumes a stream and returns the sum of all its elements."""
+
+    def __init__(self, log=None, call_logger=None):
+        """
+        :param log: a list, to which a string is appended for every consumed chunk, or None
+        :param call_logger: a :class:`CallLogger` instance
+        """
+        self.__log = log
+        BaseTestClass.__init__(self, call_logger)
+
+    def _initialize(self):
+        """is called in the super class's constructor"""
+        self.__stream = ()
+
+    @connectors.Input("get_sum")
+    def set_input(self, stream):
+        """Sets the input stream"""
+        self._register_call(method_name="set_input", parameters=[stream], return_value=self)
+        self.__stream = stream
+        return self
+
+    @connectors.Output()
+    def get_sum(self):
+        """Returns the sum of the elements of all chunks"""
+        result = 0
+        for chunk in self.__stream:
+            if self.__log is not None:
+                self.__log.append("consume")
+            result += sum(chunk)
+        self._register_call(method_name="get_sum", parameters=[], return_value=result)
+        return result
@@ -0,0 +1,206 @@
+# This file is a part of the "Connectors" package
+# Copyright (C) 2017-2022 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains test classes with a configurable workload, from which synthetic
+processing networks are built (see :func:`tests.helper.generate_network`)
+"""
+
+import connectors
+from ._baseclass import BaseTestClass
+
+__all__ = ("Worker", "ConditionalWorker", "MultiInputWorker", "MultiOutputWorker", "MacroWorker")
+
+
+def _no_work():
+    """The default workload, that does nothing"""
+
+
+class Worker(BaseTestClass):
+    """Passes its input value to its output after executing a workload."""
+
+    def __init__(self, work=_no_work, call_logger=None):
+        """
+        :param work: a picklable function without parameters, that is executed in the getter
+        :param call_logger: a :class:`CallLogger` instance
+        """
+        self.__work = work
+        BaseTestClass.__init__(self, call_logger)
+
+    def _initialize(self):
+        """is called in the super class's constructor"""
+        self.__value = 0
+
+    @connectors.Input("get_value")
+    def set_value(self, value):
+        """Sets the value"""
+        self._register_call(method_name="set_value", parameters=[value], return_value=self)
+        self.__value = value
+        return self
+
+    @connectors.Output()
+    def get_value(self):
+        """Executes the workload and returns the value"""
+        self.__work()
+        self._register_call(method_name="get_value", parameters=[], return_value=self.__value)
+        return self.__value
+
+
+class ConditionalWorker(BaseTestClass):
+    """Similar to :class:`Worker`, but with conditions for the announcement and
+    the notification of value changes, which are True unless the ``condition``
+    attribute is changed.
+    """
+
+    def __init__(self, work=_no_work, call_logger=None):
+        """
+        :param work: a picklable function without parameters, that is executed in the getter
+        :param call_logger: a :class:`CallLogger` instance
+        """
+        self.__work = work
+        BaseTestClass.__init__(self, call_logger)
+
+    def _initialize(self):
+        """is called in the super class's constructor"""
+        self.__value = 0
+        self.condition = True
+
+    @connectors.Input("get_value")
+    def set_value(self, value):
+        """Sets the value"""
+        self._register_call(method_name="set_value", parameters=[value], return_value=self)
+        self.__value = value
+        return self
+
+    @set_value.announce_condition
+    def __announce_condition(self):         # pylint: disable=missing-docstring,unused-private-member
+        return self.condition
+
+    @set_value.notify_condition
+    def __notify_condition(self, value):    # pylint: disable=missing-docstring,unused-argument,unused-private-member
+        return self.condition
+
+    @connectors.Output()
+    def get_value(self):
+        """Executes the workload and returns the value"""
+        self.__work()
+        self._register_call(method_name="get_value", parameters=[], return_value=self.__value)
+        return self.__value
+
+
+class MultiInputWorker(BaseTestClass):
+    """Returns the sum of the values of its multi-input connector after executing a workload."""
+
+    def __init__(self, work=_no_work, call_logger=None):
+        """
+        :param work: a picklable function without parameters, that is executed in the getter
+        :param call_logger: a :class:`CallLogger` instance
+        """
+        self.__work = work
+        BaseTestClass.__init__(self, call_logger)
+
+    def _initialize(self):
+        """is called in the super class's constructor"""
+        self.__data = connectors.MultiInputData()
+
+    @connectors.MultiInput("get_value")
+    def add_value(self, value):
+        """adds a value to the sum"""
+        data_id = self.__data.add(value)
+        self._register_call(method_name="add_value", parameters=[value], return_value=data_id)
+        return data_id
+
+    @add_value.remove
+    def remove_value(self, data_id):
+        """removes a value from the sum"""
+        self._register_call(method_name="remove_value", parameters=[data_id], return_value=self)
+        del self.__data[data_id]
+        return self
+
+    @add_value.replace
+    def replace_value(self, data_id, value):
+        """replaces a value in the sum"""
+        self._register_call(method_name="replace_value", parameters=[data_id, value], return_value=data_id)
+        self.__data[data_id] = value
+        return data_id
+
+    @connectors.Output()
+    def get_value(self):
+        """Executes the workload and returns the sum of the values"""
+        self.__work()
+        result = sum(self.__data.values())
+        self._register_call(method_name="get_value", parameters=[], return_value=result)
+        return result
+
+
+class MultiOutputWorker(BaseTestClass):
+    """Returns the sum of its input value and the key from its multi-output connector
+    after executing a workload.
+    """
+
+    def __init__(self, work=_no_work, keys=2, call_logger=None):
+        """
+        :param work: a picklable function without parameters, that is executed in the getter
+        :param keys: the number of keys of the multi-output connector
+        :param call_logger: a :class:`CallLogger` instance
+        """
+        self.__work = work
+        self.__keys = tuple(range(keys))
+        BaseTestClass.__init__(self, call_logger)
+
+    def _initialize(self):
+        """is called in the super class's constructor"""
+        self.__value = 0
+
+    @connectors.Input("get_value")
+    def set_value(self, value):
+        """Sets the value"""
+        self._register_call(method_name="set_value", parameters=[value], return_value=self)
+        self.__value = value
+        return self
+
+    @connectors.MultiOutput()
+    def get_value(self, key):
+        """Executes the workload and returns the sum of the value and the key"""
+        self.__work()
+        result = self.__value + key
+        self._register_call(method_name="get_value", parameters=[key], return_value=result)
+        return result
+
+    @get_value.keys
+    def keys(self):
+        """Returns the keys of the multi-output connector"""
+        return self.__keys
+
+
+class MacroWorker:
+    """Exports a chain of :class:`Worker` instances through macro connectors."""
+
+    def __init__(self, work=_no_work, length=2):
+        """
+        :param work: a picklable function without parameters, that is executed in the getters
+        :param length: the number of :class:`Worker` instances in the chain
+        """
+        self.__workers = [Worker(work)]
+        for _ in range(length - 1):
+            self.__workers.append(Worker(work).set_value.connect(self.__workers[-1].get_value))
+
+    @connectors.MacroInput()
+    def set_value(self, *_):    # pylint: disable=missing-docstring
+        yield self.__workers[0].set_value
+
+    @connectors.MacroOutput()
+    def get_value(self):        # pylint: disable=missing-docstring
+        return self.__workers[-1].get_value